@@ -100,7 +100,14 @@ async def async_unload_entry(hass, entry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+
+        # Write any coalesced changes before a reload reads storage again
+        storage_manager: KidsChoresStorageManager = entry_data["storage_manager"]
+        await storage_manager.async_flush()
+        LOGGER.debug(
+            "KidsChores storage stats on unload: %s", storage_manager.save_stats
+        )
 
         # Await service unloading
         await async_unload_services(hass)
@@ -0,0 +1,129 @@
+# File: approval_queue.py
+"""Pending approval queue for the KidsChores integration.
+
+Pending chore and reward approvals are kept in FIFO order and indexed by
+(kid_id, chore_id) or (kid_id, reward_id), so membership checks and removals
+do not scan every pending approval. In storage the queue is the same list of
+approval dicts used by earlier versions.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import count
+from typing import Optional
+
+
+class ApprovalQueue:
+    """FIFO queue of pending approvals keyed by (kid_id, item_id).
+
+    A kid may have several pending approvals for the same item (e.g. chores that
+    allow multiple claims per day); they share one key.
+    """
+
+    def __init__(self, item_key: str, approvals: Optional[Iterable[dict]] = None):
+        """Initialize the queue.
+
+        Args:
+            item_key (str): Approval field holding the item ID ('chore_id' or
+                'reward_id').
+            approvals (Iterable[dict], optional): Stored approvals, oldest first.
+
+        """
+        self._item_key = item_key
+        self._seq = count()
+        self._entries: dict[int, dict] = {}  # Insertion ordered => FIFO.
+        self._by_key: dict[tuple[str, str], list[int]] = {}
+        for approval in approvals or []:
+            self.append(approval)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate over approvals, oldest first."""
+        return iter(list(self._entries.values()))
+
+    def __len__(self) -> int:
+        """Return the number of pending approvals."""
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        """Return True if any approval is pending."""
+        return bool(self._entries)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        """Return True if an approval is pending for (kid_id, item_id)."""
+        return key in self._by_key
+
+    def _key(self, approval: dict) -> tuple[str, str]:
+        return (approval["kid_id"], approval[self._item_key])
+
+    def append(self, approval: dict):
+        """Add an approval at the end of the queue."""
+        seq = next(self._seq)
+        self._entries[seq] = approval
+        self._by_key.setdefault(self._key(approval), []).append(seq)
+
+    def get(self, kid_id: str, item_id: str) -> list[dict]:
+        """Return the pending approvals for (kid_id, item_id), oldest first."""
+        return [self._entries[seq] for seq in self._by_key.get((kid_id, item_id), [])]
+
+    def remove(self, kid_id: str, item_id: str) -> int:
+        """Remove all pending approvals for (kid_id, item_id).
+
+        Returns:
+            int: The number of approvals removed.
+
+        """
+        seqs = self._by_key.pop((kid_id, item_id), [])
+        for seq in seqs:
+            del self._entries[seq]
+        return len(seqs)
+
+    def remove_oldest(self, kid_id: str, item_id: str) -> Optional[dict]:
+        """Remove the oldest pending approval for (kid_id, item_id).
+
+        Returns:
+            dict: The removed approval, or None if none was pending.
+
+        """
+        key = (kid_id, item_id)
+        seqs = self._by_key.get(key)
+        if not seqs:
+            return None
+        approval = self._entries.pop(seqs.pop(0))
+        if not seqs:
+            del self._by_key[key]
+        return approval
+
+    def remove_where(self, predicate: Callable[[dict], bool]) -> int:
+        """Remove every approval matching the predicate.
+
+        Returns:
+            int: The number of approvals removed.
+
+        """
+        removed = [
+            seq for seq, approval in self._entries.items() if predicate(approval)
+        ]
+        for seq in removed:
+            key = self._key(self._entries.pop(seq))
+            self._by_key[key].remove(seq)
+            if not self._by_key[key]:
+                del self._by_key[key]
+        return len(removed)
+
+    def clear(self):
+        """Remove all pending approvals."""
+        self._entries.clear()
+        self._by_key.clear()
+
+    def as_list(self) -> list[dict]:
+        """Return the approvals in their storage format, oldest first."""
+        return list(self._entries.values())
+
+
+def approvals_as_list(approvals) -> list[dict]:
+    """Return pending approvals in their storage format.
+
+    Accepts an ApprovalQueue or a plain list loaded from storage.
+    """
+    if isinstance(approvals, ApprovalQueue):
+        return approvals.as_list()
+    return approvals
@@ -0,0 +1,111 @@
+# File: auth_cache.py
+"""Authorization cache for the KidsChores integration.
+
+Every button press and service call checks whether the calling Home Assistant
+user may act for a kid, which meant an auth store lookup per call. The cache
+keeps, per user, whether the user is an admin and which kids the user is
+linked to, either as the kid or as a parent of the kid. Entries are dropped
+when Home Assistant reports the user updated or removed, and all entries are
+dropped when the coordinator changes which users are linked to kids.
+"""
+
+from homeassistant.auth import EVENT_USER_REMOVED, EVENT_USER_UPDATED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from typing import Any, NamedTuple, Optional
+
+
+class UserAuthorization(NamedTuple):
+    """What a Home Assistant user may act on."""
+
+    name: str
+    is_admin: bool
+    linked_kids: frozenset[str]  # Kids whose ha_user_id is the user
+    parent_kids: frozenset[str]  # Kids associated with the user as a parent
+
+
+class AuthorizationCache:
+    """Per-user authorization facts, cached until the user or links change."""
+
+    def __init__(self, hass: HomeAssistant, coordinator):
+        """Initialize an empty cache.
+
+        Args:
+            hass: Home Assistant core object.
+            coordinator: The KidsChores coordinator holding kids and parents.
+
+        """
+        self._hass = hass
+        self._coordinator = coordinator
+        self._users: dict[str, UserAuthorization] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @callback
+    def async_listen(self) -> CALLBACK_TYPE:
+        """Drop cached users when Home Assistant updates or removes them.
+
+        Returns:
+            CALLBACK_TYPE: Callback that stops listening.
+
+        """
+        unsubs = [
+            self._hass.bus.async_listen(event_type, self._async_user_changed)
+            for event_type in (EVENT_USER_UPDATED, EVENT_USER_REMOVED)
+        ]
+
+        @callback
+        def unsub_all() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return unsub_all
+
+    @callback
+    def _async_user_changed(self, event: Event) -> None:
+        self.invalidate(event.data.get("user_id"))
+
+    async def async_get(self, user_id: str) -> Optional[UserAuthorization]:
+        """Return the authorization facts of a user.
+
+        Args:
+            user_id (str): Home Assistant user ID.
+
+        Returns:
+            UserAuthorization: The user's facts, or None if the user does not
+                exist. Unknown users are not cached.
+
+        """
+        cached = self._users.get(user_id)
+        if cached is not None:
+            self._hits += 1
+            return cached
+
+        self._misses += 1
+        user = await self._hass.auth.async_get_user(user_id)
+        if not user:
+            return None
+
+        authorization = UserAuthorization(
+            name=user.name,
+            is_admin=user.is_admin,
+            linked_kids=self._coordinator.get_linked_kids(user_id),
+            parent_kids=self._coordinator.get_parent_kids(user_id),
+        )
+        self._users[user_id] = authorization
+        return authorization
+
+    @callback
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop one user's cached facts, or all of them if no user is given."""
+        if user_id is None:
+            self._users.clear()
+        else:
+            self._users.pop(user_id, None)
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Return cache size and hit statistics."""
+        return {
+            "users": len(self._users),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
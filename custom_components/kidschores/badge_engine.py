@@ -0,0 +1,99 @@
+# File: badge_engine.py
+"""Incremental badge evaluation for the KidsChores integration.
+
+Badge thresholds are kept sorted per threshold type, so when a kid's counter
+changes only the badges whose thresholds lie between the previous and the new
+value are considered. The sorted thresholds are rebuilt only when badge
+definitions change.
+"""
+
+from bisect import bisect_right
+from typing import Any
+
+from .const import BADGE_THRESHOLD_TYPE_CHORE_COUNT, BADGE_THRESHOLD_TYPE_POINTS
+
+# Kid counter each threshold type is measured against. Both only ever grow,
+# so a badge stays earned once its threshold is crossed.
+BADGE_METRICS = {
+    BADGE_THRESHOLD_TYPE_POINTS: "max_points_ever",
+    BADGE_THRESHOLD_TYPE_CHORE_COUNT: "completed_chores_total",
+}
+
+
+class BadgeEngine:
+    """Sorted badge thresholds and the last evaluated counters per kid."""
+
+    def __init__(self):
+        """Initialize an empty engine."""
+        self._thresholds: dict[str, list[float]] = {}
+        self._badge_ids: dict[str, list[str]] = {}
+        self._levels: dict[str, dict[str, float]] = {}
+
+    def rebuild(self, badges: dict[str, dict[str, Any]]):
+        """Sort badge thresholds per threshold type and forget kid counters.
+
+        Args:
+            badges (dict): Badge data keyed by internal_id.
+
+        """
+        by_type: dict[str, list[tuple[float, str]]] = {}
+        for badge_id, badge_info in badges.items():
+            threshold_type = badge_info.get(
+                "threshold_type", BADGE_THRESHOLD_TYPE_POINTS
+            )
+            if threshold_type not in BADGE_METRICS:
+                continue
+            by_type.setdefault(threshold_type, []).append(
+                (badge_info.get("threshold_value", 0), badge_id)
+            )
+
+        self._thresholds = {}
+        self._badge_ids = {}
+        for threshold_type, entries in by_type.items():
+            entries.sort(key=lambda entry: entry[0])
+            self._thresholds[threshold_type] = [value for value, _ in entries]
+            self._badge_ids[threshold_type] = [badge_id for _, badge_id in entries]
+        self._levels = {}
+
+    def earned(self, kid_id: str, kid_info: dict) -> list[str]:
+        """Return every badge the kid qualifies for and record its counters.
+
+        Used for a full recompute.
+        """
+        levels = self._levels[kid_id] = {}
+        earned = []
+        for threshold_type, metric in BADGE_METRICS.items():
+            value = kid_info.get(metric, 0)
+            levels[threshold_type] = value
+            thresholds = self._thresholds.get(threshold_type, [])
+            earned.extend(
+                self._badge_ids[threshold_type][: bisect_right(thresholds, value)]
+            )
+        return earned
+
+    def crossed(self, kid_id: str, kid_info: dict) -> list[str]:
+        """Return the badges whose thresholds the kid crossed since last check.
+
+        Only thresholds in (previous value, current value] are returned. A kid
+        that was never evaluated gets every badge it qualifies for.
+        """
+        levels = self._levels.get(kid_id)
+        if levels is None:
+            return self.earned(kid_id, kid_info)
+
+        crossed = []
+        for threshold_type, metric in BADGE_METRICS.items():
+            value = kid_info.get(metric, 0)
+            previous = levels.get(threshold_type, 0)
+            if value <= previous:
+                continue
+            levels[threshold_type] = value
+            thresholds = self._thresholds.get(threshold_type, [])
+            crossed.extend(
+                self._badge_ids[threshold_type][
+                    bisect_right(thresholds, previous) : bisect_right(
+                        thresholds, value
+                    )
+                ]
+            )
+        return crossed
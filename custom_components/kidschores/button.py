@@ -15,7 +15,6 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
@@ -24,8 +23,12 @@ from .const import (
     BUTTON_PENALTY_PREFIX,
     BUTTON_REWARD_PREFIX,
     CONF_POINTS_LABEL,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_PENALTIES,
     DATA_PENDING_CHORE_APPROVALS,
     DATA_PENDING_REWARD_APPROVALS,
+    DATA_REWARDS,
     DEFAULT_CHORE_APPROVE_ICON,
     DEFAULT_CHORE_CLAIM_ICON,
     DEFAULT_DISAPPROVE_ICON,
@@ -38,7 +41,8 @@ from .const import (
     ERROR_NOT_AUTHORIZED_ACTION_FMT,
     LOGGER,
 )
-from .coordinator import KidsChoresDataCoordinator
+from .coordinator import KidsChoresDataCoordinator, change_topics
+from .entity import KidsChoresEntity
 from .kc_helpers import is_user_authorized_for_global_action, is_user_authorized_for_kid
 
 
@@ -191,7 +195,7 @@ async def async_setup_entry(
 
 
 # ------------------ Chore Buttons ------------------
-class ClaimChoreButton(CoordinatorEntity, ButtonEntity):
+class ClaimChoreButton(KidsChoresEntity, ButtonEntity):
     """Button to claim a chore as done (set chore state=claimed)."""
 
     def __init__(
@@ -206,7 +210,9 @@ class ClaimChoreButton(CoordinatorEntity, ButtonEntity):
     ):
         """Initialize the claim chore button."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_CHORES, chore_id))
+        )
         self._entry = entry
         self._kid_id = kid_id
         self._kid_name = kid_name
@@ -218,48 +224,50 @@ class ClaimChoreButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self):
         """Handle the button press event."""
-        try:
-            user_id = self._context.user_id if self._context else None
-            if user_id and not await is_user_authorized_for_kid(
-                self.hass, user_id, self._kid_id
-            ):
-                raise HomeAssistantError(
-                    ERROR_NOT_AUTHORIZED_ACTION_FMT.format("claim chores")
-                )
-
-            user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
-            user_name = user_obj.name if user_obj else "Unknown"
-
-            self.coordinator.claim_chore(
-                kid_id=self._kid_id,
-                chore_id=self._chore_id,
-                user_name=user_name,
-            )
-            LOGGER.info(
-                "Chore '%s' claimed by kid '%s' (user: %s)",
-                self._chore_name,
-                self._kid_name,
-                user_name,
-            )
-            await self.coordinator.async_request_refresh()
-
-        except HomeAssistantError as e:
-            LOGGER.error(
-                "Authorization failed to claim chore '%s' for kid '%s': %s",
-                self._chore_name,
-                self._kid_name,
-                e,
-            )
-        except Exception as e:
-            LOGGER.error(
-                "Failed to claim chore '%s' for kid '%s': %s",
-                self._chore_name,
-                self._kid_name,
-                e,
-            )
+        async with self.coordinator.kid_locks.async_hold(self._kid_id):
+            try:
+                user_id = self._context.user_id if self._context else None
+                if user_id and not await is_user_authorized_for_kid(
+                    self.hass, user_id, self._kid_id
+                ):
+                    raise HomeAssistantError(
+                        ERROR_NOT_AUTHORIZED_ACTION_FMT.format("claim chores")
+                    )
+
+                user_obj = (
+                    await self.hass.auth.async_get_user(user_id) if user_id else None
+                )
+                user_name = user_obj.name if user_obj else "Unknown"
+
+                self.coordinator.claim_chore(
+                    kid_id=self._kid_id,
+                    chore_id=self._chore_id,
+                    user_name=user_name,
+                )
+                LOGGER.info(
+                    "Chore '%s' claimed by kid '%s' (user: %s)",
+                    self._chore_name,
+                    self._kid_name,
+                    user_name,
+                )
+
+            except HomeAssistantError as e:
+                LOGGER.error(
+                    "Authorization failed to claim chore '%s' for kid '%s': %s",
+                    self._chore_name,
+                    self._kid_name,
+                    e,
+                )
+            except Exception as e:
+                LOGGER.error(
+                    "Failed to claim chore '%s' for kid '%s': %s",
+                    self._chore_name,
+                    self._kid_name,
+                    e,
+                )
 
 
-class ApproveChoreButton(CoordinatorEntity, ButtonEntity):
+class ApproveChoreButton(KidsChoresEntity, ButtonEntity):
     """Button to approve a claimed chore for a kid (set chore state=approved or partial)."""
 
     def __init__(
@@ -274,7 +282,9 @@ class ApproveChoreButton(CoordinatorEntity, ButtonEntity):
     ):
         """Initialize the approve chore button."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_CHORES, chore_id))
+        )
         self._entry = entry
         self._kid_id = kid_id
         self._kid_name = kid_name
@@ -286,45 +296,45 @@ class ApproveChoreButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self):
         """Handle the button press event."""
-        try:
-            user_id = self._context.user_id if self._context else None
-            if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "approve_chore"
-            ):
-                raise HomeAssistantError(
-                    ERROR_NOT_AUTHORIZED_ACTION_FMT.format("approve chores")
-                )
-
-            parent_name = "ParentOrAdmin"  # You might want to fetch actual parent name
-            self.coordinator.approve_chore(
-                parent_name=parent_name,
-                kid_id=self._kid_id,
-                chore_id=self._chore_id,
-            )
-            LOGGER.info(
-                "Chore '%s' approved for kid '%s'",
-                self._chore_name,
-                self._kid_name,
-            )
-            await self.coordinator.async_request_refresh()
-
-        except HomeAssistantError as e:
-            LOGGER.error(
-                "Authorization failed to approve chore '%s' for kid '%s': %s",
-                self._chore_name,
-                self._kid_name,
-                e,
-            )
-        except Exception as e:
-            LOGGER.error(
-                "Failed to approve chore '%s' for kid '%s': %s",
-                self._chore_name,
-                self._kid_name,
-                e,
-            )
+        async with self.coordinator.kid_locks.async_hold(self._kid_id):
+            try:
+                user_id = self._context.user_id if self._context else None
+                if user_id and not await is_user_authorized_for_global_action(
+                    self.hass, user_id, "approve_chore"
+                ):
+                    raise HomeAssistantError(
+                        ERROR_NOT_AUTHORIZED_ACTION_FMT.format("approve chores")
+                    )
+
+                parent_name = "ParentOrAdmin"  # You might want to fetch actual parent name
+                self.coordinator.approve_chore(
+                    parent_name=parent_name,
+                    kid_id=self._kid_id,
+                    chore_id=self._chore_id,
+                )
+                LOGGER.info(
+                    "Chore '%s' approved for kid '%s'",
+                    self._chore_name,
+                    self._kid_name,
+                )
 
+            except HomeAssistantError as e:
+                LOGGER.error(
+                    "Authorization failed to approve chore '%s' for kid '%s': %s",
+                    self._chore_name,
+                    self._kid_name,
+                    e,
+                )
+            except Exception as e:
+                LOGGER.error(
+                    "Failed to approve chore '%s' for kid '%s': %s",
+                    self._chore_name,
+                    self._kid_name,
+                    e,
+                )
 
-class DisapproveChoreButton(CoordinatorEntity, ButtonEntity):
+
+class DisapproveChoreButton(KidsChoresEntity, ButtonEntity):
     """Button to disapprove a chore."""
 
     def __init__(
@@ -339,7 +349,9 @@ class DisapproveChoreButton(CoordinatorEntity, ButtonEntity):
     ):
         """Initialize the disapprove chore button."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_CHORES, chore_id))
+        )
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._chore_id = chore_id
@@ -355,59 +367,55 @@ class DisapproveChoreButton(CoordinatorEntity, ButtonEntity):
         """Return if the button should be available."""
         pending_approvals = self.coordinator._data.get(DATA_PENDING_CHORE_APPROVALS, [])
         # Check if there's a pending approval for this kid and chore
-        for approval in pending_approvals:
-            if (
-                approval["kid_id"] == self._kid_id
-                and approval["chore_id"] == self._chore_id
-            ):
-                return True
-        return False
+        return (self._kid_id, self._chore_id) in pending_approvals
 
     async def async_press(self):
         """Handle the button press event."""
-        try:
-            user_id = self._context.user_id if self._context else None
-            if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "disapprove_chore"
-            ):
-                raise HomeAssistantError(
-                    ERROR_NOT_AUTHORIZED_ACTION_FMT.format("disapprove chores")
-                )
-
-            user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
-            parent_name = user_obj.name if user_obj else "ParentOrAdmin"
-
-            self.coordinator.disapprove_chore(
-                parent_name=parent_name,
-                kid_id=self._kid_id,
-                chore_id=self._chore_id,
-            )
-            LOGGER.info(
-                "Chore '%s' disapproved for kid '%s' by parent '%s'",
-                self._chore_name,
-                self._kid_name,
-                parent_name,
-            )
-            await self.coordinator.async_request_refresh()
-
-        except HomeAssistantError as e:
-            LOGGER.error(
-                "Authorization failed to disapprove chore '%s' for kid '%s': %s",
-                self._chore_name,
-                self._kid_name,
-                e,
-            )
-        except Exception as e:
-            LOGGER.error(
-                "Failed to disapprove chore '%s' for kid '%s': %s",
-                self._chore_name,
-                self._kid_name,
-                e,
-            )
+        async with self.coordinator.kid_locks.async_hold(self._kid_id):
+            try:
+                user_id = self._context.user_id if self._context else None
+                if user_id and not await is_user_authorized_for_global_action(
+                    self.hass, user_id, "disapprove_chore"
+                ):
+                    raise HomeAssistantError(
+                        ERROR_NOT_AUTHORIZED_ACTION_FMT.format("disapprove chores")
+                    )
+
+                user_obj = (
+                    await self.hass.auth.async_get_user(user_id) if user_id else None
+                )
+                parent_name = user_obj.name if user_obj else "ParentOrAdmin"
+
+                self.coordinator.disapprove_chore(
+                    parent_name=parent_name,
+                    kid_id=self._kid_id,
+                    chore_id=self._chore_id,
+                )
+                LOGGER.info(
+                    "Chore '%s' disapproved for kid '%s' by parent '%s'",
+                    self._chore_name,
+                    self._kid_name,
+                    parent_name,
+                )
+
+            except HomeAssistantError as e:
+                LOGGER.error(
+                    "Authorization failed to disapprove chore '%s' for kid '%s': %s",
+                    self._chore_name,
+                    self._kid_name,
+                    e,
+                )
+            except Exception as e:
+                LOGGER.error(
+                    "Failed to disapprove chore '%s' for kid '%s': %s",
+                    self._chore_name,
+                    self._kid_name,
+                    e,
+                )
 
 
 # ------------------ Reward Buttons ------------------
-class RewardButton(CoordinatorEntity, ButtonEntity):
+class RewardButton(KidsChoresEntity, ButtonEntity):
     """Button to redeem a reward for a kid.
 
     Uses user-defined or default reward icon.
@@ -424,7 +432,9 @@ class RewardButton(CoordinatorEntity, ButtonEntity):
         icon: str,
     ):
         """Initialize the reward button."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_REWARDS, reward_id))
+        )
         self._entry = entry
         self._kid_id = kid_id
         self._kid_name = kid_name
@@ -438,48 +448,50 @@ class RewardButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self):
         """Handle the button press event."""
-        try:
-            user_id = self._context.user_id if self._context else None
-            if user_id and not await is_user_authorized_for_kid(
-                self.hass, user_id, self._kid_id
-            ):
-                raise HomeAssistantError(
-                    ERROR_NOT_AUTHORIZED_ACTION_FMT.format("redeem rewards")
-                )
-
-            user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
-            parent_name = user_obj.name if user_obj else "Unknown"
-
-            self.coordinator.redeem_reward(
-                parent_name=parent_name,
-                kid_id=self._kid_id,
-                reward_id=self._reward_id,
-            )
-            LOGGER.info(
-                "Reward '%s' redeemed for kid '%s' by parent '%s'",
-                self._reward_name,
-                self._kid_name,
-                parent_name,
-            )
-            await self.coordinator.async_request_refresh()
-
-        except HomeAssistantError as e:
-            LOGGER.error(
-                "Authorization failed to redeem reward '%s' for kid '%s': %s",
-                self._reward_name,
-                self._kid_name,
-                e,
-            )
-        except Exception as e:
-            LOGGER.error(
-                "Failed to redeem reward '%s' for kid '%s': %s",
-                self._reward_name,
-                self._kid_name,
-                e,
-            )
+        async with self.coordinator.kid_locks.async_hold(self._kid_id):
+            try:
+                user_id = self._context.user_id if self._context else None
+                if user_id and not await is_user_authorized_for_kid(
+                    self.hass, user_id, self._kid_id
+                ):
+                    raise HomeAssistantError(
+                        ERROR_NOT_AUTHORIZED_ACTION_FMT.format("redeem rewards")
+                    )
+
+                user_obj = (
+                    await self.hass.auth.async_get_user(user_id) if user_id else None
+                )
+                parent_name = user_obj.name if user_obj else "Unknown"
+
+                self.coordinator.redeem_reward(
+                    parent_name=parent_name,
+                    kid_id=self._kid_id,
+                    reward_id=self._reward_id,
+                )
+                LOGGER.info(
+                    "Reward '%s' redeemed for kid '%s' by parent '%s'",
+                    self._reward_name,
+                    self._kid_name,
+                    parent_name,
+                )
+
+            except HomeAssistantError as e:
+                LOGGER.error(
+                    "Authorization failed to redeem reward '%s' for kid '%s': %s",
+                    self._reward_name,
+                    self._kid_name,
+                    e,
+                )
+            except Exception as e:
+                LOGGER.error(
+                    "Failed to redeem reward '%s' for kid '%s': %s",
+                    self._reward_name,
+                    self._kid_name,
+                    e,
+                )
 
 
-class ApproveRewardButton(CoordinatorEntity, ButtonEntity):
+class ApproveRewardButton(KidsChoresEntity, ButtonEntity):
     """Button for parents to approve a reward claimed by a kid.
 
     Prevents unauthorized or premature reward approvals.
@@ -497,7 +509,9 @@ class ApproveRewardButton(CoordinatorEntity, ButtonEntity):
     ):
         """Initialize the approve reward button."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_REWARDS, reward_id))
+        )
         self._entry = entry
         self._kid_id = kid_id
         self._kid_name = kid_name
@@ -509,64 +523,66 @@ class ApproveRewardButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self):
         """Handle the button press event."""
-        try:
-            user_id = self._context.user_id if self._context else None
-            if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "approve_reward"
-            ):
-                raise HomeAssistantError(
-                    ERROR_NOT_AUTHORIZED_ACTION_FMT.format("approve rewards")
-                )
-
-            user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
-            parent_name = user_obj.name if user_obj else "ParentOrAdmin"
-
-            # Approve the reward
-            self.coordinator.approve_reward(
-                parent_name=parent_name,
-                kid_id=self._kid_id,
-                reward_id=self._reward_id,
-            )
+        async with self.coordinator.kid_locks.async_hold(self._kid_id):
+            try:
+                user_id = self._context.user_id if self._context else None
+                if user_id and not await is_user_authorized_for_global_action(
+                    self.hass, user_id, "approve_reward"
+                ):
+                    raise HomeAssistantError(
+                        ERROR_NOT_AUTHORIZED_ACTION_FMT.format("approve rewards")
+                    )
+
+                user_obj = (
+                    await self.hass.auth.async_get_user(user_id) if user_id else None
+                )
+                parent_name = user_obj.name if user_obj else "ParentOrAdmin"
 
-            LOGGER.info(
-                "Reward '%s' approved for kid '%s' by parent '%s'",
-                self._reward_name,
-                self._kid_name,
-                parent_name,
-            )
-            await self.coordinator.async_request_refresh()
-
-        except HomeAssistantError as e:
-            LOGGER.error(
-                "Authorization failed to approve reward '%s' for kid '%s': %s",
-                self._reward_name,
-                self._kid_name,
-                e,
-            )
-            # Send a persistent notification for the error
-            if user_id:
-                self.hass.components.persistent_notification.create(
-                    f"Failed to approve reward '{self._reward_name}' for {self._kid_name}: {e}",
-                    title="Reward Approval Failed",
-                    notification_id=f"approve_reward_error_{self._reward_id}",
-                )
-        except Exception as e:
-            LOGGER.error(
-                "Failed to approve reward '%s' for kid '%s': %s",
-                self._reward_name,
-                self._kid_name,
-                e,
-            )
-            # Send a persistent notification for the unexpected error
-            if user_id:
-                self.hass.components.persistent_notification.create(
-                    f"An unexpected error occurred while approving reward '{self._reward_name}' for {self._kid_name}",
-                    title="Reward Approval Error",
-                    notification_id=f"approve_reward_unexpected_error_{self._reward_id}",
+                # Approve the reward
+                self.coordinator.approve_reward(
+                    parent_name=parent_name,
+                    kid_id=self._kid_id,
+                    reward_id=self._reward_id,
+                )
+
+                LOGGER.info(
+                    "Reward '%s' approved for kid '%s' by parent '%s'",
+                    self._reward_name,
+                    self._kid_name,
+                    parent_name,
+                )
+
+            except HomeAssistantError as e:
+                LOGGER.error(
+                    "Authorization failed to approve reward '%s' for kid '%s': %s",
+                    self._reward_name,
+                    self._kid_name,
+                    e,
+                )
+                # Send a persistent notification for the error
+                if user_id:
+                    self.hass.components.persistent_notification.create(
+                        f"Failed to approve reward '{self._reward_name}' for {self._kid_name}: {e}",
+                        title="Reward Approval Failed",
+                        notification_id=f"approve_reward_error_{self._reward_id}",
+                    )
+            except Exception as e:
+                LOGGER.error(
+                    "Failed to approve reward '%s' for kid '%s': %s",
+                    self._reward_name,
+                    self._kid_name,
+                    e,
                 )
+                # Send a persistent notification for the unexpected error
+                if user_id:
+                    self.hass.components.persistent_notification.create(
+                        f"An unexpected error occurred while approving reward '{self._reward_name}' for {self._kid_name}",
+                        title="Reward Approval Error",
+                        notification_id=f"approve_reward_unexpected_error_{self._reward_id}",
+                    )
 
 
-class DisapproveRewardButton(CoordinatorEntity, ButtonEntity):
+class DisapproveRewardButton(KidsChoresEntity, ButtonEntity):
     """Button to disapprove a reward."""
 
     def __init__(
@@ -581,7 +597,9 @@ class DisapproveRewardButton(CoordinatorEntity, ButtonEntity):
     ):
         """Initialize the disapprove reward button."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_REWARDS, reward_id))
+        )
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._reward_id = reward_id
@@ -599,59 +617,55 @@ class DisapproveRewardButton(CoordinatorEntity, ButtonEntity):
             DATA_PENDING_REWARD_APPROVALS, []
         )
         # Check if there's a pending approval for this kid and reward
-        for approval in pending_approvals:
-            if (
-                approval["kid_id"] == self._kid_id
-                and approval["reward_id"] == self._reward_id
-            ):
-                return True
-        return False
+        return (self._kid_id, self._reward_id) in pending_approvals
 
     async def async_press(self):
         """Handle the button press event."""
-        try:
-            user_id = self._context.user_id if self._context else None
-            if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "disapprove_reward"
-            ):
-                raise HomeAssistantError(
-                    ERROR_NOT_AUTHORIZED_ACTION_FMT.format("disapprove rewards")
-                )
-
-            user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
-            parent_name = user_obj.name if user_obj else "ParentOrAdmin"
-
-            self.coordinator.disapprove_reward(
-                parent_name=parent_name,
-                kid_id=self._kid_id,
-                reward_id=self._reward_id,
-            )
-            LOGGER.info(
-                "Reward '%s' disapproved for kid '%s' by parent '%s'",
-                self._reward_name,
-                self._kid_name,
-                parent_name,
-            )
-            await self.coordinator.async_request_refresh()
-
-        except HomeAssistantError as e:
-            LOGGER.error(
-                "Authorization failed to disapprove reward '%s' for kid '%s': %s",
-                self._reward_name,
-                self._kid_name,
-                e,
-            )
-        except Exception as e:
-            LOGGER.error(
-                "Failed to disapprove reward '%s' for kid '%s': %s",
-                self._reward_name,
-                self._kid_name,
-                e,
-            )
+        async with self.coordinator.kid_locks.async_hold(self._kid_id):
+            try:
+                user_id = self._context.user_id if self._context else None
+                if user_id and not await is_user_authorized_for_global_action(
+                    self.hass, user_id, "disapprove_reward"
+                ):
+                    raise HomeAssistantError(
+                        ERROR_NOT_AUTHORIZED_ACTION_FMT.format("disapprove rewards")
+                    )
+
+                user_obj = (
+                    await self.hass.auth.async_get_user(user_id) if user_id else None
+                )
+                parent_name = user_obj.name if user_obj else "ParentOrAdmin"
+
+                self.coordinator.disapprove_reward(
+                    parent_name=parent_name,
+                    kid_id=self._kid_id,
+                    reward_id=self._reward_id,
+                )
+                LOGGER.info(
+                    "Reward '%s' disapproved for kid '%s' by parent '%s'",
+                    self._reward_name,
+                    self._kid_name,
+                    parent_name,
+                )
+
+            except HomeAssistantError as e:
+                LOGGER.error(
+                    "Authorization failed to disapprove reward '%s' for kid '%s': %s",
+                    self._reward_name,
+                    self._kid_name,
+                    e,
+                )
+            except Exception as e:
+                LOGGER.error(
+                    "Failed to disapprove reward '%s' for kid '%s': %s",
+                    self._reward_name,
+                    self._kid_name,
+                    e,
+                )
 
 
 # ------------------ Penalty Button ------------------
-class PenaltyButton(CoordinatorEntity, ButtonEntity):
+class PenaltyButton(KidsChoresEntity, ButtonEntity):
     """Button to apply a penalty for a kid.
 
     Uses user-defined or default penalty icon.
@@ -669,7 +683,10 @@ class PenaltyButton(CoordinatorEntity, ButtonEntity):
     ):
         """Initialize the penalty button."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            change_topics((DATA_KIDS, kid_id), (DATA_PENALTIES, penalty_id)),
+        )
         self._entry = entry
         self._kid_id = kid_id
         self._kid_name = kid_name
@@ -683,49 +700,51 @@ class PenaltyButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self):
         """Handle the button press event."""
-        try:
-            user_id = self._context.user_id if self._context else None
-            if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "apply_penalty"
-            ):
-                raise HomeAssistantError(
-                    ERROR_NOT_AUTHORIZED_ACTION_FMT.format("apply penalties")
-                )
-
-            user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
-            parent_name = user_obj.name if user_obj else "Unknown"
-
-            self.coordinator.apply_penalty(
-                parent_name=parent_name,
-                kid_id=self._kid_id,
-                penalty_id=self._penalty_id,
-            )
-            LOGGER.info(
-                "Penalty '%s' applied to kid '%s' by '%s'",
-                self._penalty_name,
-                self._kid_name,
-                parent_name,
-            )
-            await self.coordinator.async_request_refresh()
-
-        except HomeAssistantError as e:
-            LOGGER.error(
-                "Authorization failed to apply penalty '%s' for kid '%s': %s",
-                self._penalty_name,
-                self._kid_name,
-                e,
-            )
-        except Exception as e:
-            LOGGER.error(
-                "Failed to apply penalty '%s' for kid '%s': %s",
-                self._penalty_name,
-                self._kid_name,
-                e,
-            )
+        async with self.coordinator.kid_locks.async_hold(self._kid_id):
+            try:
+                user_id = self._context.user_id if self._context else None
+                if user_id and not await is_user_authorized_for_global_action(
+                    self.hass, user_id, "apply_penalty"
+                ):
+                    raise HomeAssistantError(
+                        ERROR_NOT_AUTHORIZED_ACTION_FMT.format("apply penalties")
+                    )
+
+                user_obj = (
+                    await self.hass.auth.async_get_user(user_id) if user_id else None
+                )
+                parent_name = user_obj.name if user_obj else "Unknown"
+
+                self.coordinator.apply_penalty(
+                    parent_name=parent_name,
+                    kid_id=self._kid_id,
+                    penalty_id=self._penalty_id,
+                )
+                LOGGER.info(
+                    "Penalty '%s' applied to kid '%s' by '%s'",
+                    self._penalty_name,
+                    self._kid_name,
+                    parent_name,
+                )
+
+            except HomeAssistantError as e:
+                LOGGER.error(
+                    "Authorization failed to apply penalty '%s' for kid '%s': %s",
+                    self._penalty_name,
+                    self._kid_name,
+                    e,
+                )
+            except Exception as e:
+                LOGGER.error(
+                    "Failed to apply penalty '%s' for kid '%s': %s",
+                    self._penalty_name,
+                    self._kid_name,
+                    e,
+                )
 
 
 # ------------------ Points Adjust Button ------------------
-class PointsAdjustButton(CoordinatorEntity, ButtonEntity):
+class PointsAdjustButton(KidsChoresEntity, ButtonEntity):
     """Button that increments or decrements a kid's points by 'delta'.
 
     For example: +1, -1, +10, -10, etc.
@@ -743,7 +762,7 @@ class PointsAdjustButton(CoordinatorEntity, ButtonEntity):
     ):
         """Initialize the points adjust buttons."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._entry = entry
         self._kid_id = kid_id
         self._kid_name = kid_name
@@ -762,40 +781,40 @@ class PointsAdjustButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self):
         """Handle the button press event."""
-        try:
-            user_id = self._context.user_id if self._context else None
-            if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "adjust_points"
-            ):
-                raise HomeAssistantError(
-                    ERROR_NOT_AUTHORIZED_ACTION_FMT.format("adjust points")
-                )
-
-            current_points = self.coordinator.kids_data[self._kid_id]["points"]
-            new_points = current_points + self._delta
-            self.coordinator.update_kid_points(
-                kid_id=self._kid_id,
-                new_points=new_points,
-            )
-            LOGGER.info(
-                "Adjusted points for kid '%s' by %d => total %d",
-                self._kid_name,
-                self._delta,
-                new_points,
-            )
-            await self.coordinator.async_request_refresh()
-
-        except HomeAssistantError as e:
-            LOGGER.error(
-                "Authorization failed to adjust points for kid '%s' by %d: %s",
-                self._kid_name,
-                self._delta,
-                e,
-            )
-        except Exception as e:
-            LOGGER.error(
-                "Failed to adjust points for kid '%s' by %d: %s",
-                self._kid_name,
-                self._delta,
-                e,
-            )
+        async with self.coordinator.kid_locks.async_hold(self._kid_id):
+            try:
+                user_id = self._context.user_id if self._context else None
+                if user_id and not await is_user_authorized_for_global_action(
+                    self.hass, user_id, "adjust_points"
+                ):
+                    raise HomeAssistantError(
+                        ERROR_NOT_AUTHORIZED_ACTION_FMT.format("adjust points")
+                    )
+
+                current_points = self.coordinator.kids_data[self._kid_id]["points"]
+                new_points = current_points + self._delta
+                self.coordinator.update_kid_points(
+                    kid_id=self._kid_id,
+                    new_points=new_points,
+                )
+                LOGGER.info(
+                    "Adjusted points for kid '%s' by %d => total %d",
+                    self._kid_name,
+                    self._delta,
+                    new_points,
+                )
+
+            except HomeAssistantError as e:
+                LOGGER.error(
+                    "Authorization failed to adjust points for kid '%s' by %d: %s",
+                    self._kid_name,
+                    self._delta,
+                    e,
+                )
+            except Exception as e:
+                LOGGER.error(
+                    "Failed to adjust points for kid '%s' by %d: %s",
+                    self._kid_name,
+                    self._delta,
+                    e,
+                )
@@ -0,0 +1,170 @@
+# File: chore_matrix.py
+"""Per-kid chore state matrix for the KidsChores integration.
+
+Whether a kid has claimed or been approved for a chore is kept as one byte
+of flags per (kid, chore) cell in a bytearray, with maps from kid and chore
+IDs to rows and columns. Checking or changing a cell is a constant-time
+index, and resetting chores zero-fills their columns instead of filtering
+every kid's lists. In storage the flags remain the kids' claimed_chores and
+approved_chores lists; the coordinator rewrites the lists of kids whose rows
+changed before persisting.
+"""
+
+from collections.abc import Iterable
+from typing import Any, Optional
+
+KID_CHORE_CLAIMED = 1  # Claimed by the kid, awaiting approval
+KID_CHORE_APPROVED = 2  # Approved for the kid in the current period
+
+_INITIAL_COLUMNS = 16
+
+
+class ChoreStateMatrix:
+    """Claimed/approved flags for every (kid, chore) pair.
+
+    Rows are kids and columns are chores, stored row after row. Columns are
+    allocated in powers of two so adding a chore rarely moves existing rows.
+    """
+
+    def __init__(self):
+        """Initialize an empty matrix."""
+        self._rows: dict[str, int] = {}
+        self._columns: dict[str, int] = {}
+        self._chore_ids: list[str] = []  # Chore ID per column
+        self._stride = _INITIAL_COLUMNS
+        self._cells = bytearray()
+        self._dirty: set[str] = set()  # Kids whose stored lists are stale
+
+    def rebuild(self, kids: dict[str, dict], chore_ids: Iterable[str]):
+        """Replace the matrix with the flags in the kids' stored lists.
+
+        Args:
+            kids (dict): Kid records keyed by internal_id, with their
+                claimed_chores and approved_chores lists.
+            chore_ids (Iterable[str]): Internal IDs of all chores; list entries
+                for other chores are ignored.
+
+        """
+        self._chore_ids = list(chore_ids)
+        self._columns = {chore_id: col for col, chore_id in enumerate(self._chore_ids)}
+        self._stride = _INITIAL_COLUMNS
+        while self._stride < len(self._chore_ids):
+            self._stride *= 2
+        self._rows = {kid_id: row for row, kid_id in enumerate(kids)}
+        self._cells = bytearray(len(self._rows) * self._stride)
+        self._dirty.clear()
+
+        for kid_id, kid_info in kids.items():
+            base = self._rows[kid_id] * self._stride
+            for key, flag in (
+                ("claimed_chores", KID_CHORE_CLAIMED),
+                ("approved_chores", KID_CHORE_APPROVED),
+            ):
+                for chore_id in kid_info.get(key, []):
+                    col = self._columns.get(chore_id)
+                    if col is not None:
+                        self._cells[base + col] |= flag
+
+    def _cell(self, kid_id: str, chore_id: str) -> int:
+        """Return the cell index of a pair, adding the kid or chore if new."""
+        row = self._rows.get(kid_id)
+        if row is None:
+            row = self._rows[kid_id] = len(self._rows)
+            self._cells.extend(bytes(self._stride))
+        col = self._columns.get(chore_id)
+        if col is None:
+            col = self._columns[chore_id] = len(self._chore_ids)
+            self._chore_ids.append(chore_id)
+            if col >= self._stride:
+                self._widen()
+        return row * self._stride + col
+
+    def _widen(self):
+        """Double the number of columns, moving every row."""
+        old_stride, self._stride = self._stride, self._stride * 2
+        cells = bytearray(len(self._rows) * self._stride)
+        for row in range(len(self._rows)):
+            cells[row * self._stride : row * self._stride + old_stride] = self._cells[
+                row * old_stride : (row + 1) * old_stride
+            ]
+        self._cells = cells
+
+    def get(self, kid_id: str, chore_id: str) -> int:
+        """Return the KID_CHORE_* flags of a pair; 0 if none are set."""
+        row = self._rows.get(kid_id)
+        col = self._columns.get(chore_id)
+        if row is None or col is None:
+            return 0
+        return self._cells[row * self._stride + col]
+
+    def is_claimed(self, kid_id: str, chore_id: str) -> bool:
+        """Return True if the kid has claimed the chore."""
+        return bool(self.get(kid_id, chore_id) & KID_CHORE_CLAIMED)
+
+    def is_approved(self, kid_id: str, chore_id: str) -> bool:
+        """Return True if the chore is approved for the kid."""
+        return bool(self.get(kid_id, chore_id) & KID_CHORE_APPROVED)
+
+    def set_flags(self, kid_id: str, chore_id: str, flags: int):
+        """Replace the flags of a pair."""
+        cell = self._cell(kid_id, chore_id)
+        if self._cells[cell] != flags:
+            self._cells[cell] = flags
+            self._dirty.add(kid_id)
+
+    def add_flag(self, kid_id: str, chore_id: str, flag: int):
+        """Set one flag of a pair, keeping the others."""
+        self.set_flags(kid_id, chore_id, self.get(kid_id, chore_id) | flag)
+
+    def any_approved(self, chore_id: str, exclude_kid: Optional[str] = None) -> bool:
+        """Return True if the chore is approved for any kid but the excluded one."""
+        col = self._columns.get(chore_id)
+        if col is None:
+            return False
+        excluded_row = self._rows.get(exclude_kid)
+        return any(
+            self._cells[row * self._stride + col] & KID_CHORE_APPROVED
+            for row in range(len(self._rows))
+            if row != excluded_row
+        )
+
+    def clear_chores(self, chore_ids: Iterable[str]):
+        """Clear the flags of the given chores for every kid."""
+        rows = len(self._rows)
+        zeros = bytes(rows)
+        for chore_id in chore_ids:
+            col = self._columns.get(chore_id)
+            if col is not None and any(self._cells[col :: self._stride]):
+                self._cells[col :: self._stride] = zeros
+                self._dirty.update(self._rows)
+
+    def clear(self):
+        """Clear the flags of every chore for every kid."""
+        if any(self._cells):
+            self._cells = bytearray(len(self._cells))
+            self._dirty.update(self._rows)
+
+    def chore_ids_with(self, kid_id: str, flag: int) -> list[str]:
+        """Return the chores for which the kid has the flag set."""
+        row = self._rows.get(kid_id)
+        if row is None:
+            return []
+        base = row * self._stride
+        return [
+            chore_id
+            for col, chore_id in enumerate(self._chore_ids)
+            if self._cells[base + col] & flag
+        ]
+
+    def pop_dirty(self) -> set[str]:
+        """Return and forget the kids whose flags changed since the last call."""
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Return the matrix dimensions and size in bytes."""
+        return {
+            "kids": len(self._rows),
+            "chores": len(self._chore_ids),
+            "bytes": len(self._cells),
+        }
@@ -27,6 +27,7 @@ from .const import (
     CONF_POINTS_ICON,
     DEFAULT_POINTS_ICON,
     DEFAULT_POINTS_LABEL,
+    DEFAULT_RECURRING_INTERVAL,
 )
 from .flow_helpers import (
     build_kid_schema,
@@ -320,6 +321,10 @@ class KidsChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "recurring_frequency": user_input.get(
                         "recurring_frequency", "none"
                     ),
+                    "recurring_interval": int(
+                        user_input.get("recurring_interval", DEFAULT_RECURRING_INTERVAL)
+                    ),
+                    "recurring_weekdays": user_input.get("recurring_weekdays", []),
                     "due_date": due_date_str,
                     "internal_id": internal_id,
                 }
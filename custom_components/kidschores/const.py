@@ -25,6 +25,11 @@ PLATFORMS = [
 # Storage and Versioning
 STORAGE_KEY = "kidschores_data"  # Persistent storage key
 STORAGE_VERSION = 1  # Version number for storage format (used during migrations)
+STORAGE_SAVE_DELAY = 2  # Seconds to coalesce bursts of mutations into one write
+STORAGE_JOURNAL_ENABLED = True  # Append operation records instead of full rewrites
+STORAGE_JOURNAL_MAX_BYTES = 256 * 1024  # Compact the journal past this size
+STORAGE_JOURNAL_MAX_AGE = 3600  # Compact the journal after this many seconds
+STORAGE_JOURNAL_SEQ = "journal_seq"  # Snapshot key for the last journaled record
 
 # Configuration Keys
 CONF_POINTS_ICON = "points_icon"
@@ -37,9 +42,6 @@ CONF_PARENTS = "parents"  # Key for parents configuration
 CONF_PENALTIES = "penalties"  # Key for penalties configuration
 CONF_GLOBAL = "global"
 
-# Update Interval
-UPDATE_INTERVAL = 5  # Update interval for coordinator (in minutes)
-
 # Default icons
 DEFAULT_ICON = "mdi:star-outline"  # Default icon for general points display
 DEFAULT_BADGE_BINARY_ICON = "mdi:shield-star-outline"  # For kid-has-any-badge sensor
@@ -74,6 +76,38 @@ DEFAULT_DAILY_RESET_TIME = {
 }  # Daily reset at midnight
 DEFAULT_WEEKLY_RESET_DAY = 0  # Weekly reset on Monday (0 = Monday, 6 = Sunday)
 DEFAULT_MONTHLY_RESET_DAY = 1  # Monthly reset on the 1st day
+DEFAULT_RECURRING_INTERVAL = 1  # Recur every period unless set otherwise
+
+# Timer Names
+TIMER_DUE_DATE = "due_date"  # Fires at the next chore due date
+TIMER_PERIODIC_RESET = "periodic_reset"  # Daily/weekly/monthly resets at midnight
+TIMER_APPROVAL_DIGEST = "approval_digest"  # Per-parent digest flush, name:user_id
+
+# Approval Notifications
+APPROVAL_KIND_CHORE = "chore"  # Approval request for a claimed chore
+APPROVAL_KIND_REWARD = "reward"  # Approval request for a redeemed reward
+NOTIFY_QUEUE_SIZE = 256  # Approval requests waiting to be routed; more are dropped
+NOTIFY_COALESCE_WINDOW = 10  # Seconds to collect requests into one digest
+NOTIFY_MIN_INTERVAL = 60  # Minimum seconds between digests to one parent
+
+# Chore Recurrence
+FREQUENCY_NONE = "none"  # Chore does not recur
+FREQUENCY_DAILY = "daily"  # Every N days
+FREQUENCY_WEEKLY = "weekly"  # Every N weeks, optionally on specific weekdays
+FREQUENCY_MONTHLY = "monthly"  # Every N months, clamped to the month's last day
+FREQUENCY_OPTIONS = [
+    FREQUENCY_NONE,
+    FREQUENCY_DAILY,
+    FREQUENCY_WEEKLY,
+    FREQUENCY_MONTHLY,
+]
+WEEKDAY_OPTIONS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]  # Monday first
+# Kid counters zeroed by each periodic reset
+RESET_COUNTERS = {
+    FREQUENCY_DAILY: ("completed_chores_today", "points_earned_today"),
+    FREQUENCY_WEEKLY: ("completed_chores_weekly", "points_earned_weekly"),
+    FREQUENCY_MONTHLY: ("completed_chores_monthly", "points_earned_monthly"),
+}
 
 # Data Keys for Coordinator and Storage
 DATA_KIDS = "kids"  # Key for storing kids data in storage
@@ -84,6 +118,33 @@ DATA_PARENTS = "parents"  # Key for storing parent data
 DATA_PENALTIES = "penalties"  # Key for storing penalties data
 DATA_PENDING_CHORE_APPROVALS = "pending_chore_approvals"  # Pending chore approvals
 DATA_PENDING_REWARD_APPROVALS = "pending_reward_approvals"  # Pending reward approvals
+DATA_LINKED_USERS = "linked_users"  # HA user ID to kid ID links
+DATA_LAST_RESETS = "last_resets"  # Instant each periodic reset last ran
+# Collections whose records are merged from the config entry options
+MERGED_COLLECTIONS = (
+    DATA_KIDS,
+    DATA_PARENTS,
+    DATA_CHORES,
+    DATA_BADGES,
+    DATA_REWARDS,
+    DATA_PENALTIES,
+)
+
+# Storage shards: one Store file per collection, mapped to its storage version
+STORAGE_SHARD_ITEMS = "items"  # Shard payload key holding the collection data
+STORAGE_SHARD_MISC = "misc"  # Shard for top-level keys without their own file
+STORAGE_SHARDS = {
+    DATA_KIDS: 1,
+    DATA_CHORES: 1,
+    DATA_BADGES: 1,
+    DATA_REWARDS: 1,
+    DATA_PENALTIES: 1,
+    DATA_PARENTS: 1,
+    DATA_PENDING_CHORE_APPROVALS: 1,
+    DATA_PENDING_REWARD_APPROVALS: 1,
+    DATA_LINKED_USERS: 1,
+    STORAGE_SHARD_MISC: 1,
+}
 
 
 # Chore States
@@ -93,6 +154,14 @@ CHORE_STATE_APPROVED = "approved"  # Chore fully approved
 CHORE_STATE_PARTIAL = "partial"  # Chore approved with partial points
 CHORE_STATE_OVERDUE = "overdue"  # Chore not completed before the due date
 CHORE_STATE_UNKNOWN = "unknown"
+CHORE_STATES = [
+    CHORE_STATE_PENDING,
+    CHORE_STATE_CLAIMED,
+    CHORE_STATE_APPROVED,
+    CHORE_STATE_PARTIAL,
+    CHORE_STATE_OVERDUE,
+    CHORE_STATE_UNKNOWN,
+]  # All chore states, e.g. for service filters
 
 # Reward States
 REWARD_STATE_NOT_CLAIMED = "not_claimed"  # Default state: reward not claimed
@@ -169,6 +238,13 @@ SERVICE_DISAPPROVE_CHORE = "disapprove_chore"  # Disapprove chore service
 SERVICE_DISAPPROVE_REWARD = "disapprove_reward"  # Disapprove reward service
 SERVICE_RESET_ALL_DATA = "reset_all_data"  # Reset all data service
 SERVICE_RESET_ALL_CHORES = "reset_all_chores"  # Reset all chores service
+SERVICE_APPROVE_PENDING_CHORES = (
+    "approve_pending_chores"  # Approve all pending chores in one call
+)
+SERVICE_ADJUST_FAMILY_POINTS = (
+    "adjust_family_points"  # Apply a penalty or points delta to many kids
+)
+SERVICE_QUERY = "query"  # Return kids, chores and rewards as response data
 
 # Field Names (for consistency across services)
 FIELD_KID_NAME = "kid_name"
@@ -177,6 +253,18 @@ FIELD_PARENT_NAME = "parent_name"
 FIELD_REWARD_NAME = "reward_name"
 FIELD_PENALTY_NAME = "penalty_name"
 FIELD_POINTS_AWARDED = "points_awarded"
+FIELD_KID_NAMES = "kid_names"  # Optional list of kids for bulk services
+FIELD_CHORE_NAMES = "chore_names"  # Optional list of chores for bulk services
+FIELD_POINTS_DELTA = "points_delta"  # Points added (or deducted) per kid
+FIELD_KID_ID = "kid_id"  # Internal ID alternative to kid_name
+FIELD_CHORE_ID = "chore_id"  # Internal ID alternative to chore_name
+FIELD_REWARD_ID = "reward_id"  # Internal ID alternative to reward_name
+FIELD_PENALTY_ID = "penalty_id"  # Internal ID alternative to penalty_name
+FIELD_KID_IDS = "kid_ids"  # Internal ID alternative to kid_names
+FIELD_CHORE_IDS = "chore_ids"  # Internal ID alternative to chore_names
+FIELD_CHORE_STATES = "chore_states"  # Query filter on per-kid chore state
+FIELD_DUE_WITHIN = "due_within"  # Query filter on chores due within a period
+FIELD_AFFORDABLE_ONLY = "affordable_only"  # Query filter on affordable rewards
 
 # Validation Keys
 VALIDATION_PARTIAL_ALLOWED = "partial_allowed"  # Allow partial points in chores
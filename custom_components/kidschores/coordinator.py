@@ -6,26 +6,33 @@ reward redemption, penalty application, and recurring chore handling.
 Manages entities primarily using internal_id for consistency.
 """
 
-import copy
+import functools
 import uuid
 
 from calendar import monthrange
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import datetime
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_track_time_change
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
+from .approval_queue import ApprovalQueue, approvals_as_list
+from .auth_cache import AuthorizationCache
+from .badge_engine import BadgeEngine
+from .chore_matrix import ChoreStateMatrix, KID_CHORE_APPROVED, KID_CHORE_CLAIMED
 from .const import (
-    BADGE_THRESHOLD_TYPE_CHORE_COUNT,
+    APPROVAL_KIND_CHORE,
+    APPROVAL_KIND_REWARD,
     BADGE_THRESHOLD_TYPE_POINTS,
     CHORE_STATE_APPROVED,
     CHORE_STATE_CLAIMED,
     CHORE_STATE_OVERDUE,
     CHORE_STATE_PENDING,
+    CHORE_STATE_UNKNOWN,
     CONF_BADGES,
     CONF_CHORES,
     CONF_KIDS,
@@ -35,6 +42,7 @@ from .const import (
     DATA_BADGES,
     DATA_CHORES,
     DATA_KIDS,
+    DATA_LAST_RESETS,
     DATA_PARENTS,
     DATA_PENALTIES,
     DATA_PENDING_CHORE_APPROVALS,
@@ -49,13 +57,53 @@ from .const import (
     DEFAULT_PENALTY_ICON,
     DEFAULT_PENALTY_POINTS,
     DEFAULT_POINTS,
+    DEFAULT_RECURRING_INTERVAL,
     DEFAULT_REWARD_COST,
     DEFAULT_REWARD_ICON,
-    DEFAULT_WEEKLY_RESET_DAY,
     DOMAIN,
+    FREQUENCY_DAILY,
+    FREQUENCY_MONTHLY,
+    FREQUENCY_NONE,
+    FREQUENCY_WEEKLY,
     LOGGER,
-    UPDATE_INTERVAL,
+    MERGED_COLLECTIONS,
+    RESET_COUNTERS,
+    TIMER_PERIODIC_RESET,
 )
+from .recurrence import last_reset_instant, next_occurrence
+from .scheduler import DueDateScheduler
+from .locks import KidLockManager
+from .notifications import ApprovalNotifier
+from .serialization import parse_datetime
+from .snapshot import DataSnapshot
+from .timers import TimerRegistry
+
+
+def change_topics(*topics: tuple[str, Optional[str]]) -> frozenset:
+    """Build the listener context for the records an entity depends on.
+
+    Each topic is a (collection, internal_id) pair, e.g. (DATA_KIDS, kid_id).
+    An internal_id of None subscribes to every change in the collection.
+    """
+    return frozenset(topics)
+
+
+def _transactional(operation: str):
+    """Run a coordinator method inside a transaction named after the operation.
+
+    Nested calls join the outermost transaction, so an operation persists and
+    notifies listeners once no matter how many mutators it goes through.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.transaction(operation):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
 
 
 class KidsChoresDataCoordinator(DataUpdateCoordinator):
@@ -75,25 +123,65 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             hass,
             LOGGER,
             name=f"{DOMAIN}_coordinator",
-            update_interval=timedelta(minutes=UPDATE_INTERVAL),
+            # No polling; overdue transitions are driven by the due date scheduler.
+            update_interval=None,
         )
         self.config_entry = config_entry
         self.storage_manager = storage_manager
         self._data: dict[str, Any] = {}
+        # Items changed since the last persist, keyed by data collection.
+        # A value of None means the whole collection changed.
+        self._changes: dict[str, Optional[set]] = {}
+        # Bidirectional name <-> internal_id indexes, keyed by data collection.
+        self._ids_by_name: dict[str, dict[str, str]] = {}
+        self._names_by_id: dict[str, dict[str, str]] = {}
+        # Listeners subscribed to change topics: collection -> internal_id -> callbacks.
+        self._topic_listeners: dict[str, dict[Optional[str], set]] = {}
+        # Listeners without topics, notified of every change.
+        self._untargeted_listeners: set[CALLBACK_TYPE] = set()
+        # Version of the published data; see snapshot().
+        self._version = 0
+        # Generation of each changed record and collection; see generation().
+        self._generation = 0
+        self._record_generations: dict[str, dict[str, int]] = {}
+        self._collection_generations: dict[str, int] = {}
+        self._whole_generations: dict[str, int] = {}
+        # Open transaction state; see transaction().
+        self._transaction_depth = 0
+        self._transaction_operation: Optional[str] = None
+        self._persist_requested = False
+        # Sorted badge thresholds; rebuilt when badge definitions change.
+        self._badge_engine = BadgeEngine()
+        # Every scheduled callback, cancelled when the config entry unloads.
+        self.timers = TimerRegistry()
+        config_entry.async_on_unload(self.timers.async_cancel_all)
+        # Serializes service calls and button presses per kid.
+        self.kid_locks = KidLockManager()
+        # Kids per linked user and parent users per kid; see _links_changed.
+        self._kids_by_user: dict[str, frozenset[str]] = {}
+        self._parent_kids_by_user: dict[str, frozenset[str]] = {}
+        self._parent_users_by_kid: dict[str, list[str]] = {}
+        # Authorization facts per Home Assistant user.
+        self.auth_cache = AuthorizationCache(hass, self)
+        config_entry.async_on_unload(self.auth_cache.async_listen())
+        # Approval requests, delivered to parents as digest notifications.
+        self.notifier = ApprovalNotifier(hass, self, self.timers)
+        # Claimed/approved flags per (kid, chore); see _sync_chore_lists.
+        self.chore_matrix = ChoreStateMatrix()
+        # Single timer for the next chore due date.
+        self._due_scheduler = DueDateScheduler(
+            hass, self._async_handle_due_chores, self.timers
+        )
 
     async def _async_update_data(self):
-        """Periodic update.
+        """Refresh requested by the first refresh or by entities.
 
-        - Checks overdue chores
-        - Handles recurring resets
-        - Notifies entities
+        There is no periodic work: overdue chores are handled by the due date
+        scheduler and resets by their own timers. Committed transactions publish
+        their own changes, and entities skip the refresh unless a record they
+        render changed.
         """
-        try:
-            self._handle_scheduled_tasks()
-            self.async_update_listeners()
-            return self._data
-        except Exception as err:
-            raise UpdateFailed(f"Error updating KidsChores data: {err}") from err
+        return self.snapshot()
 
     async def async_config_entry_first_refresh(self):
         """Load from storage and merge config options."""
@@ -113,17 +201,33 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             }
         )
 
-        # Register daily/weekly/monthly resets
-        async_track_time_change(
-            self.hass, self._reset_all_chore_counts, **DEFAULT_DAILY_RESET_TIME
+        # Register daily/weekly/monthly resets; replaces the timer of an
+        # earlier refresh instead of adding a second one
+        self.timers.async_track(
+            TIMER_PERIODIC_RESET,
+            async_track_time_change(
+                self.hass, self._reset_all_chore_counts, **DEFAULT_DAILY_RESET_TIME
+            ),
+            **DEFAULT_DAILY_RESET_TIME,
         )
 
         self._initialize_data_from_config()
-        self._persist()
+        self.notifier.async_start(self.config_entry)
+        # Catch up on resets missed while Home Assistant was not running
+        await self._reset_all_chore_counts(dt_util.now())
+        self._due_scheduler.async_rebuild(
+            (chore_id, self._chore_due_instant(chore_info))
+            for chore_id, chore_info in self.chores_data.items()
+        )
         await super().async_config_entry_first_refresh()
 
+    @_transactional("merge_config")
     def _initialize_data_from_config(self):
-        """Merge config_entry options with stored data structures using internal_id."""
+        """Merge config_entry options with stored data structures using internal_id.
+
+        Runs as one transaction; only records the merge added, removed or
+        modified are persisted.
+        """
         options = self.config_entry.options
 
         kids_dict = options.get(CONF_KIDS, {})
@@ -140,8 +244,22 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         self._data.setdefault(DATA_BADGES, {})
         self._data.setdefault(DATA_REWARDS, {})
         self._data.setdefault(DATA_PENALTIES, {})
-        self._data.setdefault(DATA_PENDING_CHORE_APPROVALS, [])
-        self._data.setdefault(DATA_PENDING_REWARD_APPROVALS, [])
+        self._data[DATA_PENDING_CHORE_APPROVALS] = ApprovalQueue(
+            "chore_id", approvals_as_list(self._data.get(DATA_PENDING_CHORE_APPROVALS))
+        )
+        self._data[DATA_PENDING_REWARD_APPROVALS] = ApprovalQueue(
+            "reward_id",
+            approvals_as_list(self._data.get(DATA_PENDING_REWARD_APPROVALS)),
+        )
+        # The merge only reassigns fields of stored records, so shallow copies
+        # are enough to tell afterwards which records it changed
+        stored = {
+            collection: {
+                item_id: dict(item_info)
+                for item_id, item_info in self._data[collection].items()
+            }
+            for collection in MERGED_COLLECTIONS
+        }
 
         # --- Kids ---
         # Remove kids not present in options
@@ -150,9 +268,20 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         kids_to_remove = existing_kids - option_kids
         for kid_id in kids_to_remove:
             del self._data[DATA_KIDS][kid_id]
+            self._unindex_name(DATA_KIDS, kid_id)
             LOGGER.debug(
                 "Removed kid with ID '%s' as it's no longer in configuration", kid_id
             )
+        if kids_to_remove:
+            # Drop approvals the removed kids can no longer receive
+            for collection in (
+                DATA_PENDING_CHORE_APPROVALS,
+                DATA_PENDING_REWARD_APPROVALS,
+            ):
+                if self._data[collection].remove_where(
+                    lambda approval: approval["kid_id"] in kids_to_remove
+                ):
+                    self._mark_changed(collection)
 
         # Add or update kids from options
         for kid_id, kid_data in kids_dict.items():
@@ -233,12 +362,17 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
                 # Points and other historical data should not be overwritten
 
+            self._index_name(
+                DATA_KIDS, kid_id, self._data[DATA_KIDS][kid_id]["name"]
+            )
+
         # --- Parents ---
         existing_parents = set(self._data[DATA_PARENTS].keys())
         option_parents = set(parents_dict.keys())
         parents_to_remove = existing_parents - option_parents
         for parent_id in parents_to_remove:
             del self._data[DATA_PARENTS][parent_id]
+            self._unindex_name(DATA_PARENTS, parent_id)
             LOGGER.debug(
                 "Removed parent with ID '%s' as it's no longer in configuration",
                 parent_id,
@@ -282,12 +416,21 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                         )
                 existing["associated_kids"] = valid_kids
 
+            self._index_name(
+                DATA_PARENTS,
+                parent_id,
+                self._data[DATA_PARENTS][parent_id]["name"],
+            )
+
+        self._links_changed()
+
         # --- Chores ---
         existing_chores = set(self._data[DATA_CHORES].keys())
         option_chores = set(chores_dict.keys())
         chores_to_remove = existing_chores - option_chores
         for chore_id in chores_to_remove:
             del self._data[DATA_CHORES][chore_id]
+            self._unindex_name(DATA_CHORES, chore_id)
             LOGGER.debug(
                 "Removed chore with ID '%s' as it's no longer in configuration",
                 chore_id,
@@ -328,8 +471,14 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     "recurring_frequency": chore_data.get(
                         "recurring_frequency", "none"
                     ),
-                    "due_date": chore_data.get("due_date"),
-                    "last_completed": chore_data.get("last_completed"),
+                    "recurring_interval": chore_data.get(
+                        "recurring_interval", DEFAULT_RECURRING_INTERVAL
+                    ),
+                    "recurring_weekdays": chore_data.get("recurring_weekdays", []),
+                    "due_date": parse_datetime(chore_data.get("due_date")),
+                    "last_completed": parse_datetime(
+                        chore_data.get("last_completed")
+                    ),
                     "internal_id": chore_id,
                 }
                 LOGGER.debug(
@@ -381,10 +530,25 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 existing["recurring_frequency"] = chore_data.get(
                     "recurring_frequency", existing["recurring_frequency"]
                 )
-                existing["due_date"] = chore_data.get("due_date", existing["due_date"])
-                existing["last_completed"] = chore_data.get(
-                    "last_completed", existing["last_completed"]
+                existing["recurring_interval"] = chore_data.get(
+                    "recurring_interval",
+                    existing.get("recurring_interval", DEFAULT_RECURRING_INTERVAL),
                 )
+                existing["recurring_weekdays"] = chore_data.get(
+                    "recurring_weekdays", existing.get("recurring_weekdays", [])
+                )
+                if "due_date" in chore_data:
+                    existing["due_date"] = parse_datetime(chore_data["due_date"])
+                if "last_completed" in chore_data:
+                    existing["last_completed"] = parse_datetime(
+                        chore_data["last_completed"]
+                    )
+
+            self._index_name(
+                DATA_CHORES, chore_id, self._data[DATA_CHORES][chore_id]["name"]
+            )
+
+        self.chore_matrix.rebuild(self.kids_data, self.chores_data)
 
         # --- Badges ---
         existing_badges = set(self._data[DATA_BADGES].keys())
@@ -392,6 +556,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         badges_to_remove = existing_badges - option_badges
         for badge_id in badges_to_remove:
             del self._data[DATA_BADGES][badge_id]
+            self._unindex_name(DATA_BADGES, badge_id)
             LOGGER.debug(
                 "Removed badge with ID '%s' as it's no longer in configuration",
                 badge_id,
@@ -439,6 +604,10 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 )
                 # Preserve earned_by and internal_id
 
+            self._index_name(
+                DATA_BADGES, badge_id, self._data[DATA_BADGES][badge_id]["name"]
+            )
+
         # Recalculate Badges on reload
         self._recalculate_all_badges()
 
@@ -448,6 +617,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         rewards_to_remove = existing_rewards - option_rewards
         for reward_id in rewards_to_remove:
             del self._data[DATA_REWARDS][reward_id]
+            self._unindex_name(DATA_REWARDS, reward_id)
             LOGGER.debug(
                 "Removed reward with ID '%s' as it's no longer in configuration",
                 reward_id,
@@ -480,12 +650,19 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 existing["icon"] = reward_data.get("icon", existing["icon"])
                 # Preserve internal_id
 
+            self._index_name(
+                DATA_REWARDS,
+                reward_id,
+                self._data[DATA_REWARDS][reward_id]["name"],
+            )
+
         # --- Penalties ---
         existing_penalties = set(self._data[DATA_PENALTIES].keys())
         option_penalties = set(penalties_dict.keys())
         penalties_to_remove = existing_penalties - option_penalties
         for penalty_id in penalties_to_remove:
             del self._data[DATA_PENALTIES][penalty_id]
+            self._unindex_name(DATA_PENALTIES, penalty_id)
             LOGGER.debug(
                 "Removed penalty with ID '%s' as it's no longer in configuration",
                 penalty_id,
@@ -518,6 +695,21 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 existing["icon"] = penalty_data.get("icon", existing["icon"])
                 # Preserve internal_id
 
+            self._index_name(
+                DATA_PENALTIES,
+                penalty_id,
+                self._data[DATA_PENALTIES][penalty_id]["name"],
+            )
+
+        # Record what the merge changed compared with storage
+        for collection, stored_items in stored.items():
+            items = self._data[collection]
+            for item_id in stored_items.keys() - items.keys():
+                self._mark_changed(collection, item_id)
+            for item_id, item_info in items.items():
+                if stored_items.get(item_id) != item_info:
+                    self._mark_changed(collection, item_id)
+
     # ------------------ PROPERTIES FOR EASY ACCESS ------------------
 
     @property
@@ -550,7 +742,18 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         """Return the penalties data."""
         return self._data.get(DATA_PENALTIES, {})
 
+    @property
+    def pending_chore_approvals(self):
+        """Return the pending chore approvals, oldest first."""
+        return self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+
+    @property
+    def pending_reward_approvals(self):
+        """Return the pending reward approvals, oldest first."""
+        return self._data.get(DATA_PENDING_REWARD_APPROVALS, [])
+
     # ------------------ PARENTS ------------------
+    @_transactional("add_parent")
     def add_parent(self, parent_def: dict):
         """Add new parent at runtime if needed."""
         parent_name = parent_def.get("name")
@@ -590,23 +793,27 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             "associated_kids": valid_kids,
             "internal_id": internal_id,
         }
+        self._index_name(DATA_PARENTS, internal_id, parent_name)
         LOGGER.debug("Added new parent '%s' with ID: %s", parent_name, internal_id)
-        self._persist()
-        self.async_set_updated_data(self._data)
+        self._mark_changed(DATA_PARENTS, internal_id)
+        self._links_changed()
 
+    @_transactional("remove_parent")
     def remove_parent(self, parent_id: str):
         """Remove a parent by ID."""
         if parent_id in self.parents_data:
             parent_name = self.parents_data[parent_id]["name"]
             del self.parents_data[parent_id]
+            self._unindex_name(DATA_PARENTS, parent_id)
             LOGGER.debug("Removed parent '%s' with ID: %s", parent_name, parent_id)
-            self._persist()
-            self.async_set_updated_data(self._data)
+            self._mark_changed(DATA_PARENTS, parent_id)
+            self._links_changed()
         else:
             LOGGER.warning("Remove parent: Parent ID '%s' not found", parent_id)
 
     # ------------------ CHORES ------------------
 
+    @_transactional("approve_chore")
     def approve_chore(
         self,
         parent_name: str,
@@ -625,6 +832,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             LOGGER.warning("Approve chore: Chore ID '%s' not found", chore_id)
             raise HomeAssistantError(f"Chore with ID '{chore_id}' not found.")
 
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            LOGGER.warning("Approve chore: Kid ID '%s' not found", kid_id)
+            raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
+
         chore_info = self.chores_data[chore_id]
         if kid_id not in chore_info.get("assigned_kids", []):
             LOGGER.warning(
@@ -633,17 +845,12 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 kid_id,
             )
             raise HomeAssistantError(
-                f"Chore '{chore_info.get('name')}' is not assigned to kid '{self.kids_data[kid_id]['name']}'."
+                f"Chore '{chore_info.get('name')}' is not assigned to kid '{self.get_name_by_id(DATA_KIDS, kid_id)}'."
             )
 
-        kid_info = self.kids_data.get(kid_id)
-        if not kid_info:
-            LOGGER.warning("Approve chore: Kid ID '%s' not found", kid_id)
-            raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
-
         # Check if multiple approvals are allowed for this chore
         if not chore_info.get("allow_multiple_claims_per_day", False):
-            if chore_id in kid_info.get("approved_chores", []):
+            if self.chore_matrix.is_approved(kid_id, chore_id):
                 error_message = f"Chore '{chore_info['name']}' has already been approved today and multiple approvals are not allowed."
                 LOGGER.warning(
                     "Chore ID '%s' has already been approved today by kid ID '%s' and multiple approvals are not allowed",
@@ -672,11 +879,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 )
         else:
             # For non-shared chores, approve for this specific kid
-            if chore_id in kid_info.get("claimed_chores", []):
-                # If chore was claimed by kid, move to approved
-                kid_info["claimed_chores"].remove(chore_id)
-                kid_info.setdefault("approved_chores", []).append(chore_id)
-                chore_info["state"] = CHORE_STATE_APPROVED
+            chore_info["state"] = CHORE_STATE_APPROVED
+            if self.chore_matrix.is_claimed(kid_id, chore_id):
                 LOGGER.debug(
                     "Chore ID '%s' approved for kid ID '%s'. Removed from claimed and added to approved chores. New state: '%s'",
                     chore_id,
@@ -684,39 +888,17 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     CHORE_STATE_APPROVED,
                 )
             else:
-                # Direct approval by parent; set state to approved and add to approved_chores
-                chore_info["state"] = CHORE_STATE_APPROVED
-                if chore_id not in kid_info.get("approved_chores", []):
-                    kid_info.setdefault("approved_chores", []).append(chore_id)
-                    LOGGER.debug(
-                        "Chore ID '%s' directly approved by parent '%s' for kid ID '%s'. Added to approved chores. New state: '%s'",
-                        chore_id,
-                        parent_name,
-                        kid_id,
-                        CHORE_STATE_APPROVED,
-                    )
-                else:
-                    LOGGER.debug(
-                        "Chore ID '%s' already in approved chores for kid ID '%s'",
-                        chore_id,
-                        kid_id,
-                    )
+                # Direct approval by parent
+                LOGGER.debug(
+                    "Chore ID '%s' directly approved by parent '%s' for kid ID '%s'. New state: '%s'",
+                    chore_id,
+                    parent_name,
+                    kid_id,
+                    CHORE_STATE_APPROVED,
+                )
 
         # Move chore from claimed to approved for the kid (for shared chores as well)
-        if chore_id in kid_info.get("claimed_chores", []):
-            kid_info["claimed_chores"].remove(chore_id)
-            LOGGER.debug(
-                "Chore ID '%s' removed from claimed_chores for kid ID '%s'",
-                chore_id,
-                kid_id,
-            )
-        if chore_id not in kid_info.get("approved_chores", []):
-            kid_info.setdefault("approved_chores", []).append(chore_id)
-            LOGGER.debug(
-                "Chore ID '%s' added to approved_chores for kid ID '%s'",
-                chore_id,
-                kid_id,
-            )
+        self.chore_matrix.set_flags(kid_id, chore_id, KID_CHORE_APPROVED)
 
         # Award points with multiplier
         old_points = kid_info["points"]
@@ -727,8 +909,9 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         kid_info["completed_chores_weekly"] += 1
         kid_info["completed_chores_monthly"] += 1
         kid_info["completed_chores_total"] += 1
+        self._check_badges_for_kid(kid_id)
 
-        chore_info["last_completed"] = datetime.now().isoformat()
+        chore_info["last_completed"] = dt_util.utcnow()
         LOGGER.debug(
             "Updated 'last_completed' for chore ID '%s' to '%s'",
             chore_id,
@@ -736,11 +919,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         )
 
         # Remove from pending approvals
-        self._data[DATA_PENDING_CHORE_APPROVALS] = [
-            approval
-            for approval in self._data[DATA_PENDING_CHORE_APPROVALS]
-            if not (approval["kid_id"] == kid_id and approval["chore_id"] == chore_id)
-        ]
+        self._data[DATA_PENDING_CHORE_APPROVALS].remove(kid_id, chore_id)
         LOGGER.debug(
             "Removed chore ID '%s' for kid ID '%s' from pending approvals",
             chore_id,
@@ -761,14 +940,14 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
         # Handle rescheduling if chore has a recurring frequency and a due_date
         freq = chore_info.get("recurring_frequency", "none")
-        due_date_str = chore_info.get("due_date")
-        if freq != "none" and due_date_str:
+        if freq != "none" and chore_info.get("due_date"):
             # Reschedule next due date based on the original due date and frequency
             self._reschedule_next_due_date(chore_info)
 
-        # Persist
-        self._persist()
-        self.async_set_updated_data(self._data)
+        # Record changes; persisted when the transaction commits
+        self._mark_changed(DATA_KIDS, kid_id)
+        self._mark_changed(DATA_CHORES, chore_id)
+        self._mark_changed(DATA_PENDING_CHORE_APPROVALS)
         LOGGER.debug(
             "Chore ID '%s' approval process completed. State: '%s', Points Awarded: %s",
             chore_id,
@@ -776,12 +955,116 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             awarded,
         )
 
+    def get_kid_chore_state(self, kid_id: str, chore_id: str) -> str:
+        """Return the state of a chore as seen by one kid.
+
+        Overdue and shared chores report the chore's global state; other chores
+        report the kid's own claim or approval.
+
+        Args:
+            kid_id (str): Internal ID of the kid.
+            chore_id (str): Internal ID of the chore.
+
+        Returns:
+            str: One of the CHORE_STATE_* values.
+
+        """
+        chore_info = self.chores_data.get(chore_id, {})
+        current_state = chore_info.get("state", CHORE_STATE_UNKNOWN)
+        if current_state == CHORE_STATE_OVERDUE:
+            return CHORE_STATE_OVERDUE
+        if chore_info.get("shared_chore", False):
+            return current_state or CHORE_STATE_UNKNOWN
+
+        flags = self.chore_matrix.get(kid_id, chore_id)
+        if flags & KID_CHORE_APPROVED:
+            return CHORE_STATE_APPROVED
+        if flags & KID_CHORE_CLAIMED:
+            return CHORE_STATE_CLAIMED
+        return CHORE_STATE_PENDING
+
+    @_transactional("approve_pending_chores")
+    def approve_pending_chores(
+        self,
+        parent_name: str,
+        kid_ids: Optional[list[str]] = None,
+        chore_ids: Optional[list[str]] = None,
+        points_awarded: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        """Approve every pending chore claim matching the filters at once.
+
+        All approvals share one transaction, so they are persisted once and
+        listeners are notified once. A claim that cannot be approved does not
+        stop the others.
+
+        Args:
+            parent_name (str): Name of the approving parent.
+            kid_ids (list, optional): Only approve claims of these kids.
+            chore_ids (list, optional): Only approve claims for these chores.
+            points_awarded (float, optional): Points per chore instead of the
+                chores' default points.
+
+        Returns:
+            list: One result per (kid, chore) pair, oldest claim first.
+
+        """
+        kid_filter = set(kid_ids) if kid_ids is not None else None
+        chore_filter = set(chore_ids) if chore_ids is not None else None
+        keys = dict.fromkeys(
+            (approval["kid_id"], approval["chore_id"])
+            for approval in self._data[DATA_PENDING_CHORE_APPROVALS]
+            if (kid_filter is None or approval["kid_id"] in kid_filter)
+            and (chore_filter is None or approval["chore_id"] in chore_filter)
+        )
+
+        results = []
+        for kid_id, chore_id in keys:
+            result = {
+                "kid_id": kid_id,
+                "kid_name": self.get_name_by_id(DATA_KIDS, kid_id),
+                "chore_id": chore_id,
+                "chore_name": self.get_name_by_id(DATA_CHORES, chore_id),
+            }
+            kid_info = self.kids_data.get(kid_id)
+            if not kid_info:
+                # Claim left behind by a kid removed from the configuration
+                result.update(
+                    approved=False, error=f"Kid with ID '{kid_id}' not found."
+                )
+                results.append(result)
+                continue
+            points_before = kid_info.get("points", 0)
+            try:
+                self.approve_chore(parent_name, kid_id, chore_id, points_awarded)
+            except HomeAssistantError as err:
+                result.update(approved=False, error=str(err))
+            else:
+                result.update(
+                    approved=True,
+                    points_awarded=kid_info.get("points", 0) - points_before,
+                )
+            results.append(result)
+
+        LOGGER.info(
+            "Approved %d of %d pending chore(s) by parent '%s'",
+            sum(1 for result in results if result["approved"]),
+            len(results),
+            parent_name,
+        )
+        return results
+
+    @_transactional("claim_chore")
     def claim_chore(self, kid_id: str, chore_id: str, user_name: str):
         """Kid claims chore => state=claimed; parent must then approve."""
         if chore_id not in self.chores_data:
             LOGGER.warning("Chore ID '%s' not found for claim", chore_id)
             raise HomeAssistantError(f"Chore with ID '{chore_id}' not found.")
 
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            LOGGER.warning("Claim chore: Kid ID '%s' not found", kid_id)
+            raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
+
         chore_info = self.chores_data[chore_id]
         if kid_id not in chore_info.get("assigned_kids", []):
             LOGGER.warning(
@@ -790,19 +1073,12 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 kid_id,
             )
             raise HomeAssistantError(
-                f"Chore '{chore_info.get('name')}' is not assigned to kid '{self.kids_data[kid_id]['name']}'."
+                f"Chore '{chore_info.get('name')}' is not assigned to kid '{self.get_name_by_id(DATA_KIDS, kid_id)}'."
             )
 
-        kid_info = self.kids_data.get(kid_id)
-        if not kid_info:
-            LOGGER.warning("Claim chore: Kid ID '%s' not found", kid_id)
-            raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
-
         # Check if multiple claims are allowed for this kid
         if not chore_info.get("allow_multiple_claims_per_day", False):
-            if chore_id in kid_info.get(
-                "claimed_chores", []
-            ) or chore_id in kid_info.get("approved_chores", []):
+            if self.chore_matrix.get(kid_id, chore_id):
                 error_message = f"Chore '{chore_info['name']}' has already been claimed today and multiple claims are not allowed."
                 LOGGER.warning(
                     "Chore ID '%s' has already been claimed or approved today by kid ID '%s' and multiple claims are not allowed",
@@ -832,8 +1108,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 )
         else:
             # For non-shared chores, add to kid's claimed chores
-            if chore_id not in kid_info.get("claimed_chores", []):
-                kid_info.setdefault("claimed_chores", []).append(chore_id)
+            if not self.chore_matrix.is_claimed(kid_id, chore_id):
+                self.chore_matrix.add_flag(kid_id, chore_id, KID_CHORE_CLAIMED)
                 chore_info["state"] = CHORE_STATE_CLAIMED
                 LOGGER.debug(
                     "Chore ID '%s' claimed by kid ID '%s'. Added to claimed chores",
@@ -848,7 +1124,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 )
 
         # Update last_claimed timestamp
-        chore_info["last_claimed"] = datetime.now().isoformat()
+        chore_info["last_claimed"] = dt_util.utcnow()
 
         # Increment chore_claims counter
         if chore_id in kid_info["chore_claims"]:
@@ -867,7 +1143,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             {
                 "kid_id": kid_id,
                 "chore_id": chore_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": dt_util.utcnow(),
             }
         )
         LOGGER.debug(
@@ -876,10 +1152,15 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             kid_id,
         )
 
-        # Persist
-        self._persist()
-        self.async_set_updated_data(self._data)
+        # Ask the kid's parents for approval through the digest pipeline
+        self.notifier.async_request(APPROVAL_KIND_CHORE, kid_id, chore_id)
+
+        # Record changes; persisted when the transaction commits
+        self._mark_changed(DATA_KIDS, kid_id)
+        self._mark_changed(DATA_CHORES, chore_id)
+        self._mark_changed(DATA_PENDING_CHORE_APPROVALS)
 
+    @_transactional("disapprove_chore")
     def disapprove_chore(self, parent_name: str, kid_id: str, chore_id: str):
         """Disapprove a chore for kid_id."""
         chore_info = self.chores_data.get(chore_id)
@@ -892,30 +1173,19 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             LOGGER.warning("Disapprove chore: Kid ID '%s' not found", kid_id)
             raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
 
-        # Remove the chore from the kid's approved_chores
-        if chore_id in kid_info.get("approved_chores", []):
-            kid_info["approved_chores"].remove(chore_id)
+        # Remove the chore from the kid's approved and claimed chores
+        if self.chore_matrix.get(kid_id, chore_id):
+            self.chore_matrix.set_flags(kid_id, chore_id, 0)
             LOGGER.debug(
-                "Chore ID '%s' removed from approved chores for kid ID '%s'",
-                chore_id,
-                kid_id,
-            )
-
-        # Also remove from claimed chores
-        if chore_id in kid_info.get("claimed_chores", []):
-            kid_info["claimed_chores"].remove(chore_id)
-            LOGGER.debug(
-                "Chore ID '%s' removed from claimed chores for kid ID '%s'",
+                "Chore ID '%s' removed from approved and claimed chores for kid ID '%s'",
                 chore_id,
                 kid_id,
             )
 
         # If shared chore, check if any other kid has approved it
         if chore_info.get("shared_chore", False):
-            other_approvals = any(
-                chore_id in other_kid.get("approved_chores", [])
-                for other_kid_id, other_kid in self.kids_data.items()
-                if other_kid_id != kid_id
+            other_approvals = self.chore_matrix.any_approved(
+                chore_id, exclude_kid=kid_id
             )
             if not other_approvals:
                 # No other approvals, set global state to pending
@@ -943,21 +1213,19 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
 
         # Remove from pending approvals
-        self._data[DATA_PENDING_CHORE_APPROVALS] = [
-            approval
-            for approval in self._data[DATA_PENDING_CHORE_APPROVALS]
-            if not (approval["kid_id"] == kid_id and approval["chore_id"] == chore_id)
-        ]
+        self._data[DATA_PENDING_CHORE_APPROVALS].remove(kid_id, chore_id)
         LOGGER.debug(
             "Removed chore ID '%s' for kid ID '%s' from pending approvals after disapproval",
             chore_id,
             kid_id,
         )
 
-        # Persist changes
-        self._persist()
-        self.async_set_updated_data(self._data)
+        # Record changes; persisted when the transaction commits
+        self._mark_changed(DATA_KIDS, kid_id)
+        self._mark_changed(DATA_CHORES, chore_id)
+        self._mark_changed(DATA_PENDING_CHORE_APPROVALS)
 
+    @_transactional("update_chore_state")
     def update_chore_state(self, chore_id: str, state: str):
         """Manually override a chore's state."""
         chore_info = self.chores_data.get(chore_id)
@@ -966,8 +1234,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             return
 
         chore_info["state"] = state
-        self._persist()
-        self.async_set_updated_data(self._data)
+        self._mark_changed(DATA_CHORES, chore_id)
 
     def _reschedule_next_due_date(self, chore_info: dict):
         """Reschedule the next due date based on the recurring frequency.
@@ -977,8 +1244,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
         """
         freq = chore_info.get("recurring_frequency", "none")
-        due_date_str = chore_info.get("due_date")
-        if not due_date_str:
+        original_due = chore_info.get("due_date")
+        if not original_due:
             LOGGER.warning(
                 "Chore '%s' has recurring frequency '%s' but no due_date set.",
                 chore_info.get("name", chore_info.get("internal_id")),
@@ -986,28 +1253,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
             return
 
-        try:
-            original_due = dt_util.parse_datetime(
-                due_date_str
-            ) or datetime.fromisoformat(due_date_str)
-        except ValueError:
-            LOGGER.warning(
-                "Unable to parse due_date '%s' for chore '%s'",
-                due_date_str,
-                chore_info.get("internal_id"),
-            )
-            return
-
-        next_due = original_due
-
-        # Calculate the next due date based on frequency
-        if freq == "daily":
-            next_due += timedelta(days=1)
-        elif freq == "weekly":
-            next_due += timedelta(weeks=1)
-        elif freq == "monthly":
-            next_due = self._add_one_month(next_due)
-        else:
+        # First occurrence after both the original due date and now
+        next_due = self._next_chore_occurrence(
+            chore_info, original_due, max(original_due, dt_util.utcnow())
+        )
+        if next_due is None:
             LOGGER.warning(
                 "Unknown recurring_frequency '%s' for chore '%s'",
                 freq,
@@ -1015,19 +1265,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
             return
 
-        now = dt_util.utcnow()
-
-        # Ensure the next_due is in the future
-        while next_due <= now:
-            if freq == "daily":
-                next_due += timedelta(days=1)
-            elif freq == "weekly":
-                next_due += timedelta(weeks=1)
-            elif freq == "monthly":
-                next_due = self._add_one_month(next_due)
-
         # Update the chore's due_date and state
-        chore_info["due_date"] = next_due.isoformat()
+        chore_info["due_date"] = next_due
         chore_info["state"] = CHORE_STATE_PENDING  # Reset to pending for the new cycle
 
         LOGGER.debug(
@@ -1036,104 +1275,97 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             chore_info["due_date"],
         )
 
-    def _add_one_month(self, dt_in: datetime) -> datetime:
-        """Help to add one month to a datetime.
+    def _next_chore_occurrence(
+        self, chore_info: dict, anchor: datetime, after: datetime
+    ) -> Optional[datetime]:
+        """Return the chore's first occurrence after an instant.
 
         Args:
-            dt_in (datetime): The original datetime.
+            chore_info (dict): The chore's data.
+            anchor (datetime): An occurrence of the chore's recurrence.
+            after (datetime): The result is strictly after this instant.
 
         Returns:
-            datetime: The new datetime with one month added.
+            datetime: The next occurrence, or None if the chore does not recur.
 
         """
-        year = dt_in.year
-        month = dt_in.month
-        day = dt_in.day
-
-        # Increment month by 1
-        new_month = month + 1
-        new_year = year
-        if new_month > 12:
-            new_month = 1
-            new_year += 1
-
-        # Handle day overflow
-        days_in_new_month = monthrange(new_year, new_month)[1]
-        if day > days_in_new_month:
-            day = days_in_new_month
-
-        return dt_in.replace(year=new_year, month=new_month, day=day)
+        return next_occurrence(
+            anchor,
+            chore_info.get("recurring_frequency", FREQUENCY_NONE),
+            after,
+            chore_info.get("recurring_interval", DEFAULT_RECURRING_INTERVAL),
+            chore_info.get("recurring_weekdays"),
+        )
 
     def _handle_recurring_chore(self, chore_info: dict):
         """If chore is daily/weekly/monthly, reset & set next due date."""
         freq = chore_info.get("recurring_frequency", "none")
-        now = datetime.now()
-        if freq == "daily":
-            next_due = now + timedelta(days=1)
-        elif freq == "weekly":
-            next_due = now + timedelta(weeks=1)
-        elif freq == "monthly":
-            days_in_month = monthrange(now.year, now.month)[1]
-            reset_day = min(DEFAULT_MONTHLY_RESET_DAY, days_in_month)
-            if now.day > reset_day:
-                # Move to next month
-                year = now.year + (now.month // 12)
-                month = (now.month % 12) + 1
-                try:
-                    next_due = now.replace(year=year, month=month, day=reset_day)
-                except ValueError:
-                    # In case reset_day exceeds the number of days in the next month
-                    next_due = now.replace(year=year, month=month, day=days_in_month)
-            else:
-                # Ensure the next_due is in the future
-                if now.day < reset_day:
-                    next_due = now.replace(day=reset_day)
-                else:
-                    # If today is the reset_day, set to next month
-                    year = now.year + (now.month // 12)
-                    month = (now.month % 12) + 1
-                    try:
-                        next_due = now.replace(year=year, month=month, day=reset_day)
-                    except ValueError:
-                        next_due = now.replace(
-                            year=year, month=month, day=days_in_month
-                        )
+        now = dt_util.now()
+        if freq == FREQUENCY_MONTHLY:
+            # Monthly chores without a due date recur on the monthly reset day
+            reset_day = min(
+                DEFAULT_MONTHLY_RESET_DAY, monthrange(now.year, now.month)[1]
+            )
+            anchor = now.replace(day=reset_day)
         else:
+            anchor = now
+        next_due = self._next_chore_occurrence(chore_info, anchor, now)
+        if next_due is None:
             return
 
-        # Ensure next_due is always in the future
-        if next_due <= now:
-            if freq == "daily":
-                next_due += timedelta(days=1)
-            elif freq == "weekly":
-                next_due += timedelta(weeks=1)
-            elif freq == "monthly":
-                days_in_next_month = monthrange(next_due.year, next_due.month)[1]
-                next_due += timedelta(days=days_in_next_month)
-
         chore_info["state"] = CHORE_STATE_PENDING
         chore_info["assigned_to"] = None
-        chore_info["due_date"] = next_due.isoformat()
+        chore_info["due_date"] = next_due
 
         LOGGER.debug(
             f"Chore ID '{chore_info['internal_id']}' recurring frequency '{freq}' updated to next due date '{chore_info['due_date']}'"
         )
 
-    def _handle_scheduled_tasks(self):
-        """Check overdue chores, handle recurring resets."""
-        now = dt_util.utcnow()
-        for chore_id, chore_info in self.chores_data.items():
-            # Overdue check
-            due_str = chore_info.get("due_date")
-            if due_str and chore_info["state"] == CHORE_STATE_PENDING:
-                due_date = dt_util.parse_datetime(due_str)
-                # Fallback parse if parse_datetime returned None:
-                if not due_date:
-                    due_date = datetime.fromisoformat(due_str)
-                if now > due_date:
-                    chore_info["state"] = CHORE_STATE_OVERDUE
-                    LOGGER.info("Chore ID '%s' is overdue", chore_id)
+    def _chore_due_instant(self, chore_info: dict) -> Optional[datetime]:
+        """Return the instant a pending chore becomes overdue.
+
+        Returns:
+            datetime: The aware due date, or None if the chore is not pending or
+            has no due date.
 
+        """
+        if chore_info.get("state") != CHORE_STATE_PENDING:
+            return None
+        return chore_info.get("due_date")
+
+    def _sync_due_scheduler(self, changes: dict):
+        """Re-arm the due date timer for the chores in a change set."""
+        if DATA_CHORES not in changes:
+            return
+        chore_ids = changes[DATA_CHORES]
+        if chore_ids is None:
+            self._due_scheduler.async_rebuild(
+                (chore_id, self._chore_due_instant(chore_info))
+                for chore_id, chore_info in self.chores_data.items()
+            )
+            return
+        for chore_id in chore_ids:
+            chore_info = self.chores_data.get(chore_id)
+            self._due_scheduler.async_update(
+                chore_id, self._chore_due_instant(chore_info) if chore_info else None
+            )
+
+    @callback
+    def _async_handle_due_chores(self, chore_ids: list[str], now: datetime):
+        """Mark chores overdue when the due date timer fires."""
+        with self.transaction("mark_overdue"):
+            for chore_id in chore_ids:
+                chore_info = self.chores_data.get(chore_id)
+                if not chore_info:
+                    continue
+                due_date = self._chore_due_instant(chore_info)
+                if due_date is None or now < due_date:
+                    continue
+                chore_info["state"] = CHORE_STATE_OVERDUE
+                self._mark_changed(DATA_CHORES, chore_id)
+                LOGGER.info("Chore ID '%s' is overdue", chore_id)
+
+    @_transactional("update_kid_points")
     def update_kid_points(self, kid_id: str, new_points: float):
         """Set a kid's points to 'new_points', updating daily/weekly/monthly counters accordingly."""
         kid_info = self.kids_data.get(kid_id)
@@ -1163,13 +1395,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 "Updated max_points_ever for kid '%s' to %s", kid_id, new_points
             )
 
-        # Re-check badges if desired
+        # Award badges whose thresholds were just crossed
         self._check_badges_for_kid(kid_id)
-        self._recalculate_all_badges()
 
-        # Persist changes
-        self._persist()
-        self.async_set_updated_data(self._data)
+        # Record changes; persisted when the transaction commits
+        self._mark_changed(DATA_KIDS, kid_id)
 
         LOGGER.debug(
             "update_kid_points: Kid '%s' changed from %.2f to %.2f, delta=%.2f",
@@ -1181,6 +1411,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
     # ------------------ REWARDS ------------------
 
+    @_transactional("redeem_reward")
     def redeem_reward(self, parent_name: str, kid_id: str, reward_id: str):
         """Kid claims a reward => mark as pending approval without deducting points."""
         reward = self.rewards_data.get(reward_id)
@@ -1195,7 +1426,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
         cost = reward.get("cost", 0)
 
-        if kid_info["points"] < cost:
+        # Points of rewards already awaiting approval are reserved
+        if self.get_available_points(kid_id) < cost:
             LOGGER.warning(
                 "Redeem Reward: Kid ID '%s' does not have enough points", kid_id
             )
@@ -1209,10 +1441,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         # Initialize redeemed_rewards if not present
         kid_info.setdefault("redeemed_rewards", [])
 
-        # Notify parent for approval asynchronously
-        self.hass.async_create_task(
-            self.notify_parent_for_reward_approval(kid_id, reward_id)
-        )
+        # Ask the kid's parents for approval through the digest pipeline
+        self.notifier.async_request(APPROVAL_KIND_REWARD, kid_id, reward_id)
 
         LOGGER.info(
             "Reward '%s' claimed by kid '%s' and pending approval by parent '%s'",
@@ -1226,7 +1456,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             {
                 "kid_id": kid_id,
                 "reward_id": reward_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": dt_util.utcnow(),
             }
         )
 
@@ -1248,10 +1478,30 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             kid_id,
         )
 
-        # Persist changes
-        self._persist()
-        self.async_set_updated_data(self._data)
+        # Record changes; persisted when the transaction commits
+        self._mark_changed(DATA_KIDS, kid_id)
+        self._mark_changed(DATA_PENDING_REWARD_APPROVALS)
+
+    def get_available_points(self, kid_id: str) -> float:
+        """Return a kid's points minus the cost of rewards awaiting approval.
+
+        Args:
+            kid_id (str): Internal ID of the kid.
+
+        Returns:
+            float: Points the kid can still spend; 0 if the kid is unknown.
+
+        """
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            return 0
+        reserved = sum(
+            self.rewards_data.get(reward_id, {}).get("cost", 0)
+            for reward_id in kid_info.get("pending_rewards", [])
+        )
+        return kid_info["points"] - reserved
 
+    @_transactional("approve_reward")
     def approve_reward(self, parent_name: str, kid_id: str, reward_id: str):
         """Parent approves the reward redemption => deduct points."""
         kid_info = self.kids_data.get(kid_id)
@@ -1322,12 +1572,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         # Check badges after deduction
         self._check_badges_for_kid(kid_id)
 
-        # Remove from pending approvals
-        self._data[DATA_PENDING_REWARD_APPROVALS] = [
-            approval
-            for approval in self._data[DATA_PENDING_REWARD_APPROVALS]
-            if not (approval["kid_id"] == kid_id and approval["reward_id"] == reward_id)
-        ]
+        # Remove the matching pending approval; one per pending_rewards entry
+        self._data[DATA_PENDING_REWARD_APPROVALS].remove_oldest(kid_id, reward_id)
         LOGGER.debug(
             "Removed reward ID '%s' for kid ID '%s' from pending approvals",
             reward_id,
@@ -1346,18 +1592,15 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             kid_id,
         )
 
-        # Persist changes
-        self._persist()
-        self.async_set_updated_data(self._data)
+        # Record changes; persisted when the transaction commits
+        self._mark_changed(DATA_KIDS, kid_id)
+        self._mark_changed(DATA_PENDING_REWARD_APPROVALS)
 
+    @_transactional("disapprove_reward")
     def disapprove_reward(self, parent_name: str, kid_id: str, reward_id: str):
         """Disapprove a reward for kid_id."""
-        # Remove from pending rewards
-        self._data[DATA_PENDING_REWARD_APPROVALS] = [
-            approval
-            for approval in self._data[DATA_PENDING_REWARD_APPROVALS]
-            if not (approval["kid_id"] == kid_id and approval["reward_id"] == reward_id)
-        ]
+        # Remove one pending approval; one per pending_rewards entry
+        self._data[DATA_PENDING_REWARD_APPROVALS].remove_oldest(kid_id, reward_id)
         LOGGER.debug(
             "Removed reward ID '%s' for kid ID '%s' from pending approvals after disapproval",
             reward_id,
@@ -1374,9 +1617,10 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 kid_id,
             )
 
-        # Persist changes
-        self._persist()
-        self.async_set_updated_data(self._data)
+        # Record changes; persisted when the transaction commits
+        if kid_info:
+            self._mark_changed(DATA_KIDS, kid_id)
+        self._mark_changed(DATA_PENDING_REWARD_APPROVALS)
 
     # ------------------ BADGES ------------------
     def _update_kid_multiplier(self, kid_id: str):
@@ -1387,9 +1631,12 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
         # Find all badges earned by the kid
         earned_badges = [
-            badge
-            for badge in self.badges_data.values()
-            if kid_id in badge.get("earned_by", [])
+            self.badges_data[badge_id]
+            for badge_id in (
+                self.get_id_by_name(DATA_BADGES, badge_name)
+                for badge_name in kid_info.get("badges", [])
+            )
+            if badge_id in self.badges_data
         ]
 
         if not earned_badges:
@@ -1410,38 +1657,30 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         )
 
     def _check_badges_for_kid(self, kid_id: str):
-        """Evaluate all badge thresholds for kid.
+        """Award the badges whose thresholds the kid just crossed.
 
-        - If threshold met (points or chore_count), mark as earned.
+        - Points badges are measured against max_points_ever, chore count badges
+          against completed_chores_total.
         - Once earned, do not remove even if points go below threshold again.
+        - Changes are marked but not persisted; the caller persists once.
         """
         kid_info = self.kids_data.get(kid_id)
         if not kid_info:
             return
 
-        for badge_id, badge_data in self.badges_data.items():
-            if kid_id in badge_data.get("earned_by", []):
-                continue  # Skip already earned badges
+        for badge_id in self._badge_engine.crossed(kid_id, kid_info):
+            if self._award_badge(kid_id, badge_id):
+                self._mark_changed(DATA_KIDS, kid_id)
+                self._mark_changed(DATA_BADGES, badge_id)
 
-            threshold_type = badge_data.get("threshold_type")
-            threshold_value = badge_data.get("threshold_value", 0)
+    def _award_badge(self, kid_id: str, badge_id: str) -> bool:
+        """Add the badge to kid's 'earned_by' and kid's 'badges' list.
 
-            if threshold_type == BADGE_THRESHOLD_TYPE_POINTS:
-                if kid_info["points"] >= threshold_value:
-                    self._award_badge(kid_id, badge_id)
-            elif threshold_type == BADGE_THRESHOLD_TYPE_CHORE_COUNT:
-                chore_count_type = badge_data.get("chore_count_type", "daily")
-                if chore_count_type == "total":
-                    chore_count = kid_info.get("completed_chores_total", 0)
-                else:
-                    chore_count = kid_info.get(
-                        f"completed_chores_{chore_count_type}", 0
-                    )
-                if chore_count >= threshold_value:
-                    self._award_badge(kid_id, badge_id)
+        Returns:
+            bool: True if the badge was newly awarded; the caller marks the
+                changed kid and badge.
 
-    def _award_badge(self, kid_id: str, badge_id: str):
-        """Add the badge to kid's 'earned_by' and kid's 'badges' list."""
+        """
         badge = self.badges_data.get(badge_id)
         if not badge:
             LOGGER.error(
@@ -1449,11 +1688,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 badge_id,
                 kid_id,
             )
-            return
+            return False
 
         if kid_id in badge.get("earned_by", []):
             LOGGER.debug("Kid ID '%s' already earned badge ID '%s'", kid_id, badge_id)
-            return
+            return False
 
         badge.setdefault("earned_by", []).append(kid_id)
         kid_info = self.kids_data.get(kid_id, {})
@@ -1467,21 +1706,19 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
             # Update kid's multiplier based on the highest badge achieved
             self._update_kid_multiplier(kid_id)
+            return True
 
-            self._persist()
-            self.async_set_updated_data(self._data)
-        else:
-            LOGGER.error("Cannot award badge: Kid ID '%s' not found", kid_id)
+        LOGGER.error("Cannot award badge: Kid ID '%s' not found", kid_id)
+        return False
 
+    @_transactional("add_badge")
     def add_badge(self, badge_def: dict):
         """Add new badge at runtime if needed."""
         badge_name = badge_def.get("name")
         if not badge_name:
             LOGGER.warning("Add badge: Badge must have a name")
             return
-        if any(
-            badge_data["name"] == badge_name for badge_data in self.badges_data.values()
-        ):
+        if self.get_id_by_name(DATA_BADGES, badge_name):
             LOGGER.warning("Add badge: Badge '%s' already exists", badge_name)
             return
         internal_id = str(uuid.uuid4())
@@ -1503,18 +1740,33 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             "description": badge_def.get("description", ""),
             "internal_id": internal_id,
         }
+        self._index_name(DATA_BADGES, internal_id, badge_name)
         LOGGER.debug("Added new badge '%s' with ID: %s", badge_name, internal_id)
-        self._persist()
-        self.async_set_updated_data(self._data)
 
+        # Badge definitions changed => full recompute
+        self._recalculate_all_badges()
+
+    @_transactional("recalculate_badges")
     def _recalculate_all_badges(self):
         """Global re-check of all badges for all kids.
 
         If a kid's max_points_ever or total chores meets the threshold, award badge.
         Otherwise, remove it.
-        Called after OptionsFlow changes or new badges are added.
+        Called after OptionsFlow changes or new badges are added, i.e. only when
+        badge definitions change; counter changes use _check_badges_for_kid.
         """
         LOGGER.info("Starting global badge recalculation")
+        self._badge_engine.rebuild(self._data[DATA_BADGES])
+
+        # Awards before the recompute; only records that differ are marked
+        previous_earned_by = {
+            b_id: b_info.get("earned_by", [])
+            for b_id, b_info in self._data[DATA_BADGES].items()
+        }
+        previous_badges = {
+            k_id: (k_info.get("badges", []), k_info.get("points_multiplier", 1.0))
+            for k_id, k_info in self._data[DATA_KIDS].items()
+        }
 
         # Clear current earned_by references
         for b_id, b_info in self._data[DATA_BADGES].items():
@@ -1523,59 +1775,28 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         # Clear each kid's 'badges' list
         for k_id, k_info in self._data[DATA_KIDS].items():
             k_info["badges"] = []
+            k_info["points_multiplier"] = 1.0
 
         # Re-check thresholds
-        for b_id, b_info in self._data[DATA_BADGES].items():
-            badge_name = b_info.get("name", f"Badge {b_id}")
-            threshold_type = b_info.get("threshold_type", "points")
-            threshold_value = b_info.get("threshold_value", 0)
-
-            for k_id, k_info in self._data[DATA_KIDS].items():
-                kid_name = k_info.get("name", f"Kid {k_id}")
-
-                if threshold_type == "points":
-                    max_points_ever = k_info.get("max_points_ever", 0)
-                    if max_points_ever >= threshold_value:
-                        self._award_badge(k_id, b_id)
-                        LOGGER.debug(
-                            "Kid '%s' meets threshold for badge '%s' (points >= %s)",
-                            kid_name,
-                            badge_name,
-                            threshold_value,
-                        )
-                    else:
-                        LOGGER.debug(
-                            "Kid '%s' does NOT meet threshold for badge '%s': max_points_ever=%s < %s",
-                            kid_name,
-                            badge_name,
-                            max_points_ever,
-                            threshold_value,
-                        )
-
-                elif threshold_type == "chore_count":
-                    chore_count = k_info.get("completed_chores_total", 0)
-
-                    if chore_count >= threshold_value:
-                        self._award_badge(k_id, b_id)
-                        LOGGER.debug(
-                            "Kid '%s' meets chore-count threshold for badge '%s'",
-                            kid_name,
-                            badge_name,
-                        )
-                    else:
-                        LOGGER.debug(
-                            "Kid '%s' does NOT meet chore-count threshold for badge '%s': %s < %s",
-                            kid_name,
-                            badge_name,
-                            chore_count,
-                            threshold_value,
-                        )
+        for k_id, k_info in self._data[DATA_KIDS].items():
+            for b_id in self._badge_engine.earned(k_id, k_info):
+                self._award_badge(k_id, b_id)
+                LOGGER.debug(
+                    "Kid '%s' meets threshold for badge '%s'",
+                    k_info.get("name", f"Kid {k_id}"),
+                    self.badges_data[b_id].get("name", f"Badge {b_id}"),
+                )
 
-        self._persist()
-        self.async_set_updated_data(self._data)
+        for b_id, b_info in self._data[DATA_BADGES].items():
+            if b_info["earned_by"] != previous_earned_by[b_id]:
+                self._mark_changed(DATA_BADGES, b_id)
+        for k_id, k_info in self._data[DATA_KIDS].items():
+            if (k_info["badges"], k_info["points_multiplier"]) != previous_badges[k_id]:
+                self._mark_changed(DATA_KIDS, k_id)
         LOGGER.info("Badge recalculation complete")
 
     # ------------------ PENALTIES ------------------
+    @_transactional("apply_penalty")
     def apply_penalty(self, parent_name: str, kid_id: str, penalty_id: str):
         """Apply penalty => negative 'points' to reduce kid's points."""
         penalty = self.penalties_data.get(penalty_id)
@@ -1604,20 +1825,88 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             kid_id,
         )
 
-        # Persist changes
-        self._persist()
-        self.async_set_updated_data(self._data)
+        # Record changes; persisted when the transaction commits
+        self._mark_changed(DATA_KIDS, kid_id)
+
+    @_transactional("adjust_family_points")
+    def adjust_family_points(
+        self,
+        parent_name: str,
+        kid_ids: list[str],
+        points_delta: float = 0.0,
+        penalty_id: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Apply a penalty and/or a points delta to several kids at once.
+
+        Every kid and the penalty are validated before any kid is changed, so
+        the adjustment applies to all kids or to none. Each kid's points are
+        updated once with the combined delta, so badges are evaluated once per
+        kid, and the whole adjustment is persisted and notified once.
+
+        Args:
+            parent_name (str): Name of the parent applying the adjustment.
+            kid_ids (list): Internal IDs of the kids to adjust.
+            points_delta (float): Points added to each kid; negative to deduct.
+            penalty_id (str, optional): Penalty applied to each kid as well.
+
+        Returns:
+            list: One result per kid with its points before and after.
+
+        Raises:
+            HomeAssistantError: If a kid or the penalty does not exist.
 
+        """
+        penalty_points = 0.0
+        if penalty_id is not None:
+            penalty = self.penalties_data.get(penalty_id)
+            if not penalty:
+                raise HomeAssistantError(f"Penalty with ID '{penalty_id}' not found.")
+            penalty_points = penalty.get("points", 0)
+
+        kid_ids = list(dict.fromkeys(kid_ids))
+        for kid_id in kid_ids:
+            if kid_id not in self.kids_data:
+                raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
+
+        results = []
+        for kid_id in kid_ids:
+            kid_info = self.kids_data[kid_id]
+            points_before = kid_info["points"]
+            self.update_kid_points(
+                kid_id, points_before + points_delta + penalty_points
+            )
+
+            if penalty_id is not None:
+                applies = kid_info["penalty_applies"]
+                applies[penalty_id] = applies.get(penalty_id, 0) + 1
+                self._mark_changed(DATA_KIDS, kid_id)
+
+            results.append(
+                {
+                    "kid_id": kid_id,
+                    "kid_name": kid_info["name"],
+                    "points_before": points_before,
+                    "points_after": kid_info["points"],
+                }
+            )
+
+        LOGGER.info(
+            "Adjusted points of %d kid(s) by %.2f%s, applied by parent '%s'",
+            len(results),
+            points_delta + penalty_points,
+            f" (penalty '{penalty_id}')" if penalty_id else "",
+            parent_name,
+        )
+        return results
+
+    @_transactional("add_penalty")
     def add_penalty(self, penalty_def: dict):
         """Add new penalty at runtime if needed."""
         penalty_name = penalty_def.get("name")
         if not penalty_name:
             LOGGER.warning("Add penalty: Penalty must have a name")
             return
-        if any(
-            penalty_data["name"] == penalty_name
-            for penalty_data in self.penalties_data.values()
-        ):
+        if self.get_id_by_name(DATA_PENALTIES, penalty_name):
             LOGGER.warning("Add penalty: Penalty '%s' already exists", penalty_name)
             return
         internal_id = str(uuid.uuid4())
@@ -1628,195 +1917,147 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             "icon": penalty_def.get("icon", DEFAULT_PENALTY_ICON),
             "internal_id": internal_id,
         }
+        self._index_name(DATA_PENALTIES, internal_id, penalty_name)
         LOGGER.debug("Added new penalty '%s' with ID: %s", penalty_name, internal_id)
-        self._persist()
-        self.async_set_updated_data(self._data)
+        self._mark_changed(DATA_PENALTIES, internal_id)
 
     # ------------------ RESET CHORES ------------------
-    async def _reset_all_chore_counts(self, now: datetime):
-        """Trigger resets based on the current time for all frequencies.
-
-        Args:
-            now (datetime): The current datetime.
-
-        """
-        await self._reset_chore_counts("daily", now)
-        await self._reset_chore_counts("weekly", now)
-        await self._reset_chore_counts("monthly", now)
-
-        # Reset rewards for daily resets
-        if now.hour == 0:
-            await self._reset_daily_reward_statuses()
-
-    async def _reset_daily_reward_statuses(self):
-        """Reset all kids' reward states daily.
-
-        Clears pending and approved states if you'd like them ephemeral.
-        """
-        LOGGER.info("Executing _reset_daily_reward_statuses for all kids and rewards")
+    @_transactional("reset_all_chores")
+    def reset_all_chores(self):
+        """Reset every chore to pending and clear all claims and approvals."""
+        for chore_info in self.chores_data.values():
+            chore_info["state"] = CHORE_STATE_PENDING
 
-        # Remove from global pending reward approvals
-        self._data[DATA_PENDING_REWARD_APPROVALS] = []
-        LOGGER.debug("Cleared all pending reward approvals globally")
+        # Remove all chore approvals/claims for each kid
+        self.chore_matrix.clear()
 
-        # For each kid, clear pending/approved reward lists to reflect daily reset
-        for kid_id, kid_info in self.kids_data.items():
-            # If you want to fully reset, remove everything from pending/approved
-            kid_info["pending_rewards"] = []
-            kid_info["redeemed_rewards"] = []
+        # Clear the pending approvals queue
+        self._data[DATA_PENDING_CHORE_APPROVALS].clear()
 
-            LOGGER.debug(
-                "Cleared daily reward statuses for kid ID '%s' (%s)",
-                kid_id,
-                kid_info.get("name", "Unknown"),
-            )
+        self._mark_changed(DATA_CHORES)
+        self._mark_changed(DATA_KIDS)
+        self._mark_changed(DATA_PENDING_CHORE_APPROVALS)
 
-        # Persist and notify changes
-        self._persist()
-        new_data = copy.deepcopy(self._data)
-        self.async_set_updated_data(new_data)
-        LOGGER.info("Daily reward statuses have been reset")
+    async def _reset_all_chore_counts(self, now: datetime):
+        """Run every reset whose scheduled time passed since it last ran.
 
-    async def _reset_chore_counts(self, frequency: str, now: datetime):
-        """Reset chore counts and statuses based on the recurring frequency.
+        Called by the midnight timer and once at startup. Resets missed while
+        Home Assistant was not running are run once, however many days were
+        missed. All due resets are applied together in one pass.
 
         Args:
-            frequency (str): The frequency type ('daily', 'weekly', 'monthly').
             now (datetime): The current datetime.
 
         """
+        due = self._due_resets(now)
+        if due:
+            self._apply_resets(due, now)
+        elif self._changes:
+            # Newly tracked reset instants
+            self._persist()
 
-        # Determine which chores to reset based on frequency
-        if frequency == "daily":
-            target_frequencies = ["daily", "none"]
-            reset_day_check = True
-        elif frequency == "weekly":
-            target_frequencies = ["weekly"]
-            reset_day_check = now.weekday() == DEFAULT_WEEKLY_RESET_DAY
-        elif frequency == "monthly":
-            target_frequencies = ["monthly"]
-            days_in_month = monthrange(now.year, now.month)[1]
-            reset_day = min(DEFAULT_MONTHLY_RESET_DAY, days_in_month)
-            reset_day_check = now.day == reset_day
-        else:
-            LOGGER.warning(f"Unknown frequency '{frequency}'. No resets performed.")
-            return
-
-        if not reset_day_check:
-            LOGGER.debug(f"No reset needed for frequency '{frequency}' today.")
-            return
-
-        # Reset counts for the specified frequency
-        for kid_id, kid_info in self.kids_data.items():
-            if frequency == "daily":
-                kid_info["completed_chores_today"] = 0
-                kid_info["points_earned_today"] = 0
-            elif frequency == "weekly":
-                kid_info["completed_chores_weekly"] = 0
-                kid_info["points_earned_weekly"] = 0
-            elif frequency == "monthly":
-                kid_info["completed_chores_monthly"] = 0
-                kid_info["points_earned_monthly"] = 0
-
-        LOGGER.info(f"{frequency.capitalize()} chore counts have been reset")
-
-        # Reset chore statuses and clear approvals only for daily resets
-        if frequency == "daily":
-            await self._reset_daily_chore_statuses(target_frequencies)
-
-        # Update due dates for recurring chores that have a due_date
-        for chore_id, chore_info in self.chores_data.items():
-            freq_chore = chore_info.get("recurring_frequency", "none")
-            due_date_str = chore_info.get("due_date")
-            if freq_chore == frequency and due_date_str:
-                # Chores with a recurring frequency and a due_date are handled upon approval only
-                LOGGER.debug(
-                    "Skipping auto-reset for chore '%s' with frequency '%s' and due_date '%s'",
-                    chore_info.get("name", chore_id),
-                    freq_chore,
-                    due_date_str,
-                )
-                continue
-            elif freq_chore == frequency and not due_date_str:
-                # Chores with recurring frequency but no due_date are handled normally
-                self._handle_recurring_chore(chore_info)
-
-        # Persist the changes
-        self._persist()
-
-        # Create a deep copy to ensure changes are detected
-        new_data = copy.deepcopy(self._data)
+    def _due_resets(self, now: datetime) -> list[str]:
+        """Return the reset frequencies whose scheduled time passed since they ran.
 
-        # Update the coordinator's data with the new copy
-        self.async_set_updated_data(new_data)
+        Args:
+            now (datetime): The current datetime.
 
-        LOGGER.debug(
-            f"{frequency.capitalize()} chore counts have been updated in the coordinator."
-        )
+        Returns:
+            list: Frequencies to reset, e.g. ['daily', 'weekly'].
 
-    async def _reset_daily_chore_statuses(self, target_frequencies: list):
-        """Reset chore statuses and clear approved/claimed chores for daily resets.
+        """
+        last_resets = self._data.setdefault(DATA_LAST_RESETS, {})
+        due = []
+        for frequency in (FREQUENCY_DAILY, FREQUENCY_WEEKLY, FREQUENCY_MONTHLY):
+            scheduled = last_reset_instant(frequency, now)
+            last_reset = last_resets.get(frequency)
+            if last_reset is None:
+                # Never tracked (new install or upgrade): nothing is known to be
+                # missed, so start tracking from the latest scheduled reset.
+                last_resets[frequency] = scheduled
+                self._mark_changed(DATA_LAST_RESETS, frequency)
+            elif last_reset < scheduled:
+                due.append(frequency)
+        return due
+
+    @_transactional("periodic_reset")
+    def _apply_resets(self, frequencies: list[str], now: datetime):
+        """Apply the daily, weekly and monthly resets that are due in one pass.
+
+        - Every due frequency zeroes the kids' matching counters.
+        - Chores recurring at a due frequency without a due_date get a new due
+          date; chores with a due_date are rescheduled upon approval only.
+        - The daily reset also returns daily and non-recurring chores to
+          pending, clears their approvals and claims, and clears the kids'
+          pending and redeemed rewards.
 
         Args:
-            target_frequencies (list): Frequencies of chores to reset (e.g., ["daily", "none"]).
+            frequencies (list): Due frequencies, e.g. ['daily', 'weekly'].
+            now (datetime): The current datetime.
 
         """
-        LOGGER.info("Executing _reset_daily_chore_statuses")
+        daily = FREQUENCY_DAILY in frequencies
+        LOGGER.info("Executing resets for: %s", ", ".join(frequencies))
 
-        # Reset chore statuses and clear approved/claimed chores for chores with specified frequencies
+        # Chores: one pass for status resets and new due dates
+        daily_chore_ids = set()  # Daily and non-recurring chores
+        reset_chore_ids = set()  # Chores returned to pending
         for chore_id, chore_info in self.chores_data.items():
-            if chore_info.get("recurring_frequency") in target_frequencies:
+            freq_chore = chore_info.get("recurring_frequency", FREQUENCY_NONE)
+            if daily and freq_chore in (FREQUENCY_DAILY, FREQUENCY_NONE):
+                daily_chore_ids.add(chore_id)
                 if chore_info["state"] not in [
                     CHORE_STATE_PENDING,
                     CHORE_STATE_OVERDUE,
                 ]:
-                    previous_state = chore_info["state"]
-                    chore_info["state"] = CHORE_STATE_PENDING
                     LOGGER.debug(
                         "Resetting status of chore ID '%s' from '%s' to '%s'",
                         chore_id,
-                        previous_state,
+                        chore_info["state"],
                         CHORE_STATE_PENDING,
                     )
+                    chore_info["state"] = CHORE_STATE_PENDING
+                    reset_chore_ids.add(chore_id)
+                    self._mark_changed(DATA_CHORES, chore_id)
 
-                    # Remove chore_id from all kids' approved_chores and claimed_chores
-                    for kid_id, kid_info in self.kids_data.items():
-                        if chore_id in kid_info.get("approved_chores", []):
-                            kid_info["approved_chores"].remove(chore_id)
-                            LOGGER.debug(
-                                "Removed chore ID '%s' from approved_chores for kid ID '%s'",
-                                chore_id,
-                                kid_id,
-                            )
-                        if chore_id in kid_info.get("claimed_chores", []):
-                            kid_info["claimed_chores"].remove(chore_id)
-                            LOGGER.debug(
-                                "Removed chore ID '%s' from claimed_chores for kid ID '%s'",
-                                chore_id,
-                                kid_id,
-                            )
+            if freq_chore in frequencies:
+                if chore_info.get("due_date"):
+                    # Chores with a recurring frequency and a due_date are handled upon approval only
+                    LOGGER.debug(
+                        "Skipping auto-reset for chore '%s' with frequency '%s' and due_date '%s'",
+                        chore_info.get("name", chore_id),
+                        freq_chore,
+                        chore_info["due_date"],
+                    )
+                else:
+                    self._handle_recurring_chore(chore_info)
+                    self._mark_changed(DATA_CHORES, chore_id)
+
+        # Kids: one column fill for chore flags, one pass for counters and rewards
+        self.chore_matrix.clear_chores(reset_chore_ids)
+        for kid_info in self.kids_data.values():
+            for frequency in frequencies:
+                for counter in RESET_COUNTERS[frequency]:
+                    kid_info[counter] = 0
+            if daily:
+                kid_info["pending_rewards"] = []
+                kid_info["redeemed_rewards"] = []
+        self._mark_changed(DATA_KIDS)
+
+        if daily:
+            self._data[DATA_PENDING_CHORE_APPROVALS].remove_where(
+                lambda approval: approval["chore_id"] in daily_chore_ids
+            )
+            self._data[DATA_PENDING_REWARD_APPROVALS].clear()
+            self._mark_changed(DATA_PENDING_CHORE_APPROVALS)
+            self._mark_changed(DATA_PENDING_REWARD_APPROVALS)
 
-        LOGGER.info(
-            "Chore statuses, approved_chores, and claimed_chores have been reset for daily chores"
-        )
+        last_resets = self._data.setdefault(DATA_LAST_RESETS, {})
+        for frequency in frequencies:
+            last_resets[frequency] = now
+            self._mark_changed(DATA_LAST_RESETS, frequency)
 
-        # Clear pending chore approvals for chores with 'daily' or 'none' frequency
-        daily_chore_ids = [
-            chore_id
-            for chore_id, chore_info in self.chores_data.items()
-            if chore_info.get("recurring_frequency") in ["daily", "none"]
-        ]
-        self._data[DATA_PENDING_CHORE_APPROVALS] = [
-            approval
-            for approval in self._data[DATA_PENDING_CHORE_APPROVALS]
-            if approval["chore_id"] not in daily_chore_ids
-        ]
-        LOGGER.debug(
-            "Cleared pending chore approvals for chores with 'daily' or 'none' frequency"
-        )
-
-        # Persist all changes
-        self._persist()
+        LOGGER.info("Resets completed for: %s", ", ".join(frequencies))
 
     def _reschedule_next_due_date_on_approval(self, chore_info: dict):
         """Reschedule the next due date based on the recurring frequency after approval.
@@ -1825,32 +2066,15 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             chore_info (dict): The chore's data.
         """
         freq = chore_info.get("recurring_frequency", "none")
-        due_date_str = chore_info.get("due_date")
-        if not freq or freq == "none" or not due_date_str:
+        original_due = chore_info.get("due_date")
+        if not freq or freq == "none" or not original_due:
             # No recurring frequency or no due_date set; nothing to do
             return
 
-        # Parse the original due_date
-        try:
-            original_due = dt_util.parse_datetime(
-                due_date_str
-            ) or datetime.fromisoformat(due_date_str)
-        except ValueError:
-            LOGGER.warning(
-                "Unable to parse due_date '%s' for chore '%s'",
-                due_date_str,
-                chore_info.get("internal_id"),
-            )
-            return
-
-        # Calculate the next due date based on frequency
-        if freq == "daily":
-            next_due = original_due + timedelta(days=1)
-        elif freq == "weekly":
-            next_due = original_due + timedelta(weeks=1)
-        elif freq == "monthly":
-            next_due = self._add_one_month(original_due)
-        else:
+        next_due = self._next_chore_occurrence(
+            chore_info, original_due, max(original_due, dt_util.utcnow())
+        )
+        if next_due is None:
             LOGGER.warning(
                 "Unknown recurring_frequency '%s' for chore '%s'",
                 freq,
@@ -1858,18 +2082,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
             return
 
-        now = dt_util.utcnow()
-        # If the new due date is in the past, keep adding frequency until it's in the future
-        while next_due <= now:
-            if freq == "daily":
-                next_due += timedelta(days=1)
-            elif freq == "weekly":
-                next_due += timedelta(weeks=1)
-            elif freq == "monthly":
-                next_due = self._add_one_month(next_due)
-
         # Update the chore's due_date and state
-        chore_info["due_date"] = next_due.isoformat()
+        chore_info["due_date"] = next_due
         chore_info["state"] = CHORE_STATE_PENDING  # Reset to pending for the new cycle
 
         LOGGER.debug(
@@ -1880,74 +2094,376 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         )
 
     # ------------------ STORAGE ------------------
-    def _persist(self):
-        """Save to persistent storage."""
-        self.storage_manager.set_data(self._data)
-        self.hass.async_create_task(self.storage_manager.async_save())
+    @contextmanager
+    def transaction(self, operation: Optional[str] = None) -> Iterator[None]:
+        """Group mutations into one persist and one listener notification.
 
-    # ------------------ NOTIFICATION ------------------
+        Transactions nest; mutators called inside an open transaction only
+        record their changes. When the outermost transaction exits, the
+        collected changes are persisted once and listeners are notified once.
+        Changes are committed even if the block raises, so storage matches the
+        in-memory data.
 
-    async def notify_parent_for_reward_approval(self, kid_id: str, reward_id: str):
-        """Send a notification to the parent requesting reward approval."""
-        kid_info = self.kids_data.get(kid_id)
-        reward_info = self.rewards_data.get(reward_id)
+        Args:
+            operation (str, optional): Name recorded in the journal. The first
+                name given within the outermost transaction is used.
 
-        if not kid_info or not reward_info:
-            LOGGER.warning(
-                "Notification: Kid ID '%s' or Reward ID '%s' not found",
-                kid_id,
-                reward_id,
-            )
+        """
+        if self._transaction_operation is None:
+            self._transaction_operation = operation
+        self._transaction_depth += 1
+        try:
+            yield
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self._commit()
+
+    def _commit(self):
+        """Persist and notify for the outermost transaction."""
+        operation, self._transaction_operation = self._transaction_operation, None
+        requested, self._persist_requested = self._persist_requested, False
+        if not self._changes and not requested:
             return
+        changes = dict(self._changes)
+        self._persist(operation)
+        if changes:
+            self.async_publish_changes(changes)
+        else:
+            self.async_set_updated_data(self.snapshot())
+
+    # ------------------ CHANGE TOPICS ------------------
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates, optionally limited to change topics.
+
+        Entities pass change_topics(...) as their coordinator context. They are
+        still notified by full refreshes, but committed transactions only
+        notify the listeners subscribed to the changed records.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+        topics = context if isinstance(context, frozenset) else None
 
-        parent_user_id = kid_info.get("ha_user_id")
-        if not parent_user_id:
-            LOGGER.warning(
-                "Notification: Parent user ID for kid '%s' not set",
-                kid_info.get("name"),
-            )
-            return
+        if topics is None:
+            self._untargeted_listeners.add(update_callback)
+        else:
+            for collection, item_id in topics:
+                self._topic_listeners.setdefault(collection, {}).setdefault(
+                    item_id, set()
+                ).add(update_callback)
+
+        @callback
+        def remove_topic_listener() -> None:
+            remove_listener()
+            if topics is None:
+                self._untargeted_listeners.discard(update_callback)
+                return
+            for collection, item_id in topics:
+                listeners = self._topic_listeners.get(collection, {}).get(item_id)
+                if listeners is not None:
+                    listeners.discard(update_callback)
+                    if not listeners:
+                        del self._topic_listeners[collection][item_id]
+
+        return remove_topic_listener
+
+    @callback
+    def async_publish_changes(self, changes: dict[str, Optional[set]]):
+        """Notify only the listeners subscribed to the changed records.
 
-        parent_user = await self.hass.auth.async_get_user(parent_user_id)
-        if not parent_user:
-            LOGGER.warning(
-                "Notification: Parent user with ID '%s' not found",
-                parent_user_id,
-            )
-            return
+        Args:
+            changes (dict): Changed internal_ids keyed by data collection; None
+                means the whole collection changed.
 
-        # Define the notification message
-        message = (
-            f"Kid '{kid_info['name']}' has claimed the reward '{reward_info['name']}'. "
-            f"Please approve the redemption."
-        )
-        title = "KidsChores: Reward Approval Needed"
-
-        # Send the notification
-        await self.hass.components.persistent_notification.async_create(
-            self.hass,
-            message,
-            title=title,
-            notification_id=f"reward_approval_{reward_id}_{kid_id}",
+        """
+        self.data = self.snapshot()
+        callbacks: dict[CALLBACK_TYPE, None] = dict.fromkeys(
+            self._untargeted_listeners
         )
+        for collection, item_ids in changes.items():
+            collection_listeners = self._topic_listeners.get(collection, {})
+            if item_ids is None:
+                targets = list(collection_listeners.values())
+            else:
+                targets = [collection_listeners.get(None, ())]
+                targets.extend(
+                    collection_listeners.get(item_id, ()) for item_id in item_ids
+                )
+            for listeners in targets:
+                callbacks.update(dict.fromkeys(listeners))
 
         LOGGER.debug(
-            "Sent reward approval notification for reward '%s' claimed by kid '%s'",
-            reward_info["name"],
-            kid_info["name"],
+            "Publishing changes to %s to %d listener(s)",
+            list(changes),
+            len(callbacks),
         )
+        for update_callback in callbacks:
+            update_callback()
+
+    def snapshot(self) -> DataSnapshot:
+        """Return a new read-only snapshot of the data.
+
+        The snapshot shares the live records instead of copying them, so it is
+        cheap to publish after every change. Which records changed is tracked
+        by generation(), not by the snapshot.
+
+        Returns:
+            DataSnapshot: The view listeners receive as coordinator data.
+
+        """
+        self._version += 1
+        return DataSnapshot(self._data, self._version)
+
+    def _mark_changed(self, collection: str, item_id: Optional[str] = None):
+        """Record that an item, or a whole collection, changed.
+
+        Args:
+            collection (str): Data key (e.g. DATA_KIDS).
+            item_id (str, optional): Internal ID of the changed item. If omitted,
+                the whole collection is treated as changed.
+
+        """
+        self._generation += 1
+        self._collection_generations[collection] = self._generation
+        if item_id is None:
+            self._whole_generations[collection] = self._generation
+            self._changes[collection] = None
+            return
+        self._record_generations.setdefault(collection, {})[
+            item_id
+        ] = self._generation
+        changed = self._changes.setdefault(collection, set())
+        if changed is not None:
+            changed.add(item_id)
+
+    def generation(self, topics: frozenset) -> int:
+        """Return the latest generation among the records in change topics.
+
+        Every change to a record gives it a higher generation than any before,
+        so the result only stays the same if none of the records changed.
+
+        Args:
+            topics (frozenset): (collection, internal_id) pairs, as built by
+                change_topics(); an internal_id of None covers the collection.
+
+        Returns:
+            int: The generation; 0 if none of the records changed yet.
+
+        """
+        latest = 0
+        for collection, item_id in topics:
+            if item_id is None:
+                generation = self._collection_generations.get(collection, 0)
+            else:
+                generation = max(
+                    self._record_generations.get(collection, {}).get(item_id, 0),
+                    self._whole_generations.get(collection, 0),
+                )
+            latest = max(latest, generation)
+        return latest
+
+    def _persist(self, operation: Optional[str] = None):
+        """Persist pending changes.
+
+        If an operation name is given and the storage journal is enabled, the
+        changed items are appended to the journal. Otherwise a coalesced save of
+        the changed collections' shards is scheduled; several calls within the
+        save delay result in a single write per shard.
+
+        Inside a transaction the write is deferred to the outermost commit.
+
+        Args:
+            operation (str, optional): Name of the operation, recorded in the journal.
+
+        """
+        if self._transaction_depth:
+            self._persist_requested = True
+            return
+
+        self._sync_chore_lists()
+        self.storage_manager.set_data(self._data)
+        changes, self._changes = self._changes, {}
+        # Keep the due date timer in sync with changed chores
+        self._sync_due_scheduler(changes)
+
+        if operation and changes and self.storage_manager.journal_enabled:
+            record = self._build_journal_record(changes)
+            if record is not None:
+                self.storage_manager.async_append_journal(operation, record)
+                return
+
+        self.storage_manager.async_delay_save(list(changes) if changes else None)
+
+    def _build_journal_record(self, changes: dict) -> Optional[dict]:
+        """Build a journal record body from the changed items.
+
+        Returns None if a whole keyed collection changed; a snapshot is cheaper
+        than journaling every item in that case.
+        """
+        record: dict[str, dict] = {"set": {}, "delete": {}, "replace": {}}
+        for collection, item_ids in changes.items():
+            current = self._data.get(collection)
+            if item_ids is None:
+                if isinstance(current, dict):
+                    return None
+                record["replace"][collection] = approvals_as_list(current)
+                continue
+            for item_id in item_ids:
+                if current and item_id in current:
+                    record["set"].setdefault(collection, {})[item_id] = current[
+                        item_id
+                    ]
+                else:
+                    record["delete"].setdefault(collection, []).append(item_id)
+        return {section: items for section, items in record.items() if items}
+
+    # ------------------ CHORE STATES ------------------
+    def _sync_chore_lists(self):
+        """Write changed chore flags back to the kids' stored chore lists.
+
+        The chore matrix is authoritative in memory; the claimed_chores and
+        approved_chores lists only carry its flags into storage, so only the
+        lists of kids whose rows changed since the last write are rebuilt.
+        """
+        for kid_id in self.chore_matrix.pop_dirty():
+            kid_info = self.kids_data.get(kid_id)
+            if kid_info is None:
+                continue
+            kid_info["claimed_chores"] = self.chore_matrix.chore_ids_with(
+                kid_id, KID_CHORE_CLAIMED
+            )
+            kid_info["approved_chores"] = self.chore_matrix.chore_ids_with(
+                kid_id, KID_CHORE_APPROVED
+            )
+
+    # ------------------ USER LINKS ------------------
+    def _links_changed(self):
+        """Record that kids or parents were linked to or unlinked from users.
+
+        Called wherever a kid's ha_user_id, a parent's ha_user_id or a parent's
+        associated_kids may change, including kids and parents being added or
+        removed. Rebuilds the user link indexes and drops cached authorization
+        facts derived from them.
+        """
+        kids_by_user: dict[str, set[str]] = {}
+        for kid_id, kid_info in self.kids_data.items():
+            if user_id := kid_info.get("ha_user_id"):
+                kids_by_user.setdefault(user_id, set()).add(kid_id)
+
+        parent_kids_by_user: dict[str, set[str]] = {}
+        parent_users_by_kid: dict[str, list[str]] = {}
+        for parent_info in self.parents_data.values():
+            user_id = parent_info.get("ha_user_id")
+            if not user_id:
+                continue
+            for kid_id in parent_info.get("associated_kids", []):
+                parent_kids_by_user.setdefault(user_id, set()).add(kid_id)
+                users = parent_users_by_kid.setdefault(kid_id, [])
+                if user_id not in users:
+                    users.append(user_id)
+
+        self._kids_by_user = {
+            user_id: frozenset(kid_ids) for user_id, kid_ids in kids_by_user.items()
+        }
+        self._parent_kids_by_user = {
+            user_id: frozenset(kid_ids)
+            for user_id, kid_ids in parent_kids_by_user.items()
+        }
+        self._parent_users_by_kid = parent_users_by_kid
+        self.auth_cache.invalidate()
+
+    def get_linked_kids(self, user_id: str) -> frozenset[str]:
+        """Return the kids whose ha_user_id is the given user."""
+        return self._kids_by_user.get(user_id, frozenset())
+
+    def get_parent_kids(self, user_id: str) -> frozenset[str]:
+        """Return the kids associated with the given user as a parent."""
+        return self._parent_kids_by_user.get(user_id, frozenset())
+
+    def get_parent_user_ids(self, kid_id: str) -> list[str]:
+        """Return the user IDs of the kid's parents, in configuration order."""
+        return list(self._parent_users_by_kid.get(kid_id, []))
+
+    # ------------------ NAME INDEX ------------------
+    def _rebuild_name_index(self, collection: str):
+        """Rebuild the name <-> internal_id index of one collection.
+
+        If several items share a name, the first one keeps the mapping, matching
+        the behavior of a linear scan.
+        """
+        ids_by_name: dict[str, str] = {}
+        names_by_id: dict[str, str] = {}
+        for item_id, item_info in self._data.get(collection, {}).items():
+            name = item_info.get("name")
+            names_by_id[item_id] = name
+            ids_by_name.setdefault(name, item_id)
+        self._ids_by_name[collection] = ids_by_name
+        self._names_by_id[collection] = names_by_id
+
+    def _index_name(self, collection: str, item_id: str, name: str):
+        """Add or rename one item in the name index."""
+        names_by_id = self._names_by_id.setdefault(collection, {})
+        ids_by_name = self._ids_by_name.setdefault(collection, {})
+        if item_id in names_by_id and names_by_id[item_id] != name:
+            self._unindex_name(collection, item_id)
+        names_by_id[item_id] = name
+        ids_by_name.setdefault(name, item_id)
+
+    def _unindex_name(self, collection: str, item_id: str):
+        """Remove one item from the name index.
+
+        If another item has the same name, it takes over the name's mapping.
+        """
+        names_by_id = self._names_by_id.get(collection, {})
+        ids_by_name = self._ids_by_name.get(collection, {})
+        name = names_by_id.pop(item_id, None)
+        if name is None or ids_by_name.get(name) != item_id:
+            return
+        del ids_by_name[name]
+        for other_id, other_name in names_by_id.items():
+            if other_name == name:
+                ids_by_name[name] = other_id
+                break
+
+    def get_id_by_name(self, collection: str, name: str) -> Optional[str]:
+        """Return the internal_id of the item with the given name.
+
+        Args:
+            collection (str): Data collection (e.g. DATA_KIDS).
+            name (str): Display name of the item.
+
+        Returns:
+            str: The internal_id, or None if no item has that name.
+
+        """
+        item_id = self._ids_by_name.get(collection, {}).get(name)
+        item_info = self._data.get(collection, {}).get(item_id)
+        if item_info is not None and item_info.get("name") == name:
+            return item_id
+
+        # The index is kept up to date on add, rename and remove; a stale or
+        # missing entry means the collection was changed directly, so rebuild.
+        if item_id is not None or len(self._names_by_id.get(collection, {})) != len(
+            self._data.get(collection, {})
+        ):
+            self._rebuild_name_index(collection)
+            return self._ids_by_name[collection].get(name)
+        return None
+
+    def get_name_by_id(self, collection: str, item_id: str) -> Optional[str]:
+        """Return the name of the item with the given internal_id."""
+        item_info = self._data.get(collection, {}).get(item_id)
+        if item_info:
+            return item_info.get("name")
+        return None
 
     # ------------------ Helper Functions ------------------
     def _get_kid_id_by_name(self, kid_name: str) -> Optional[str]:
         """Help function to get kid_id by kid_name."""
-        for kid_id, kid_info in self.kids_data.items():
-            if kid_info.get("name") == kid_name:
-                return kid_id
-        return None
+        return self.get_id_by_name(DATA_KIDS, kid_name)
 
     def _get_kid_name_by_id(self, kid_id: str) -> Optional[str]:
         """Help function to get kid_name by kid_id."""
-        kid_info = self.kids_data.get(kid_id)
-        if kid_info:
-            return kid_info.get("name")
-        return None
+        return self.get_name_by_id(DATA_KIDS, kid_id)
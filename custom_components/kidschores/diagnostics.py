@@ -0,0 +1,40 @@
+# File: diagnostics.py
+"""Diagnostics support for the KidsChores integration.
+
+Reports the integration's runtime state, such as scheduled timers, lock and
+authorization cache statistics, the approval notification queue, and storage
+statistics. Kid, chore and reward data is not included.
+"""
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from typing import Any
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Args:
+        hass: Home Assistant core object.
+        entry: The KidsChores config entry.
+
+    Returns:
+        dict: Runtime state of the entry's coordinator and storage.
+
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    storage_manager = entry_data["storage_manager"]
+
+    return {
+        "timers": coordinator.timers.as_diagnostics(),
+        "kid_locks": coordinator.kid_locks.as_diagnostics(),
+        "auth_cache": coordinator.auth_cache.as_diagnostics(),
+        "notifications": coordinator.notifier.as_diagnostics(),
+        "chore_matrix": coordinator.chore_matrix.as_diagnostics(),
+        "storage": storage_manager.save_stats,
+    }
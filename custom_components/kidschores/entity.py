@@ -0,0 +1,34 @@
+# File: entity.py
+"""Base entity for the KidsChores integration.
+
+Entities subscribe to the records they depend on through change topics. The
+coordinator bumps a generation number on every record a mutator changes, so an
+entity can tell whether anything it renders changed since its last state
+write, and skip recomputing its state and writing it to Home Assistant when
+nothing did.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import KidsChoresDataCoordinator
+
+
+class KidsChoresEntity(CoordinatorEntity[KidsChoresDataCoordinator]):
+    """Coordinator entity that only writes state when its records changed."""
+
+    _rendered_generation: Optional[int] = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state if a record in the entity's change topics moved on."""
+        topics = self.coordinator_context
+        if topics:
+            generation = self.coordinator.generation(topics)
+            if generation == self._rendered_generation:
+                return
+            self._rendered_generation = generation
+        super()._handle_coordinator_update()
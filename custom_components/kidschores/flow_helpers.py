@@ -13,6 +13,9 @@ from .const import (
     CONF_POINTS_ICON,
     DEFAULT_POINTS_LABEL,
     DEFAULT_POINTS_ICON,
+    DEFAULT_RECURRING_INTERVAL,
+    FREQUENCY_OPTIONS,
+    WEEKDAY_OPTIONS,
 )
 
 
@@ -130,10 +133,28 @@ def build_chore_schema(kids_dict, default=None):
                 default=default.get("recurring_frequency", "none"),
             ): selector.SelectSelector(
                 selector.SelectSelectorConfig(
-                    options=["none", "daily", "weekly", "monthly"],
+                    options=FREQUENCY_OPTIONS,
                     translation_key="recurring_frequency",
                 )
             ),
+            vol.Required(
+                "recurring_interval",
+                default=default.get("recurring_interval", DEFAULT_RECURRING_INTERVAL),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    mode=selector.NumberSelectorMode.BOX, min=1, step=1
+                )
+            ),
+            vol.Optional(
+                "recurring_weekdays",
+                default=default.get("recurring_weekdays", []),
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=WEEKDAY_OPTIONS,
+                    multiple=True,
+                    translation_key="recurring_weekdays",
+                )
+            ),
             vol.Optional("due_date", default=default.get("due_date")): vol.Any(
                 None, selector.DateTimeSelector()
             ),
@@ -4,7 +4,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.auth.models import User
 from typing import Optional
 
-from .const import LOGGER, DOMAIN
+from .auth_cache import UserAuthorization
+from .const import DATA_KIDS, LOGGER, DOMAIN
 from .coordinator import KidsChoresDataCoordinator
 
 
@@ -28,6 +29,21 @@ def _get_kidschores_coordinator(
     return data["coordinator"]
 
 
+# -------- User Authorization Facts --------
+async def _async_get_user_authorization(
+    hass: HomeAssistant, user_id: str
+) -> Optional[UserAuthorization]:
+    """Return the user's authorization facts, cached by the coordinator."""
+    coordinator = _get_kidschores_coordinator(hass)
+    if coordinator:
+        return await coordinator.auth_cache.async_get(user_id)
+
+    user: User = await hass.auth.async_get_user(user_id)
+    if not user:
+        return None
+    return UserAuthorization(user.name, user.is_admin, frozenset(), frozenset())
+
+
 # -------- Authorization for General Actions --------
 async def is_user_authorized_for_global_action(
     hass: HomeAssistant,
@@ -44,7 +60,7 @@ async def is_user_authorized_for_global_action(
     if not user_id:
         return False  # no user context => not authorized
 
-    user: User = await hass.auth.async_get_user(user_id)
+    user = await _async_get_user_authorization(hass, user_id)
     if not user:
         LOGGER.warning("%s: Invalid user ID '%s'", action, user_id)
         return False
@@ -69,12 +85,13 @@ async def is_user_authorized_for_kid(
     By default:
       - Admin => authorized
       - If kid_info['ha_user_id'] == user.id => authorized
+      - If the user is a parent associated with the kid => authorized
       - Otherwise => not authorized
     """
     if not user_id:
         return False
 
-    user: User = await hass.auth.async_get_user(user_id)
+    user = await _async_get_user_authorization(hass, user_id)
     if not user:
         LOGGER.warning("Authorization: Invalid user ID '%s'", user_id)
         return False
@@ -95,8 +112,7 @@ async def is_user_authorized_for_kid(
         )
         return False
 
-    linked_ha_id = kid_info.get("ha_user_id")
-    if linked_ha_id and linked_ha_id == user.id:
+    if kid_id in user.linked_kids or kid_id in user.parent_kids:
         return True
 
     LOGGER.warning(
@@ -110,15 +126,9 @@ async def is_user_authorized_for_kid(
 # ------------------ Helper Functions ------------------
 def _get_kid_id_by_name(self, kid_name: str) -> Optional[str]:
     """Help function to get kid_id by kid_name."""
-    for kid_id, kid_info in self.kids_data.items():
-        if kid_info.get("name") == kid_name:
-            return kid_id
-    return None
+    return self.get_id_by_name(DATA_KIDS, kid_name)
 
 
 def _get_kid_name_by_id(self, kid_id: str) -> Optional[str]:
     """Help function to get kid_name by kid_id."""
-    kid_info = self.kids_data.get(kid_id)
-    if kid_info:
-        return kid_info.get("name")
-    return None
+    return self.get_name_by_id(DATA_KIDS, kid_id)
@@ -0,0 +1,70 @@
+# File: locks.py
+"""Per-kid locking for the KidsChores integration.
+
+Service calls and button presses await authorization before they mutate a
+kid's data, so two calls for the same kid could interleave between the check
+and the change. Holding the kid's lock for the whole operation serializes
+operations on the same kid, while operations on different kids still run
+concurrently. Lock wait times are recorded for diagnostics.
+"""
+
+import asyncio
+import time
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+
+class KidLockManager:
+    """One asyncio lock per kid, with wait time statistics."""
+
+    def __init__(self):
+        """Initialize the manager without locks."""
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    @asynccontextmanager
+    async def async_hold(self, *kid_ids: Optional[str]) -> AsyncIterator[None]:
+        """Hold the locks of the given kids for the duration of the block.
+
+        Locks are acquired in a fixed order, so operations spanning several
+        kids cannot deadlock each other.
+
+        Args:
+            *kid_ids (str): Internal IDs of the kids; None values are ignored.
+
+        """
+        acquired: list[asyncio.Lock] = []
+        try:
+            for kid_id in sorted({kid_id for kid_id in kid_ids if kid_id}):
+                lock = self._locks.setdefault(kid_id, asyncio.Lock())
+                contended = lock.locked()
+                started = time.monotonic()
+                await lock.acquire()
+                acquired.append(lock)
+                self._record_wait(kid_id, contended, time.monotonic() - started)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+    def _record_wait(self, kid_id: str, contended: bool, waited: float):
+        stats = self._stats.setdefault(
+            kid_id,
+            {"acquired": 0, "contended": 0, "total_wait": 0.0, "max_wait": 0.0},
+        )
+        stats["acquired"] += 1
+        if contended:
+            stats["contended"] += 1
+        stats["total_wait"] += waited
+        stats["max_wait"] = max(stats["max_wait"], waited)
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Return lock wait statistics per kid, in seconds."""
+        return {
+            "held": sorted(
+                kid_id for kid_id, lock in self._locks.items() if lock.locked()
+            ),
+            "kids": {kid_id: dict(stats) for kid_id, stats in self._stats.items()},
+        }
@@ -0,0 +1,223 @@
+# File: notifications.py
+"""Approval notification pipeline for the KidsChores integration.
+
+Chore claims and reward redemptions request parent approval through a
+bounded queue instead of sending a notification each. A background worker
+routes every request to the kid's parents and collects requests per parent
+for a short window, then replaces that parent's digest notification with the
+list of everything still awaiting approval. Digests to the same parent are
+rate limited, and requests arriving while the queue is full are dropped and
+counted rather than piling up.
+"""
+
+import asyncio
+import time
+
+from collections import Counter
+from datetime import datetime
+from functools import partial
+from homeassistant.components import persistent_notification
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from typing import Any, NamedTuple
+
+from .const import (
+    APPROVAL_KIND_CHORE,
+    APPROVAL_KIND_REWARD,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_REWARDS,
+    LOGGER,
+    NOTIFY_COALESCE_WINDOW,
+    NOTIFY_MIN_INTERVAL,
+    NOTIFY_QUEUE_SIZE,
+    TIMER_APPROVAL_DIGEST,
+)
+from .timers import TimerRegistry
+
+
+class ApprovalRequest(NamedTuple):
+    """A chore or reward of a kid awaiting parent approval."""
+
+    kind: str  # APPROVAL_KIND_CHORE or APPROVAL_KIND_REWARD
+    kid_id: str
+    item_id: str
+
+
+class ApprovalNotifier:
+    """Bounded queue of approval requests, delivered as per-parent digests."""
+
+    def __init__(self, hass: HomeAssistant, coordinator, timers: TimerRegistry):
+        """Initialize the notifier; requests are routed once it is started.
+
+        Args:
+            hass: Home Assistant core object.
+            coordinator: The KidsChores coordinator holding the approvals.
+            timers: Registry owning the digest timers, cancelled on unload.
+
+        """
+        self.hass = hass
+        self._coordinator = coordinator
+        self._timers = timers
+        self._queue: asyncio.Queue[ApprovalRequest] = asyncio.Queue(NOTIFY_QUEUE_SIZE)
+        self._waiting: dict[str, int] = {}  # Requests per parent since last digest
+        self._last_sent: dict[str, float] = {}  # Monotonic time of last digest
+        self._stats = {
+            "enqueued": 0,
+            "dropped": 0,
+            "unrouted": 0,
+            "coalesced": 0,
+            "digests_sent": 0,
+            "max_queue_depth": 0,
+        }
+
+    @callback
+    def async_start(self, config_entry: ConfigEntry):
+        """Start routing requests; the worker stops when the entry unloads."""
+        config_entry.async_create_background_task(
+            self.hass, self._async_route_requests(), "kidschores approval notifier"
+        )
+
+    @callback
+    def async_request(self, kind: str, kid_id: str, item_id: str) -> bool:
+        """Queue a request for parent approval without waiting.
+
+        Args:
+            kind (str): APPROVAL_KIND_CHORE or APPROVAL_KIND_REWARD.
+            kid_id (str): Internal ID of the kid.
+            item_id (str): Internal ID of the chore or reward.
+
+        Returns:
+            bool: False if the queue was full and the request was dropped.
+
+        """
+        try:
+            self._queue.put_nowait(ApprovalRequest(kind, kid_id, item_id))
+        except asyncio.QueueFull:
+            self._stats["dropped"] += 1
+            LOGGER.warning(
+                "Notification: Queue full, dropped %s approval request for kid ID '%s'",
+                kind,
+                kid_id,
+            )
+            return False
+        self._stats["enqueued"] += 1
+        self._stats["max_queue_depth"] = max(
+            self._stats["max_queue_depth"], self._queue.qsize()
+        )
+        return True
+
+    async def _async_route_requests(self):
+        """Assign queued requests to the parents of their kids."""
+        while True:
+            request = await self._queue.get()
+            try:
+                self._async_route(request)
+            finally:
+                self._queue.task_done()
+
+    @callback
+    def _async_route(self, request: ApprovalRequest):
+        parent_user_ids = self._coordinator.get_parent_user_ids(request.kid_id)
+        if not parent_user_ids:
+            self._stats["unrouted"] += 1
+            LOGGER.debug(
+                "Notification: No parent user linked to kid ID '%s'", request.kid_id
+            )
+            return
+
+        for parent_user_id in parent_user_ids:
+            waiting = self._waiting.get(parent_user_id, 0)
+            self._waiting[parent_user_id] = waiting + 1
+            if waiting:
+                # A digest for this parent is already scheduled
+                self._stats["coalesced"] += 1
+                continue
+
+            # Collect requests for the window, and keep digests apart
+            delay = NOTIFY_COALESCE_WINDOW
+            last_sent = self._last_sent.get(parent_user_id)
+            if last_sent is not None:
+                delay = max(delay, last_sent + NOTIFY_MIN_INTERVAL - time.monotonic())
+            self._timers.async_track(
+                f"{TIMER_APPROVAL_DIGEST}:{parent_user_id}",
+                async_call_later(
+                    self.hass, delay, partial(self._async_flush, parent_user_id)
+                ),
+                delay=delay,
+            )
+
+    @callback
+    def _async_flush(self, parent_user_id: str, now: datetime):
+        self._timers.async_forget(f"{TIMER_APPROVAL_DIGEST}:{parent_user_id}")
+        requests = self._waiting.pop(parent_user_id, 0)
+        self._last_sent[parent_user_id] = time.monotonic()
+        self.hass.async_create_task(self._async_send_digest(parent_user_id, requests))
+
+    async def _async_send_digest(self, parent_user_id: str, requests: int):
+        """Replace the parent's digest with everything still awaiting approval."""
+        parent_user = await self._coordinator.auth_cache.async_get(parent_user_id)
+        if not parent_user:
+            LOGGER.warning(
+                "Notification: Parent user with ID '%s' not found", parent_user_id
+            )
+            return
+
+        notification_id = f"kidschores_approvals_{parent_user_id}"
+        lines = self._digest_lines(parent_user_id)
+        if not lines:
+            # Everything was approved or disapproved in the meantime
+            persistent_notification.async_dismiss(self.hass, notification_id)
+            return
+
+        persistent_notification.async_create(
+            self.hass,
+            "\n".join(lines),
+            title=f"KidsChores: Approvals Needed ({parent_user.name})",
+            notification_id=notification_id,
+        )
+        self._stats["digests_sent"] += 1
+        LOGGER.debug(
+            "Sent approval digest to parent '%s' for %d request(s)",
+            parent_user.name,
+            requests,
+        )
+
+    def _digest_lines(self, parent_user_id: str) -> list[str]:
+        """Return one block per kid listing its pending chores and rewards."""
+        coordinator = self._coordinator
+        kid_ids = coordinator.get_parent_kids(parent_user_id)
+        pending: dict[str, Counter] = {}
+        for kind, approvals, item_key in (
+            (APPROVAL_KIND_CHORE, coordinator.pending_chore_approvals, "chore_id"),
+            (APPROVAL_KIND_REWARD, coordinator.pending_reward_approvals, "reward_id"),
+        ):
+            for approval in approvals:
+                if approval["kid_id"] in kid_ids:
+                    pending.setdefault(approval["kid_id"], Counter())[
+                        (kind, approval[item_key])
+                    ] += 1
+
+        lines = []
+        for kid_id, items in pending.items():
+            if lines:
+                lines.append("")
+            kid_name = coordinator.get_name_by_id(DATA_KIDS, kid_id) or kid_id
+            lines.append(f"**{kid_name}**")
+            for (kind, item_id), count in items.items():
+                collection = (
+                    DATA_CHORES if kind == APPROVAL_KIND_CHORE else DATA_REWARDS
+                )
+                name = coordinator.get_name_by_id(collection, item_id) or item_id
+                suffix = f" (x{count})" if count > 1 else ""
+                lines.append(f"- {kind.capitalize()}: {name}{suffix}")
+        return lines
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Return queue depth, drop counters and parents awaiting a digest."""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "waiting_parents": len(self._waiting),
+            **self._stats,
+        }
@@ -24,6 +24,7 @@ from .const import (
     CONF_POINTS_LABEL,
     DEFAULT_POINTS_ICON,
     DEFAULT_POINTS_LABEL,
+    DEFAULT_RECURRING_INTERVAL,
 )
 from .flow_helpers import (
     build_kid_schema,
@@ -377,6 +378,10 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                     "recurring_frequency": user_input.get(
                         "recurring_frequency", "none"
                     ),
+                    "recurring_interval": int(
+                        user_input.get("recurring_interval", DEFAULT_RECURRING_INTERVAL)
+                    ),
+                    "recurring_weekdays": user_input.get("recurring_weekdays", []),
                     "due_date": due_date_str,
                     "internal_id": internal_id,
                 }
@@ -650,6 +655,12 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                 chore_data["recurring_frequency"] = user_input.get(
                     "recurring_frequency", "none"
                 )
+                chore_data["recurring_interval"] = int(
+                    user_input.get("recurring_interval", DEFAULT_RECURRING_INTERVAL)
+                )
+                chore_data["recurring_weekdays"] = user_input.get(
+                    "recurring_weekdays", []
+                )
                 if raw_due:
                     if isinstance(raw_due, datetime.datetime):
                         chore_data["due_date"] = dt_util.as_utc(raw_due).isoformat()
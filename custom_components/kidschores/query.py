@@ -0,0 +1,142 @@
+# File: query.py
+"""Structured data queries for the KidsChores integration.
+
+Builds the response of the kidschores.query service directly from the
+coordinator's in-memory data, so a dashboard or automation gets points,
+chore states, affordable rewards and pending approvals in one call instead
+of reading many sensor states.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from .const import DATA_CHORES, DATA_REWARDS
+from .coordinator import KidsChoresDataCoordinator
+from .serialization import format_datetime
+
+
+def build_query_response(
+    coordinator: KidsChoresDataCoordinator,
+    kid_ids: Optional[list[str]] = None,
+    chore_states: Optional[list[str]] = None,
+    due_before: Optional[datetime] = None,
+    affordable_only: bool = False,
+) -> dict[str, Any]:
+    """Return the kids' points, chores, rewards and pending approvals.
+
+    Args:
+        coordinator: The KidsChores coordinator.
+        kid_ids (list, optional): Only include these kids; defaults to all kids.
+        chore_states (list, optional): Only include chores in these states.
+        due_before (datetime, optional): Only include chores due at or before
+            this instant, including overdue ones.
+        affordable_only (bool): Only include rewards the kid can afford with the
+            points not reserved by pending rewards.
+
+    Returns:
+        dict: A "kids" list with one entry per kid.
+
+    """
+    if kid_ids is None:
+        kid_ids = list(coordinator.kids_data)
+
+    # Group pending approvals by kid in one pass over each queue
+    pending_chores: dict[str, list[dict[str, Any]]] = {}
+    for approval in coordinator.pending_chore_approvals:
+        pending_chores.setdefault(approval["kid_id"], []).append(
+            {
+                "chore_id": approval["chore_id"],
+                "chore_name": coordinator.get_name_by_id(
+                    DATA_CHORES, approval["chore_id"]
+                ),
+                "timestamp": format_datetime(approval.get("timestamp")),
+            }
+        )
+    pending_rewards: dict[str, list[dict[str, Any]]] = {}
+    for approval in coordinator.pending_reward_approvals:
+        pending_rewards.setdefault(approval["kid_id"], []).append(
+            {
+                "reward_id": approval["reward_id"],
+                "reward_name": coordinator.get_name_by_id(
+                    DATA_REWARDS, approval["reward_id"]
+                ),
+                "timestamp": format_datetime(approval.get("timestamp")),
+            }
+        )
+
+    kids = []
+    for kid_id in kid_ids:
+        kid_info = coordinator.kids_data.get(kid_id)
+        if not kid_info:
+            continue
+        available_points = coordinator.get_available_points(kid_id)
+        kids.append(
+            {
+                "kid_id": kid_id,
+                "name": kid_info["name"],
+                "points": kid_info["points"],
+                "available_points": available_points,
+                "points_earned_today": kid_info.get("points_earned_today", 0),
+                "points_earned_weekly": kid_info.get("points_earned_weekly", 0),
+                "points_earned_monthly": kid_info.get("points_earned_monthly", 0),
+                "badges": list(kid_info.get("badges", [])),
+                "chores": _kid_chores(coordinator, kid_id, chore_states, due_before),
+                "rewards": _kid_rewards(
+                    coordinator, available_points, affordable_only
+                ),
+                "pending_chore_approvals": pending_chores.get(kid_id, []),
+                "pending_reward_approvals": pending_rewards.get(kid_id, []),
+            }
+        )
+
+    return {"kids": kids}
+
+
+def _kid_chores(
+    coordinator: KidsChoresDataCoordinator,
+    kid_id: str,
+    chore_states: Optional[list[str]],
+    due_before: Optional[datetime],
+) -> list[dict[str, Any]]:
+    chores = []
+    for chore_id, chore_info in coordinator.chores_data.items():
+        if kid_id not in chore_info.get("assigned_kids", []):
+            continue
+        due_date = chore_info.get("due_date")
+        if due_before is not None and (due_date is None or due_date > due_before):
+            continue
+        state = coordinator.get_kid_chore_state(kid_id, chore_id)
+        if chore_states is not None and state not in chore_states:
+            continue
+        chores.append(
+            {
+                "chore_id": chore_id,
+                "name": chore_info["name"],
+                "state": state,
+                "due_date": format_datetime(due_date),
+                "default_points": chore_info.get("default_points", 0),
+            }
+        )
+    return chores
+
+
+def _kid_rewards(
+    coordinator: KidsChoresDataCoordinator,
+    available_points: float,
+    affordable_only: bool,
+) -> list[dict[str, Any]]:
+    rewards = []
+    for reward_id, reward_info in coordinator.rewards_data.items():
+        cost = reward_info.get("cost", 0)
+        affordable = available_points >= cost
+        if affordable_only and not affordable:
+            continue
+        rewards.append(
+            {
+                "reward_id": reward_id,
+                "name": reward_info["name"],
+                "cost": cost,
+                "affordable": affordable,
+            }
+        )
+    return rewards
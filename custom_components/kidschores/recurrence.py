@@ -0,0 +1,179 @@
+# File: recurrence.py
+"""Closed-form recurrence calculation for the KidsChores integration.
+
+The next occurrence of a recurring chore is computed directly from its anchor
+(usually the current due date) instead of stepping forward one period at a
+time, so a due date that is months or years stale costs the same as a fresh
+one. Occurrences are computed in Home Assistant's local time zone, so a chore
+keeps its time of day across daylight saving changes.
+
+The most recent scheduled reset is found the same way, so resets missed while
+Home Assistant was not running can be caught up in one pass.
+"""
+
+from calendar import monthrange
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from homeassistant.util import dt as dt_util
+from typing import Optional
+
+from .const import (
+    DEFAULT_DAILY_RESET_TIME,
+    DEFAULT_MONTHLY_RESET_DAY,
+    DEFAULT_RECURRING_INTERVAL,
+    DEFAULT_WEEKLY_RESET_DAY,
+    FREQUENCY_DAILY,
+    FREQUENCY_MONTHLY,
+    FREQUENCY_WEEKLY,
+    WEEKDAY_OPTIONS,
+)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Return value moved by a number of months.
+
+    The day of month is clamped to the last day of the target month, e.g.
+    January 31st plus one month is February 28th (or 29th).
+
+    Args:
+        value (datetime): The original datetime.
+        months (int): Number of months to add.
+
+    Returns:
+        datetime: The moved datetime, with the same time of day.
+
+    """
+    year, month = divmod(value.year * 12 + value.month - 1 + months, 12)
+    month += 1
+    day = min(value.day, monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def weekday_numbers(weekdays: Optional[Iterable[str]]) -> list[int]:
+    """Return sorted weekday numbers (0 = Monday) for weekday option names."""
+    return sorted(
+        {WEEKDAY_OPTIONS.index(day) for day in weekdays or [] if day in WEEKDAY_OPTIONS}
+    )
+
+
+def next_occurrence(
+    anchor: datetime,
+    frequency: str,
+    after: datetime,
+    interval: int = DEFAULT_RECURRING_INTERVAL,
+    weekdays: Optional[Iterable[str]] = None,
+) -> Optional[datetime]:
+    """Return the first occurrence of a recurrence strictly after an instant.
+
+    Occurrences start at the anchor and fall every interval days, every
+    interval weeks (on the anchor's weekday, or on the given weekdays of every
+    interval-th week), or every interval months on the anchor's day of month,
+    always at the anchor's local time of day.
+
+    Args:
+        anchor (datetime): An occurrence, e.g. the chore's current due date.
+        frequency (str): 'daily', 'weekly' or 'monthly'.
+        after (datetime): The result is strictly after this instant.
+        interval (int): Number of periods between occurrences.
+        weekdays (Iterable[str], optional): Weekday names for weekly
+            recurrences, e.g. ['mon', 'thu'].
+
+    Returns:
+        datetime: The next occurrence in local time, or None if the frequency
+        does not recur.
+
+    """
+    anchor = dt_util.as_local(anchor)
+    after = dt_util.as_local(after)
+    interval = max(1, int(interval or DEFAULT_RECURRING_INTERVAL))
+
+    if frequency == FREQUENCY_MONTHLY:
+        months = (after.year - anchor.year) * 12 + after.month - anchor.month
+        periods = max(0, months // interval)
+        occurrence = add_months(anchor, periods * interval)
+        if occurrence <= after:
+            occurrence = add_months(anchor, (periods + 1) * interval)
+        return occurrence
+
+    days = weekday_numbers(weekdays) if frequency == FREQUENCY_WEEKLY else []
+    if days:
+        return _next_weekday_occurrence(anchor, after, interval, days)
+
+    if frequency == FREQUENCY_DAILY:
+        step = interval
+    elif frequency == FREQUENCY_WEEKLY:
+        step = 7 * interval
+    else:
+        return None
+
+    # Whole periods between the anchor's day and after's day; the occurrence
+    # at most one period later is the first one past after.
+    periods = max(0, (after.date() - anchor.date()).days // step)
+    occurrence = anchor + timedelta(days=periods * step)
+    if occurrence <= after:
+        occurrence += timedelta(days=step)
+    return occurrence
+
+
+def _next_weekday_occurrence(
+    anchor: datetime, after: datetime, interval: int, days: list[int]
+) -> datetime:
+    """Return the next occurrence on the given weekdays of every interval-th week.
+
+    Weeks start on Monday and are counted from the anchor's week.
+    """
+    anchor_monday = anchor.date() - timedelta(days=anchor.weekday())
+    start = max(anchor.date(), after.date())
+    week = (start - anchor_monday).days // 7
+    week += -week % interval  # First active week on or after start's week.
+
+    # Offset in days from the anchor to the Monday of that week.
+    monday = (anchor_monday - anchor.date()).days + 7 * week
+    for day in days:
+        occurrence = anchor + timedelta(days=monday + day)
+        if occurrence > after and occurrence >= anchor:
+            return occurrence
+
+    # Every selected day of this week has passed: take the first selected day
+    # of the next active week.
+    return anchor + timedelta(days=monday + 7 * interval + days[0])
+
+
+def last_reset_instant(frequency: str, now: datetime) -> Optional[datetime]:
+    """Return the most recent scheduled reset at or before now.
+
+    Daily resets run at the daily reset time, weekly resets on the weekly reset
+    day and monthly resets on the monthly reset day (clamped to the month's
+    last day). Comparing this with the instant a reset last ran tells whether
+    it was missed, however long ago.
+
+    Args:
+        frequency (str): 'daily', 'weekly' or 'monthly'.
+        now (datetime): The current time.
+
+    Returns:
+        datetime: The scheduled reset instant in local time, or None for an
+        unknown frequency.
+
+    """
+    now = dt_util.as_local(now)
+    daily = now.replace(**DEFAULT_DAILY_RESET_TIME, microsecond=0)
+    if daily > now:
+        daily -= timedelta(days=1)
+
+    if frequency == FREQUENCY_DAILY:
+        return daily
+    if frequency == FREQUENCY_WEEKLY:
+        return daily - timedelta(days=(daily.weekday() - DEFAULT_WEEKLY_RESET_DAY) % 7)
+    if frequency == FREQUENCY_MONTHLY:
+        monthly = _on_monthly_reset_day(daily)
+        if monthly > daily:
+            monthly = _on_monthly_reset_day(add_months(daily.replace(day=1), -1))
+        return monthly
+    return None
+
+
+def _on_monthly_reset_day(value: datetime) -> datetime:
+    """Return value moved to the monthly reset day of its month."""
+    days_in_month = monthrange(value.year, value.month)[1]
+    return value.replace(day=min(DEFAULT_MONTHLY_RESET_DAY, days_in_month))
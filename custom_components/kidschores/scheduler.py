@@ -0,0 +1,129 @@
+# File: scheduler.py
+"""Event-driven due date scheduler for the KidsChores integration.
+
+Keeps a min-heap of upcoming chore due instants and arms a single
+point-in-time timer for the earliest one, instead of polling every chore on
+an interval. When due dates change the heap is updated and the timer re-armed.
+"""
+
+import heapq
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+from typing import Optional
+
+from .const import LOGGER, TIMER_DUE_DATE
+from .timers import TimerRegistry
+
+
+class DueDateScheduler:
+    """Min-heap of chore due instants driving one point-in-time timer.
+
+    Heap entries are invalidated lazily: an entry is only acted on if it still
+    matches the chore's current due instant.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_due: Callable[[list[str], datetime], None],
+        timers: TimerRegistry,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            hass: Home Assistant core object.
+            on_due: Callback receiving the IDs of chores that became due and the
+                time the timer fired.
+            timers: Registry owning the timer, cancelled on unload.
+
+        """
+        self.hass = hass
+        self._on_due = on_due
+        self._timers = timers
+        self._due: dict[str, datetime] = {}  # Current due instant per chore.
+        self._heap: list[tuple[datetime, str]] = []
+        self._armed_at: Optional[datetime] = None
+
+    @property
+    def next_due(self) -> Optional[datetime]:
+        """Return the instant the timer is armed for, if any."""
+        return self._armed_at
+
+    @callback
+    def async_rebuild(self, entries: Iterable[tuple[str, Optional[datetime]]]):
+        """Replace all scheduled due instants.
+
+        Args:
+            entries: (chore_id, due instant) pairs; None means not scheduled.
+
+        """
+        self._due = {
+            chore_id: dt_util.as_utc(due) for chore_id, due in entries if due
+        }
+        self._heap = [(due, chore_id) for chore_id, due in self._due.items()]
+        heapq.heapify(self._heap)
+        self._async_arm()
+
+    @callback
+    def async_update(self, chore_id: str, due: Optional[datetime]):
+        """Schedule, move or remove one chore's due instant."""
+        due = dt_util.as_utc(due) if due else None
+        if self._due.get(chore_id) == due:
+            return
+        if due is None:
+            self._due.pop(chore_id, None)
+        else:
+            self._due[chore_id] = due
+            heapq.heappush(self._heap, (due, chore_id))
+        self._async_arm()
+
+    @callback
+    def async_cancel(self):
+        """Cancel the timer."""
+        self._timers.async_cancel(TIMER_DUE_DATE)
+        self._armed_at = None
+
+    @callback
+    def _async_arm(self):
+        """Arm the timer for the earliest valid due instant."""
+        heap = self._heap
+        while heap and self._due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)  # Stale entry: the chore moved or was removed.
+
+        next_due = heap[0][0] if heap else None
+        if next_due == self._armed_at:
+            return
+
+        self.async_cancel()
+        if next_due is None:
+            return
+        self._armed_at = next_due
+        self._timers.async_track(
+            TIMER_DUE_DATE,
+            async_track_point_in_utc_time(self.hass, self._async_fire, next_due),
+            at=next_due,
+            scheduled_chores=len(self._due),
+        )
+        LOGGER.debug("Next chore due date timer armed for %s", next_due)
+
+    @callback
+    def _async_fire(self, now: datetime):
+        """Hand every chore due by now to the callback and re-arm."""
+        self._timers.async_forget(TIMER_DUE_DATE)
+        self._armed_at = None
+
+        due_ids = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            due, chore_id = heapq.heappop(heap)
+            if self._due.get(chore_id) == due:
+                del self._due[chore_id]
+                due_ids.append(chore_id)
+
+        if due_ids:
+            self._on_due(due_ids, now)
+        self._async_arm()
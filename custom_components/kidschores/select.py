@@ -13,10 +13,10 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER
-from .coordinator import KidsChoresDataCoordinator
+from .const import DATA_CHORES, DATA_PENALTIES, DATA_REWARDS, DOMAIN, LOGGER
+from .coordinator import KidsChoresDataCoordinator, change_topics
+from .entity import KidsChoresEntity
 
 
 async def async_setup_entry(
@@ -45,16 +45,28 @@ async def async_setup_entry(
     async_add_entities(selects)
 
 
-class KidsChoresSelectBase(CoordinatorEntity, SelectEntity):
+class KidsChoresSelectBase(KidsChoresEntity, SelectEntity):
     """Base class for the KidsChores select entities.
 
-    Inherits from CoordinatorEntity to automatically refresh
+    Inherits from KidsChoresEntity to automatically refresh
     options if chores/rewards/penalties data changes.
     """
 
-    def __init__(self, coordinator: KidsChoresDataCoordinator, entry: ConfigEntry):
-        """Initialize the base select entity."""
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: KidsChoresDataCoordinator,
+        entry: ConfigEntry,
+        collection: str,
+    ):
+        """Initialize the base select entity.
+
+        Args:
+            coordinator: The KidsChores coordinator.
+            entry: The config entry.
+            collection (str): Data collection whose changes refresh the options.
+
+        """
+        super().__init__(coordinator, change_topics((collection, None)))
         self._entry = entry
         self._selected_option: Optional[str] = None
 
@@ -85,7 +97,7 @@ class ChoresSelect(KidsChoresSelectBase):
 
     def __init__(self, coordinator: KidsChoresDataCoordinator, entry: ConfigEntry):
         """Initialize the Chores select entity."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, entry, DATA_CHORES)
         self._attr_unique_id = f"{entry.entry_id}_chores_select"
         self._attr_name = "KidsChores: All Chores"
 
@@ -106,7 +118,7 @@ class RewardsSelect(KidsChoresSelectBase):
 
     def __init__(self, coordinator: KidsChoresDataCoordinator, entry: ConfigEntry):
         """Initialize the Rewards select entity."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, entry, DATA_REWARDS)
         self._attr_unique_id = f"{entry.entry_id}_rewards_select"
         self._attr_name = "KidsChores: All Rewards"
 
@@ -127,7 +139,7 @@ class PenaltiesSelect(KidsChoresSelectBase):
 
     def __init__(self, coordinator: KidsChoresDataCoordinator, entry: ConfigEntry):
         """Initialize the Penalties select entity."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, entry, DATA_PENALTIES)
         self._attr_unique_id = f"{entry.entry_id}_penalties_select"
         self._attr_name = "KidsChores: All Penalties"
 
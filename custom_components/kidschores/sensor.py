@@ -31,7 +31,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     ATTR_ALL_EARNED_BADGES,
@@ -55,15 +54,15 @@ from .const import (
     ATTR_REWARD_NAME,
     ATTR_SHARED_CHORE,
     ATTR_THRESHOLD_TYPE,
-    CHORE_STATE_APPROVED,
-    CHORE_STATE_CLAIMED,
-    CHORE_STATE_OVERDUE,
-    CHORE_STATE_PENDING,
-    CHORE_STATE_UNKNOWN,
     CONF_POINTS_ICON,
     CONF_POINTS_LABEL,
+    DATA_BADGES,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_PENALTIES,
     DATA_PENDING_CHORE_APPROVALS,
     DATA_PENDING_REWARD_APPROVALS,
+    DATA_REWARDS,
     DEFAULT_BADGE_BINARY_ICON,
     DEFAULT_CHORE_SENSOR_ICON,
     DEFAULT_PENALTY_ICON,
@@ -84,7 +83,9 @@ from .const import (
     UNKNOWN_KID,
     UNKNOWN_REWARD,
 )
-from .coordinator import KidsChoresDataCoordinator
+from .coordinator import KidsChoresDataCoordinator, change_topics
+from .entity import KidsChoresEntity
+from .serialization import format_datetime
 
 
 async def async_setup_entry(
@@ -221,13 +222,15 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ChoreStatusSensor(CoordinatorEntity, SensorEntity):
+class ChoreStatusSensor(KidsChoresEntity, SensorEntity):
     """Sensor for chore status: pending/claimed/approved/etc."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, chore_id, chore_name):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_CHORES, chore_id))
+        )
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._chore_id = chore_id
@@ -239,33 +242,12 @@ class ChoreStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the chore's state based on shared or individual tracking."""
-        chore_info = self.coordinator.chores_data.get(self._chore_id, {})
-        current_state = chore_info.get("state", CHORE_STATE_UNKNOWN)
-        shared = chore_info.get("shared_chore", False)
-
-        # If the chore is explicitly marked as overdue
-        if current_state == CHORE_STATE_OVERDUE:
-            return CHORE_STATE_OVERDUE
-
-        # If it's a shared chore,  return the global chore state
-        if shared:
-            # If no explicit state found, fallback to 'unknown'
-            return current_state or CHORE_STATE_UNKNOWN
-
-        # For non-shared chores, check the kid's lists
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        if self._chore_id in kid_info.get("approved_chores", []):
-            return CHORE_STATE_APPROVED
-        elif self._chore_id in kid_info.get("claimed_chores", []):
-            return CHORE_STATE_CLAIMED
-        else:
-            return CHORE_STATE_PENDING
+        return self.coordinator.get_kid_chore_state(self._kid_id, self._chore_id)
 
     @property
     def extra_state_attributes(self):
         """Include points, description, etc."""
         chore_info = self.coordinator.chores_data.get(self._chore_id, {})
-        current_state = chore_info.get("state", CHORE_STATE_UNKNOWN)
         shared = chore_info.get("shared_chore", False)
 
         assigned_kids_ids = chore_info.get("assigned_kids", [])
@@ -278,7 +260,8 @@ class ChoreStatusSensor(CoordinatorEntity, SensorEntity):
             ATTR_KID_NAME: self._kid_name,
             ATTR_CHORE_NAME: self._chore_name,
             ATTR_SHARED_CHORE: shared,
-            ATTR_DUE_DATE: chore_info.get("due_date", DUE_DATE_NOT_SET),
+            ATTR_DUE_DATE: format_datetime(chore_info.get("due_date"))
+            or DUE_DATE_NOT_SET,
             ATTR_DEFAULT_POINTS: chore_info.get("default_points", 0),
             ATTR_DESCRIPTION: chore_info.get("description", ""),
             ATTR_PARTIAL_ALLOWED: chore_info.get("partial_allowed", False),
@@ -288,20 +271,9 @@ class ChoreStatusSensor(CoordinatorEntity, SensorEntity):
             ATTR_ASSIGNED_KIDS: assigned_kids_names,
         }
 
-        # If chore is overdue, reflect that
-        if current_state == CHORE_STATE_OVERDUE:
-            attributes["state"] = CHORE_STATE_OVERDUE
-        elif shared:
-            attributes["state"] = current_state or CHORE_STATE_UNKNOWN
-        else:
-            # Non-shared => check if kid has it claimed or approved
-            kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-            if self._chore_id in kid_info.get("approved_chores", []):
-                attributes["state"] = CHORE_STATE_APPROVED
-            elif self._chore_id in kid_info.get("claimed_chores", []):
-                attributes["state"] = CHORE_STATE_CLAIMED
-            else:
-                attributes["state"] = CHORE_STATE_PENDING
+        attributes["state"] = self.coordinator.get_kid_chore_state(
+            self._kid_id, self._chore_id
+        )
 
         return attributes
 
@@ -317,13 +289,13 @@ class ChoreStatusSensor(CoordinatorEntity, SensorEntity):
         return "chore_state"
 
 
-class KidPointsSensor(CoordinatorEntity, SensorEntity):
+class KidPointsSensor(KidsChoresEntity, SensorEntity):
     """Sensor for a kid's total points balance."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, points_label, points_icon):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._points_label = points_label
@@ -349,7 +321,7 @@ class KidPointsSensor(CoordinatorEntity, SensorEntity):
         return self._points_icon or DEFAULT_POINTS_ICON
 
 
-class KidMaxPointsEverSensor(CoordinatorEntity, SensorEntity):
+class KidMaxPointsEverSensor(KidsChoresEntity, SensorEntity):
     """Sensor showing the maximum points a kid has ever reached.
 
     This value only increases when the kid's current points exceed the old max.
@@ -358,7 +330,7 @@ class KidMaxPointsEverSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, entry, kid_id, kid_name, points_label, points_icon):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._points_label = points_label
@@ -385,13 +357,13 @@ class KidMaxPointsEverSensor(CoordinatorEntity, SensorEntity):
         return self._points_label or LABEL_POINTS
 
 
-class CompletedChoresTotalSensor(CoordinatorEntity, SensorEntity):
+class CompletedChoresTotalSensor(KidsChoresEntity, SensorEntity):
     """Sensor tracking the total number of chores a kid has completed since integration start."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_completed_total"
@@ -411,13 +383,13 @@ class CompletedChoresTotalSensor(CoordinatorEntity, SensorEntity):
         return "total_chores_completed"
 
 
-class CompletedChoresDailySensor(CoordinatorEntity, SensorEntity):
+class CompletedChoresDailySensor(KidsChoresEntity, SensorEntity):
     """How many chores kid completed today."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_completed_daily"
@@ -431,13 +403,13 @@ class CompletedChoresDailySensor(CoordinatorEntity, SensorEntity):
         return kid_info.get("completed_chores_today", 0)
 
 
-class CompletedChoresWeeklySensor(CoordinatorEntity, SensorEntity):
+class CompletedChoresWeeklySensor(KidsChoresEntity, SensorEntity):
     """How many chores kid completed this week."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_completed_weekly"
@@ -451,13 +423,13 @@ class CompletedChoresWeeklySensor(CoordinatorEntity, SensorEntity):
         return kid_info.get("completed_chores_weekly", 0)
 
 
-class CompletedChoresMonthlySensor(CoordinatorEntity, SensorEntity):
+class CompletedChoresMonthlySensor(KidsChoresEntity, SensorEntity):
     """How many chores kid completed this month."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_completed_monthly"
@@ -471,13 +443,13 @@ class CompletedChoresMonthlySensor(CoordinatorEntity, SensorEntity):
         return kid_info.get("completed_chores_monthly", 0)
 
 
-class KidBadgesSensor(CoordinatorEntity, SensorEntity):
+class KidBadgesSensor(KidsChoresEntity, SensorEntity):
     """Sensor: number of badges earned + attribute with the list."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_badges"
@@ -496,7 +468,7 @@ class KidBadgesSensor(CoordinatorEntity, SensorEntity):
         return {ATTR_BADGES: kid_info.get("badges", [])}
 
 
-class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
+class KidHighestBadgeSensor(KidsChoresEntity, SensorEntity):
     """Sensor that returns the "highest" badge the kid currently has, based on the threshold_value in coordinator.badges_data.
 
     - If the kid has no badges, the sensor is "None".
@@ -506,7 +478,7 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, entry, kid_id, kid_name):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._entry = entry
         self._kid_id = kid_id
         self._kid_name = kid_name
@@ -524,14 +496,8 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
 
         for badge_name in earned_badge_names:
             # Find badge by name
-            badge_data = next(
-                (
-                    info
-                    for bid, info in self.coordinator.badges_data.items()
-                    if info.get("name") == badge_name
-                ),
-                None,
-            )
+            badge_id = self.coordinator.get_id_by_name(DATA_BADGES, badge_name)
+            badge_data = self.coordinator.badges_data.get(badge_id)
             if not badge_data:
                 continue  # skip if not found or invalid
 
@@ -556,14 +522,8 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
         """Return the icon for the highest badge. Fall back if none found."""
         highest_badge, _ = self._find_highest_badge()
         if highest_badge:
-            badge_data = next(
-                (
-                    info
-                    for bid, info in self.coordinator.badges_data.items()
-                    if info.get("name") == highest_badge
-                ),
-                {},
-            )
+            badge_id = self.coordinator.get_id_by_name(DATA_BADGES, highest_badge)
+            badge_data = self.coordinator.badges_data.get(badge_id, {})
             return badge_data.get("icon", DEFAULT_TROPHY_ICON)
         return DEFAULT_TROPHY_OUTLINE
 
@@ -590,7 +550,7 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
         return "kids_highest_badge"
 
 
-class BadgeSensor(CoordinatorEntity, SensorEntity):
+class BadgeSensor(KidsChoresEntity, SensorEntity):
     """Sensor representing a single badge in KidsChores.
 
     The sensor's 'state' is the badge's threshold_value (the numeric requirement).
@@ -606,7 +566,7 @@ class BadgeSensor(CoordinatorEntity, SensorEntity):
     ):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_BADGES, badge_id)))
         self._entry = entry
         self._badge_id = badge_id
         self._badge_name = badge_name
@@ -662,13 +622,15 @@ class BadgeSensor(CoordinatorEntity, SensorEntity):
         return "badge_sensor_state"
 
 
-class PendingChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
+class PendingChoreApprovalsSensor(KidsChoresEntity, SensorEntity):
     """Sensor listing all pending chore approvals."""
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_PENDING_CHORE_APPROVALS, None))
+        )
         self._attr_unique_id = f"{entry.entry_id}_pending_chore_approvals"
         self._attr_name = "Pending Chore Approvals"
         self._attr_icon = "mdi:clipboard-check-outline"
@@ -692,7 +654,7 @@ class PendingChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
             chore_info = self.coordinator.chores_data.get(approval["chore_id"], {})
             chore_name = chore_info.get("name", UNKNOWN_CHORE)
 
-            timestamp = approval["timestamp"]
+            timestamp = format_datetime(approval["timestamp"])
 
             # If this kid hasn't appeared yet, add an empty list for them
             if kid_name not in grouped_by_kid:
@@ -714,13 +676,15 @@ class PendingChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
         return "pending_chores_approvals"
 
 
-class PendingRewardApprovalsSensor(CoordinatorEntity, SensorEntity):
+class PendingRewardApprovalsSensor(KidsChoresEntity, SensorEntity):
     """Sensor listing all pending reward approvals."""
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_PENDING_REWARD_APPROVALS, None))
+        )
         self._attr_unique_id = f"{entry.entry_id}_pending_reward_approvals"
         self._attr_name = "Pending Reward Approvals"
         self._attr_icon = "mdi:gift-open-outline"
@@ -744,7 +708,7 @@ class PendingRewardApprovalsSensor(CoordinatorEntity, SensorEntity):
             reward_info = self.coordinator.rewards_data.get(approval["reward_id"], {})
             reward_name = reward_info.get("name", UNKNOWN_REWARD)
 
-            timestamp = approval["timestamp"]
+            timestamp = format_datetime(approval["timestamp"])
 
             # If this kid doesn't exist yet in our dictionary, add them
             if kid_name not in grouped_by_kid:
@@ -766,13 +730,15 @@ class PendingRewardApprovalsSensor(CoordinatorEntity, SensorEntity):
         return "pending_rewards_approvals"
 
 
-class RewardClaimsSensor(CoordinatorEntity, SensorEntity):
+class RewardClaimsSensor(KidsChoresEntity, SensorEntity):
     """Sensor tracking how many times each reward has been claimed by a kid."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, reward_id, reward_name):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_REWARDS, reward_id))
+        )
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._reward_id = reward_id
@@ -793,13 +759,15 @@ class RewardClaimsSensor(CoordinatorEntity, SensorEntity):
         return reward_info.get("icon", DEFAULT_REWARD_ICON)
 
 
-class RewardApprovalsSensor(CoordinatorEntity, SensorEntity):
+class RewardApprovalsSensor(KidsChoresEntity, SensorEntity):
     """Sensor tracking how many times each reward has been approved for a kid."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, reward_id, reward_name):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_REWARDS, reward_id))
+        )
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._reward_id = reward_id
@@ -820,7 +788,7 @@ class RewardApprovalsSensor(CoordinatorEntity, SensorEntity):
         return reward_info.get("icon", DEFAULT_REWARD_ICON)
 
 
-class RewardStatusSensor(CoordinatorEntity, SensorEntity):
+class RewardStatusSensor(KidsChoresEntity, SensorEntity):
     """Shows the status of a reward for a particular kid.
 
     Status can be:
@@ -841,7 +809,9 @@ class RewardStatusSensor(CoordinatorEntity, SensorEntity):
     ):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_REWARDS, reward_id))
+        )
         self._entry = entry
         self._kid_id = kid_id
         self._kid_name = kid_name
@@ -887,12 +857,14 @@ class RewardStatusSensor(CoordinatorEntity, SensorEntity):
         return "reward_state"
 
 
-class ChoreClaimsSensor(CoordinatorEntity, SensorEntity):
+class ChoreClaimsSensor(KidsChoresEntity, SensorEntity):
     """Sensor tracking how many times each chore has been claimed by a kid."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, chore_id, chore_name):
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_CHORES, chore_id))
+        )
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._chore_id = chore_id
@@ -913,12 +885,14 @@ class ChoreClaimsSensor(CoordinatorEntity, SensorEntity):
         return chore_info.get("icon", DEFAULT_CHORE_SENSOR_ICON)
 
 
-class ChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
+class ChoreApprovalsSensor(KidsChoresEntity, SensorEntity):
     """Sensor tracking how many times each chore has been approved for a kid."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, chore_id, chore_name):
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, change_topics((DATA_KIDS, kid_id), (DATA_CHORES, chore_id))
+        )
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._chore_id = chore_id
@@ -939,12 +913,15 @@ class ChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
         return chore_info.get("icon", DEFAULT_CHORE_SENSOR_ICON)
 
 
-class PenaltyAppliesSensor(CoordinatorEntity, SensorEntity):
+class PenaltyAppliesSensor(KidsChoresEntity, SensorEntity):
     """Sensor tracking how many times each penalty has been applied to a kid."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, penalty_id, penalty_name):
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            change_topics((DATA_KIDS, kid_id), (DATA_PENALTIES, penalty_id)),
+        )
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._penalty_id = penalty_id
@@ -977,12 +954,12 @@ class PenaltyAppliesSensor(CoordinatorEntity, SensorEntity):
         return penalty_info.get("icon", DEFAULT_PENALTY_ICON)
 
 
-class KidPointsEarnedDailySensor(CoordinatorEntity, SensorEntity):
+class KidPointsEarnedDailySensor(KidsChoresEntity, SensorEntity):
     """Sensor for how many net points a kid earned today."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, points_label, points_icon):
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._points_label = points_label
@@ -1010,13 +987,13 @@ class KidPointsEarnedDailySensor(CoordinatorEntity, SensorEntity):
         return self._points_icon or DEFAULT_POINTS_ICON
 
 
-class KidPointsEarnedWeeklySensor(CoordinatorEntity, SensorEntity):
+class KidPointsEarnedWeeklySensor(KidsChoresEntity, SensorEntity):
     """Sensor for how many net points a kid earned this week."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, points_label, points_icon):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._points_label = points_label
@@ -1043,13 +1020,13 @@ class KidPointsEarnedWeeklySensor(CoordinatorEntity, SensorEntity):
         return self._points_icon or DEFAULT_POINTS_ICON
 
 
-class KidPointsEarnedMonthlySensor(CoordinatorEntity, SensorEntity):
+class KidPointsEarnedMonthlySensor(KidsChoresEntity, SensorEntity):
     """Sensor for how many net points a kid earned this month."""
 
     def __init__(self, coordinator, entry, kid_id, kid_name, points_label, points_icon):
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, change_topics((DATA_KIDS, kid_id)))
         self._kid_id = kid_id
         self._kid_name = kid_name
         self._points_label = points_label
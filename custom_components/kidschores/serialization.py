@@ -0,0 +1,112 @@
+# File: serialization.py
+"""Conversion between the in-memory data model and its stored form.
+
+In memory, chore dates, approval timestamps and reset instants are
+timezone-aware datetimes.
+In storage and the journal they are ISO 8601 strings. Conversion happens only
+when data is loaded from or written to storage, so scheduled tasks and
+approvals never parse strings.
+"""
+
+from datetime import datetime
+from homeassistant.util import dt as dt_util
+from typing import Any, Optional
+
+from .const import (
+    DATA_CHORES,
+    DATA_LAST_RESETS,
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_PENDING_REWARD_APPROVALS,
+)
+
+CHORE_DATETIME_FIELDS = ("due_date", "last_completed", "last_claimed")
+APPROVAL_DATETIME_FIELDS = ("timestamp",)
+
+# Datetime fields per collection; keyed collections hold records by internal_id,
+# approval collections are lists of records.
+_KEYED_FIELDS = {DATA_CHORES: CHORE_DATETIME_FIELDS}
+_LIST_FIELDS = {
+    DATA_PENDING_CHORE_APPROVALS: APPROVAL_DATETIME_FIELDS,
+    DATA_PENDING_REWARD_APPROVALS: APPROVAL_DATETIME_FIELDS,
+}
+# Collections mapping keys directly to datetimes.
+_DATETIME_MAPS = (DATA_LAST_RESETS,)
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """Return a timezone-aware datetime for a stored value.
+
+    Naive values are interpreted in Home Assistant's time zone. Unparseable
+    values return None.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = dt_util.parse_datetime(str(value)) or datetime.fromisoformat(
+                str(value)
+            )
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return parsed
+
+
+def format_datetime(value: Any) -> Any:
+    """Return the stored form of a datetime; other values pass through."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _record_from_storage(record: dict, fields: tuple[str, ...]):
+    for field in fields:
+        if field in record:
+            record[field] = parse_datetime(record[field])
+
+
+def _record_to_storage(record: dict, fields: tuple[str, ...]) -> dict:
+    if not any(isinstance(record.get(field), datetime) for field in fields):
+        return record
+    stored = dict(record)
+    for field in fields:
+        if field in stored:
+            stored[field] = format_datetime(stored[field])
+    return stored
+
+
+def data_from_storage(data: dict) -> dict:
+    """Convert loaded data to the in-memory model, in place."""
+    for collection, fields in _KEYED_FIELDS.items():
+        for record in (data.get(collection) or {}).values():
+            _record_from_storage(record, fields)
+    for collection, fields in _LIST_FIELDS.items():
+        for record in data.get(collection) or []:
+            _record_from_storage(record, fields)
+    for collection in _DATETIME_MAPS:
+        values = data.get(collection) or {}
+        for key, value in values.items():
+            values[key] = parse_datetime(value)
+    return data
+
+
+def collection_to_storage(collection: str, value: Any) -> Any:
+    """Return the stored form of a whole collection.
+
+    Records holding datetimes are copied; the in-memory data is not modified.
+    """
+    if collection in _KEYED_FIELDS and value:
+        fields = _KEYED_FIELDS[collection]
+        return {
+            item_id: _record_to_storage(record, fields)
+            for item_id, record in value.items()
+        }
+    if collection in _LIST_FIELDS and value:
+        fields = _LIST_FIELDS[collection]
+        return [_record_to_storage(record, fields) for record in value]
+    if collection in _DATETIME_MAPS and value:
+        return {key: format_datetime(item) for key, item in value.items()}
+    return value
@@ -6,102 +6,202 @@ Includes UI editor support with selectors for dropdowns and text inputs.
 """
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from typing import Optional
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    CHORE_STATE_PENDING,
-    DATA_PENDING_CHORE_APPROVALS,
+    CHORE_STATES,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_PARENTS,
+    DATA_PENALTIES,
+    DATA_REWARDS,
     DOMAIN,
-    ERROR_CHORE_NOT_FOUND_FMT,
-    ERROR_KID_NOT_FOUND_FMT,
     ERROR_NOT_AUTHORIZED_FMT,
+    FIELD_AFFORDABLE_ONLY,
+    FIELD_CHORE_ID,
+    FIELD_CHORE_IDS,
     FIELD_CHORE_NAME,
+    FIELD_CHORE_NAMES,
+    FIELD_CHORE_STATES,
+    FIELD_DUE_WITHIN,
+    FIELD_KID_ID,
+    FIELD_KID_IDS,
     FIELD_KID_NAME,
+    FIELD_KID_NAMES,
     FIELD_PARENT_NAME,
+    FIELD_PENALTY_ID,
     FIELD_PENALTY_NAME,
     FIELD_POINTS_AWARDED,
+    FIELD_POINTS_DELTA,
+    FIELD_REWARD_ID,
     FIELD_REWARD_NAME,
     LOGGER,
     MSG_NO_ENTRY_FOUND,
+    SERVICE_ADJUST_FAMILY_POINTS,
     SERVICE_APPLY_PENALTY,
     SERVICE_APPROVE_CHORE,
+    SERVICE_APPROVE_PENDING_CHORES,
     SERVICE_APPROVE_REWARD,
     SERVICE_CLAIM_CHORE,
     SERVICE_DISAPPROVE_CHORE,
     SERVICE_DISAPPROVE_REWARD,
+    SERVICE_QUERY,
     SERVICE_REDEEM_REWARD,
     SERVICE_RESET_ALL_CHORES,
     SERVICE_RESET_ALL_DATA,
 )
 from .coordinator import KidsChoresDataCoordinator
 from .kc_helpers import is_user_authorized_for_global_action, is_user_authorized_for_kid
+from .query import build_query_response
 
 
 # --- Service Schemas ---
-CLAIM_CHORE_SCHEMA = vol.Schema(
-    {
-        vol.Required(FIELD_KID_NAME): cv.string,
-        vol.Required(FIELD_CHORE_NAME): cv.string,
-    }
+# Each kid, chore, reward or penalty can be given by name or by internal_id.
+KID_FIELDS = {
+    vol.Exclusive(FIELD_KID_NAME, "kid"): cv.string,
+    vol.Exclusive(FIELD_KID_ID, "kid"): cv.string,
+}
+CHORE_FIELDS = {
+    vol.Exclusive(FIELD_CHORE_NAME, "chore"): cv.string,
+    vol.Exclusive(FIELD_CHORE_ID, "chore"): cv.string,
+}
+REWARD_FIELDS = {
+    vol.Exclusive(FIELD_REWARD_NAME, "reward"): cv.string,
+    vol.Exclusive(FIELD_REWARD_ID, "reward"): cv.string,
+}
+PENALTY_FIELDS = {
+    vol.Exclusive(FIELD_PENALTY_NAME, "penalty"): cv.string,
+    vol.Exclusive(FIELD_PENALTY_ID, "penalty"): cv.string,
+}
+KID_LIST_FIELDS = {
+    vol.Exclusive(FIELD_KID_NAMES, "kids"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Exclusive(FIELD_KID_IDS, "kids"): vol.All(cv.ensure_list, [cv.string]),
+}
+CHORE_LIST_FIELDS = {
+    vol.Exclusive(FIELD_CHORE_NAMES, "chores"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Exclusive(FIELD_CHORE_IDS, "chores"): vol.All(cv.ensure_list, [cv.string]),
+}
+
+REQUIRE_KID = cv.has_at_least_one_key(FIELD_KID_NAME, FIELD_KID_ID)
+REQUIRE_CHORE = cv.has_at_least_one_key(FIELD_CHORE_NAME, FIELD_CHORE_ID)
+REQUIRE_REWARD = cv.has_at_least_one_key(FIELD_REWARD_NAME, FIELD_REWARD_ID)
+REQUIRE_PENALTY = cv.has_at_least_one_key(FIELD_PENALTY_NAME, FIELD_PENALTY_ID)
+
+CLAIM_CHORE_SCHEMA = vol.All(
+    vol.Schema({**KID_FIELDS, **CHORE_FIELDS}), REQUIRE_KID, REQUIRE_CHORE
 )
 
-APPROVE_CHORE_SCHEMA = vol.Schema(
-    {
-        vol.Required(FIELD_PARENT_NAME): cv.string,
-        vol.Required(FIELD_KID_NAME): cv.string,
-        vol.Required(FIELD_CHORE_NAME): cv.string,
-        vol.Optional(FIELD_POINTS_AWARDED): vol.Coerce(float),
-    }
+APPROVE_CHORE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(FIELD_PARENT_NAME): cv.string,
+            **KID_FIELDS,
+            **CHORE_FIELDS,
+            vol.Optional(FIELD_POINTS_AWARDED): vol.Coerce(float),
+        }
+    ),
+    REQUIRE_KID,
+    REQUIRE_CHORE,
 )
 
-DISAPPROVE_CHORE_SCHEMA = vol.Schema(
-    {
-        vol.Required(FIELD_PARENT_NAME): cv.string,
-        vol.Required(FIELD_KID_NAME): cv.string,
-        vol.Required(FIELD_CHORE_NAME): cv.string,
-    }
+DISAPPROVE_CHORE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(FIELD_PARENT_NAME): cv.string,
+            **KID_FIELDS,
+            **CHORE_FIELDS,
+        }
+    ),
+    REQUIRE_KID,
+    REQUIRE_CHORE,
 )
 
-REDEEM_REWARD_SCHEMA = vol.Schema(
-    {
-        vol.Required(FIELD_PARENT_NAME): cv.string,
-        vol.Required(FIELD_KID_NAME): cv.string,
-        vol.Required(FIELD_REWARD_NAME): cv.string,
-    }
+REDEEM_REWARD_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(FIELD_PARENT_NAME): cv.string,
+            **KID_FIELDS,
+            **REWARD_FIELDS,
+        }
+    ),
+    REQUIRE_KID,
+    REQUIRE_REWARD,
 )
 
-APPROVE_REWARD_SCHEMA = vol.Schema(
-    {
-        vol.Required(FIELD_PARENT_NAME): cv.string,
-        vol.Required(FIELD_KID_NAME): cv.string,
-        vol.Required(FIELD_REWARD_NAME): cv.string,
-    }
+APPROVE_REWARD_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(FIELD_PARENT_NAME): cv.string,
+            **KID_FIELDS,
+            **REWARD_FIELDS,
+        }
+    ),
+    REQUIRE_KID,
+    REQUIRE_REWARD,
 )
 
-DISAPPROVE_REWARD_SCHEMA = vol.Schema(
-    {
-        vol.Required(FIELD_PARENT_NAME): cv.string,
-        vol.Required(FIELD_KID_NAME): cv.string,
-        vol.Required(FIELD_REWARD_NAME): cv.string,
-    }
+DISAPPROVE_REWARD_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(FIELD_PARENT_NAME): cv.string,
+            **KID_FIELDS,
+            **REWARD_FIELDS,
+        }
+    ),
+    REQUIRE_KID,
+    REQUIRE_REWARD,
+)
+
+APPLY_PENALTY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(FIELD_PARENT_NAME): cv.string,
+            **KID_FIELDS,
+            **PENALTY_FIELDS,
+        }
+    ),
+    REQUIRE_KID,
+    REQUIRE_PENALTY,
 )
 
-APPLY_PENALTY_SCHEMA = vol.Schema(
+APPROVE_PENDING_CHORES_SCHEMA = vol.Schema(
     {
         vol.Required(FIELD_PARENT_NAME): cv.string,
-        vol.Required(FIELD_KID_NAME): cv.string,
-        vol.Required(FIELD_PENALTY_NAME): cv.string,
+        **KID_LIST_FIELDS,
+        **CHORE_LIST_FIELDS,
+        vol.Optional(FIELD_POINTS_AWARDED): vol.Coerce(float),
     }
 )
 
-APPROVE_REWARD_SCHEMA = vol.Schema(
+ADJUST_FAMILY_POINTS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(FIELD_PARENT_NAME): cv.string,
+            **KID_LIST_FIELDS,
+            **PENALTY_FIELDS,
+            vol.Optional(FIELD_POINTS_DELTA): vol.Coerce(float),
+        }
+    ),
+    cv.has_at_least_one_key(FIELD_PENALTY_NAME, FIELD_PENALTY_ID, FIELD_POINTS_DELTA),
+)
+
+QUERY_SCHEMA = vol.Schema(
     {
-        vol.Required(FIELD_PARENT_NAME): cv.string,
-        vol.Required(FIELD_KID_NAME): cv.string,
-        vol.Required(FIELD_REWARD_NAME): cv.string,
+        **KID_FIELDS,
+        vol.Optional(FIELD_CHORE_STATES): vol.All(
+            cv.ensure_list, [vol.In(CHORE_STATES)]
+        ),
+        vol.Optional(FIELD_DUE_WITHIN): cv.time_period,
+        vol.Optional(FIELD_AFFORDABLE_ONLY, default=False): cv.boolean,
     }
 )
 
@@ -124,37 +224,32 @@ def async_setup_services(hass: HomeAssistant):
             "coordinator"
         ]
         user_id = call.context.user_id
-        kid_name = call.data[FIELD_KID_NAME]
-        chore_name = call.data[FIELD_CHORE_NAME]
-
-        # Map kid_name and chore_name to internal_ids
-        kid_id = _get_kid_id_by_name(coordinator, kid_name)
-        if not kid_id:
-            LOGGER.warning("Claim Chore: " + ERROR_KID_NOT_FOUND_FMT, kid_name)
-            raise HomeAssistantError(ERROR_KID_NOT_FOUND_FMT.format(kid_name))
-
-        chore_id = _get_chore_id_by_name(coordinator, chore_name)
-        if not chore_id:
-            LOGGER.warning("Claim Chore: " + ERROR_CHORE_NOT_FOUND_FMT, chore_name)
-            raise HomeAssistantError(ERROR_CHORE_NOT_FOUND_FMT.format(chore_name))
-
-        # Check if user is authorized
-        if user_id and not await is_user_authorized_for_kid(hass, user_id, kid_id):
-            LOGGER.warning("Claim Chore: %s", ERROR_NOT_AUTHORIZED_FMT)
-            raise HomeAssistantError(ERROR_NOT_AUTHORIZED_FMT.format("claim chores"))
-
-        # Process chore claim
-        coordinator.claim_chore(
-            kid_id=kid_id, chore_id=chore_id, user_name=f"user:{user_id}"
-        )
 
-        LOGGER.info(
-            "Chore '%s' claimed by kid '%s' by user '%s'",
-            chore_name,
-            kid_name,
-            user_id,
-        )
-        await coordinator.async_request_refresh()
+        # Map kid and chore to internal_ids
+        kid_id, kid_name = _resolve_kid(coordinator, call.data, "Claim Chore")
+        chore_id, chore_name = _resolve_chore(coordinator, call.data, "Claim Chore")
+
+        # Serialize operations on this kid from authorization to commit
+        async with coordinator.kid_locks.async_hold(kid_id):
+            # Check if user is authorized
+            if user_id and not await is_user_authorized_for_kid(hass, user_id, kid_id):
+                LOGGER.warning("Claim Chore: %s", ERROR_NOT_AUTHORIZED_FMT)
+                raise HomeAssistantError(
+                    ERROR_NOT_AUTHORIZED_FMT.format("claim chores")
+                )
+
+            # Process chore claim
+            with coordinator.transaction("claim_chore"):
+                coordinator.claim_chore(
+                    kid_id=kid_id, chore_id=chore_id, user_name=f"user:{user_id}"
+                )
+
+            LOGGER.info(
+                "Chore '%s' claimed by kid '%s' by user '%s'",
+                chore_name,
+                kid_name,
+                user_id,
+            )
 
     async def handle_approve_chore(call: ServiceCall):
         """Handle approving a claimed chore."""
@@ -169,59 +264,52 @@ def async_setup_services(hass: HomeAssistant):
         ]
         user_id = call.context.user_id
         parent_name = call.data[FIELD_PARENT_NAME]
-        kid_name = call.data[FIELD_KID_NAME]
-        chore_name = call.data[FIELD_CHORE_NAME]
         points_awarded = call.data.get(FIELD_POINTS_AWARDED)
 
-        # Map kid_name and chore_name to internal_ids
-        kid_id = _get_kid_id_by_name(coordinator, kid_name)
-        if not kid_id:
-            LOGGER.warning("Approve Chore: Kid '%s' not found", kid_name)
-            raise HomeAssistantError(f"Kid '{kid_name}' not found")
-
-        chore_id = _get_chore_id_by_name(coordinator, chore_name)
-        if not chore_id:
-            LOGGER.warning("Approve Chore: Chore '%s' not found", chore_name)
-            raise HomeAssistantError(f"Chore '{chore_name}' not found")
-
-        # Check if user is authorized
-        if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
-        ):
-            LOGGER.warning("Approve Chore: User not authorized")
-            raise HomeAssistantError(
-                "You are not authorized to approve chores for this kid."
-            )
-
-        # Approve chore and assign points
-        try:
-            coordinator.approve_chore(
-                parent_name=parent_name,
-                kid_id=kid_id,
-                chore_id=chore_id,
-                points_awarded=points_awarded,
-            )
-            LOGGER.info(
-                "Chore '%s' approved for kid '%s' by parent '%s'. Points Awarded: %s",
-                chore_name,
-                kid_name,
-                parent_name,
-                points_awarded,
-            )
-            await coordinator.async_request_refresh()
-        except HomeAssistantError as e:
-            LOGGER.error("Approve Chore: %s", e)
-            raise
-        except Exception as e:
-            LOGGER.error(
-                "Approve Chore: Failed to approve chore '%s' for kid '%s': %s",
-                chore_name,
-                kid_name,
-                e,
-            )
-            raise HomeAssistantError(
-                f"Failed to approve chore '{chore_name}' for kid '{kid_name}'."
-            )
+        # Map kid and chore to internal_ids
+        kid_id, kid_name = _resolve_kid(coordinator, call.data, "Approve Chore")
+        chore_id, chore_name = _resolve_chore(coordinator, call.data, "Approve Chore")
+
+        # Serialize operations on this kid from authorization to commit
+        async with coordinator.kid_locks.async_hold(kid_id):
+            # Check if user is authorized
+            if user_id and not await is_user_authorized_for_global_action(
+                hass, user_id, kid_id
+            ):
+                LOGGER.warning("Approve Chore: User not authorized")
+                raise HomeAssistantError(
+                    "You are not authorized to approve chores for this kid."
+                )
+
+            # Approve chore and assign points
+            try:
+                with coordinator.transaction("approve_chore"):
+                    coordinator.approve_chore(
+                        parent_name=parent_name,
+                        kid_id=kid_id,
+                        chore_id=chore_id,
+                        points_awarded=points_awarded,
+                    )
+                LOGGER.info(
+                    "Chore '%s' approved for kid '%s' by parent '%s'. Points Awarded: %s",
+                    chore_name,
+                    kid_name,
+                    parent_name,
+                    points_awarded,
+                )
+            except HomeAssistantError as e:
+                LOGGER.error("Approve Chore: %s", e)
+                raise
+            except Exception as e:
+                LOGGER.error(
+                    "Approve Chore: Failed to approve chore '%s' for kid '%s': %s",
+                    chore_name,
+                    kid_name,
+                    e,
+                )
+                raise HomeAssistantError(
+                    f"Failed to approve chore '{chore_name}' for kid '{kid_name}'."
+                )
 
     async def handle_disapprove_chore(call: ServiceCall):
         """Handle disapproving a chore."""
@@ -234,44 +322,39 @@ def async_setup_services(hass: HomeAssistant):
             "coordinator"
         ]
         parent_name = call.data[FIELD_PARENT_NAME]
-        kid_name = call.data[FIELD_KID_NAME]
-        chore_name = call.data[FIELD_CHORE_NAME]
-
-        # Map kid_name and chore_name to internal_ids
-        kid_id = _get_kid_id_by_name(coordinator, kid_name)
-        if not kid_id:
-            LOGGER.warning("Disapprove Chore: Kid '%s' not found", kid_name)
-            raise HomeAssistantError(f"Kid '{kid_name}' not found")
 
-        chore_id = _get_chore_id_by_name(coordinator, chore_name)
-        if not chore_id:
-            LOGGER.warning("Disapprove Chore: Chore '%s' not found", chore_name)
-            raise HomeAssistantError(f"Chore '{chore_name}' not found")
+        # Map kid and chore to internal_ids
+        kid_id, kid_name = _resolve_kid(coordinator, call.data, "Disapprove Chore")
+        chore_id, chore_name = _resolve_chore(
+            coordinator, call.data, "Disapprove Chore"
+        )
 
-        # Check if user is authorized
-        user_id = call.context.user_id
-        if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
-        ):
-            LOGGER.warning("Disapprove Chore: User not authorized")
-            raise HomeAssistantError(
-                "You are not authorized to disapprove chores for this kid."
+        # Serialize operations on this kid from authorization to commit
+        async with coordinator.kid_locks.async_hold(kid_id):
+            # Check if user is authorized
+            user_id = call.context.user_id
+            if user_id and not await is_user_authorized_for_global_action(
+                hass, user_id, kid_id
+            ):
+                LOGGER.warning("Disapprove Chore: User not authorized")
+                raise HomeAssistantError(
+                    "You are not authorized to disapprove chores for this kid."
+                )
+
+            # Disapprove the chore
+            with coordinator.transaction("disapprove_chore"):
+                coordinator.disapprove_chore(
+                    parent_name=parent_name,
+                    kid_id=kid_id,
+                    chore_id=chore_id,
+                )
+            LOGGER.info(
+                "Chore '%s' disapproved for kid '%s' by parent '%s'",
+                chore_name,
+                kid_name,
+                parent_name,
             )
 
-        # Disapprove the chore
-        coordinator.disapprove_chore(
-            parent_name=parent_name,
-            kid_id=kid_id,
-            chore_id=chore_id,
-        )
-        LOGGER.info(
-            "Chore '%s' disapproved for kid '%s' by parent '%s'",
-            chore_name,
-            kid_name,
-            parent_name,
-        )
-        await coordinator.async_request_refresh()
-
     async def handle_redeem_reward(call: ServiceCall):
         """Handle redeeming a reward (claiming without deduction)."""
         entry_id = _get_first_kidschores_entry(hass)
@@ -283,70 +366,65 @@ def async_setup_services(hass: HomeAssistant):
             "coordinator"
         ]
         parent_name = call.data[FIELD_PARENT_NAME]
-        kid_name = call.data[FIELD_KID_NAME]
-        reward_name = call.data[FIELD_REWARD_NAME]
-
-        # Map kid_name and reward_name to internal_ids
-        kid_id = _get_kid_id_by_name(coordinator, kid_name)
-        if not kid_id:
-            LOGGER.warning("Redeem Reward: Kid '%s' not found", kid_name)
-            raise HomeAssistantError(f"Kid '{kid_name}' not found")
-
-        reward_id = _get_reward_id_by_name(coordinator, reward_name)
-        if not reward_id:
-            LOGGER.warning("Redeem Reward: Reward '%s' not found", reward_name)
-            raise HomeAssistantError(f"Reward '{reward_name}' not found")
 
-        # Check if user is authorized
-        user_id = call.context.user_id
-        if user_id and not await is_user_authorized_for_kid(hass, user_id, kid_id):
-            LOGGER.warning("Redeem Reward: User not authorized")
-            raise HomeAssistantError(
-                "You are not authorized to redeem rewards for this kid."
-            )
-
-        # Check if kid has enough points
-        kid_info = coordinator.kids_data.get(kid_id)
-        reward = coordinator.rewards_data.get(reward_id)
-        if not kid_info or not reward:
-            LOGGER.warning("Redeem Reward: Invalid kid or reward")
-            raise HomeAssistantError("Invalid kid or reward")
-
-        if kid_info["points"] < reward.get("cost", 0):
-            LOGGER.warning(
-                "Redeem Reward: Kid '%s' does not have enough points to redeem reward '%s'",
-                kid_name,
-                reward_name,
-            )
-            raise HomeAssistantError(
-                f"Kid '{kid_name}' does not have enough points to redeem '{reward_name}'."
-            )
+        # Map kid and reward to internal_ids
+        kid_id, kid_name = _resolve_kid(coordinator, call.data, "Redeem Reward")
+        reward_id, reward_name = _resolve_reward(
+            coordinator, call.data, "Redeem Reward"
+        )
 
-        # Process reward claim without deduction
-        try:
-            coordinator.redeem_reward(
-                parent_name=parent_name, kid_id=kid_id, reward_id=reward_id
-            )
-            LOGGER.info(
-                "Reward '%s' claimed by kid '%s' and pending approval by parent '%s'",
-                reward_name,
-                kid_name,
-                parent_name,
-            )
-            await coordinator.async_request_refresh()
-        except HomeAssistantError as e:
-            LOGGER.error("Redeem Reward: %s", e)
-            raise
-        except Exception as e:
-            LOGGER.error(
-                "Redeem Reward: Failed to claim reward '%s' for kid '%s': %s",
-                reward_name,
-                kid_name,
-                e,
-            )
-            raise HomeAssistantError(
-                f"Failed to claim reward '{reward_name}' for kid '{kid_name}'."
-            )
+        # Serialize operations on this kid from authorization to commit
+        async with coordinator.kid_locks.async_hold(kid_id):
+            # Check if user is authorized
+            user_id = call.context.user_id
+            if user_id and not await is_user_authorized_for_kid(hass, user_id, kid_id):
+                LOGGER.warning("Redeem Reward: User not authorized")
+                raise HomeAssistantError(
+                    "You are not authorized to redeem rewards for this kid."
+                )
+
+            # Check if kid has enough points
+            kid_info = coordinator.kids_data.get(kid_id)
+            reward = coordinator.rewards_data.get(reward_id)
+            if not kid_info or not reward:
+                LOGGER.warning("Redeem Reward: Invalid kid or reward")
+                raise HomeAssistantError("Invalid kid or reward")
+
+            if coordinator.get_available_points(kid_id) < reward.get("cost", 0):
+                LOGGER.warning(
+                    "Redeem Reward: Kid '%s' does not have enough points to redeem reward '%s'",
+                    kid_name,
+                    reward_name,
+                )
+                raise HomeAssistantError(
+                    f"Kid '{kid_name}' does not have enough points to redeem '{reward_name}'."
+                )
+
+            # Process reward claim without deduction
+            try:
+                with coordinator.transaction("redeem_reward"):
+                    coordinator.redeem_reward(
+                        parent_name=parent_name, kid_id=kid_id, reward_id=reward_id
+                    )
+                LOGGER.info(
+                    "Reward '%s' claimed by kid '%s' and pending approval by parent '%s'",
+                    reward_name,
+                    kid_name,
+                    parent_name,
+                )
+            except HomeAssistantError as e:
+                LOGGER.error("Redeem Reward: %s", e)
+                raise
+            except Exception as e:
+                LOGGER.error(
+                    "Redeem Reward: Failed to claim reward '%s' for kid '%s': %s",
+                    reward_name,
+                    kid_name,
+                    e,
+                )
+                raise HomeAssistantError(
+                    f"Failed to claim reward '{reward_name}' for kid '{kid_name}'."
+                )
 
     async def handle_approve_reward(call: ServiceCall):
         """Handle approving a reward claimed by a kid."""
@@ -360,54 +438,49 @@ def async_setup_services(hass: HomeAssistant):
         ]
         user_id = call.context.user_id
         parent_name = call.data[FIELD_PARENT_NAME]
-        kid_name = call.data[FIELD_KID_NAME]
-        reward_name = call.data[FIELD_REWARD_NAME]
-
-        # Map kid_name and reward_name to internal_ids
-        kid_id = _get_kid_id_by_name(coordinator, kid_name)
-        if not kid_id:
-            LOGGER.warning("Approve Reward: Kid '%s' not found", kid_name)
-            raise HomeAssistantError(f"Kid '{kid_name}' not found")
-
-        reward_id = _get_reward_id_by_name(coordinator, reward_name)
-        if not reward_id:
-            LOGGER.warning("Approve Reward: Reward '%s' not found", reward_name)
-            raise HomeAssistantError(f"Reward '{reward_name}' not found")
-
-        # Check if user is authorized
-        if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
-        ):
-            LOGGER.warning("Approve Reward: User not authorized")
-            raise HomeAssistantError(
-                "You are not authorized to approve rewards for this kid."
-            )
 
-        # Approve reward redemption and deduct points
-        try:
-            coordinator.approve_reward(
-                parent_name=parent_name, kid_id=kid_id, reward_id=reward_id
-            )
-            LOGGER.info(
-                "Reward '%s' approved for kid '%s' by parent '%s'",
-                reward_name,
-                kid_name,
-                parent_name,
-            )
-            await coordinator.async_request_refresh()
-        except HomeAssistantError as e:
-            LOGGER.error("Approve Reward: %s", e)
-            raise
-        except Exception as e:
-            LOGGER.error(
-                "Approve Reward: Failed to approve reward '%s' for kid '%s': %s",
-                reward_name,
-                kid_name,
-                e,
-            )
-            raise HomeAssistantError(
-                f"Failed to approve reward '{reward_name}' for kid '{kid_name}'."
-            )
+        # Map kid and reward to internal_ids
+        kid_id, kid_name = _resolve_kid(coordinator, call.data, "Approve Reward")
+        reward_id, reward_name = _resolve_reward(
+            coordinator, call.data, "Approve Reward"
+        )
+
+        # Serialize operations on this kid from authorization to commit
+        async with coordinator.kid_locks.async_hold(kid_id):
+            # Check if user is authorized
+            if user_id and not await is_user_authorized_for_global_action(
+                hass, user_id, kid_id
+            ):
+                LOGGER.warning("Approve Reward: User not authorized")
+                raise HomeAssistantError(
+                    "You are not authorized to approve rewards for this kid."
+                )
+
+            # Approve reward redemption and deduct points
+            try:
+                with coordinator.transaction("approve_reward"):
+                    coordinator.approve_reward(
+                        parent_name=parent_name, kid_id=kid_id, reward_id=reward_id
+                    )
+                LOGGER.info(
+                    "Reward '%s' approved for kid '%s' by parent '%s'",
+                    reward_name,
+                    kid_name,
+                    parent_name,
+                )
+            except HomeAssistantError as e:
+                LOGGER.error("Approve Reward: %s", e)
+                raise
+            except Exception as e:
+                LOGGER.error(
+                    "Approve Reward: Failed to approve reward '%s' for kid '%s': %s",
+                    reward_name,
+                    kid_name,
+                    e,
+                )
+                raise HomeAssistantError(
+                    f"Failed to approve reward '{reward_name}' for kid '{kid_name}'."
+                )
 
     async def handle_disapprove_reward(call: ServiceCall):
         """Handle disapproving a reward."""
@@ -420,44 +493,39 @@ def async_setup_services(hass: HomeAssistant):
             "coordinator"
         ]
         parent_name = call.data[FIELD_PARENT_NAME]
-        kid_name = call.data[FIELD_KID_NAME]
-        reward_name = call.data[FIELD_REWARD_NAME]
 
-        # Map kid_name and reward_name to internal_ids
-        kid_id = _get_kid_id_by_name(coordinator, kid_name)
-        if not kid_id:
-            LOGGER.warning("Disapprove Reward: Kid '%s' not found", kid_name)
-            raise HomeAssistantError(f"Kid '{kid_name}' not found")
-
-        reward_id = _get_reward_id_by_name(coordinator, reward_name)
-        if not reward_id:
-            LOGGER.warning("Disapprove Reward: Reward '%s' not found", reward_name)
-            raise HomeAssistantError(f"Reward '{reward_name}' not found")
+        # Map kid and reward to internal_ids
+        kid_id, kid_name = _resolve_kid(coordinator, call.data, "Disapprove Reward")
+        reward_id, reward_name = _resolve_reward(
+            coordinator, call.data, "Disapprove Reward"
+        )
 
-        # Check if user is authorized
-        user_id = call.context.user_id
-        if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
-        ):
-            LOGGER.warning("Disapprove Reward: User not authorized")
-            raise HomeAssistantError(
-                "You are not authorized to disapprove rewards for this kid."
+        # Serialize operations on this kid from authorization to commit
+        async with coordinator.kid_locks.async_hold(kid_id):
+            # Check if user is authorized
+            user_id = call.context.user_id
+            if user_id and not await is_user_authorized_for_global_action(
+                hass, user_id, kid_id
+            ):
+                LOGGER.warning("Disapprove Reward: User not authorized")
+                raise HomeAssistantError(
+                    "You are not authorized to disapprove rewards for this kid."
+                )
+
+            # Disapprove the reward
+            with coordinator.transaction("disapprove_reward"):
+                coordinator.disapprove_reward(
+                    parent_name=parent_name,
+                    kid_id=kid_id,
+                    reward_id=reward_id,
+                )
+            LOGGER.info(
+                "Reward '%s' disapproved for kid '%s' by parent '%s'",
+                reward_name,
+                kid_name,
+                parent_name,
             )
 
-        # Disapprove the reward
-        coordinator.disapprove_reward(
-            parent_name=parent_name,
-            kid_id=kid_id,
-            reward_id=reward_id,
-        )
-        LOGGER.info(
-            "Reward '%s' disapproved for kid '%s' by parent '%s'",
-            reward_name,
-            kid_name,
-            parent_name,
-        )
-        await coordinator.async_request_refresh()
-
     async def handle_apply_penalty(call: ServiceCall):
         """Handle applying a penalty."""
         entry_id = _get_first_kidschores_entry(hass)
@@ -469,56 +537,193 @@ def async_setup_services(hass: HomeAssistant):
             "coordinator"
         ]
         parent_name = call.data[FIELD_PARENT_NAME]
-        kid_name = call.data[FIELD_KID_NAME]
-        penalty_name = call.data[FIELD_PENALTY_NAME]
 
-        # Map kid_name and penalty_name to internal_ids
-        kid_id = _get_kid_id_by_name(coordinator, kid_name)
-        if not kid_id:
-            LOGGER.warning("Apply Penalty: Kid '%s' not found", kid_name)
-            raise HomeAssistantError(f"Kid '{kid_name}' not found")
+        # Map kid and penalty to internal_ids
+        kid_id, kid_name = _resolve_kid(coordinator, call.data, "Apply Penalty")
+        penalty_id, penalty_name = _resolve_penalty(
+            coordinator, call.data, "Apply Penalty"
+        )
 
-        penalty_id = _get_penalty_id_by_name(coordinator, penalty_name)
-        if not penalty_id:
-            LOGGER.warning("Apply Penalty: Penalty '%s' not found", penalty_name)
-            raise HomeAssistantError(f"Penalty '{penalty_name}' not found")
+        # Serialize operations on this kid from authorization to commit
+        async with coordinator.kid_locks.async_hold(kid_id):
+            # Check if user is authorized
+            user_id = call.context.user_id
+            if user_id and not await is_user_authorized_for_global_action(
+                hass, user_id, kid_id
+            ):
+                LOGGER.warning("Apply Penalty: User not authorized")
+                raise HomeAssistantError(
+                    "You are not authorized to apply penalties for this kid."
+                )
+
+            # Apply penalty
+            try:
+                with coordinator.transaction("apply_penalty"):
+                    coordinator.apply_penalty(
+                        parent_name=parent_name, kid_id=kid_id, penalty_id=penalty_id
+                    )
+                LOGGER.info(
+                    "Penalty '%s' applied for kid '%s' by parent '%s'",
+                    penalty_name,
+                    kid_name,
+                    parent_name,
+                )
+            except HomeAssistantError as e:
+                LOGGER.error("Apply Penalty: %s", e)
+                raise
+            except Exception as e:
+                LOGGER.error(
+                    "Apply Penalty: Failed to apply penalty '%s' for kid '%s': %s",
+                    penalty_name,
+                    kid_name,
+                    e,
+                )
+                raise HomeAssistantError(
+                    f"Failed to apply penalty '{penalty_name}' for kid '{kid_name}'."
+                )
+
+    async def handle_approve_pending_chores(call: ServiceCall) -> ServiceResponse:
+        """Handle approving all pending chores, optionally filtered by kid and chore."""
+        entry_id = _get_first_kidschores_entry(hass)
+        if not entry_id:
+            LOGGER.warning("Approve Pending Chores: %s", MSG_NO_ENTRY_FOUND)
+            return {"approved": 0, "failed": 0, "results": []}
 
-        # Check if user is authorized
+        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
+            "coordinator"
+        ]
         user_id = call.context.user_id
-        if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
-        ):
-            LOGGER.warning("Apply Penalty: User not authorized")
-            raise HomeAssistantError(
-                "You are not authorized to apply penalties for this kid."
+        parent_name = call.data[FIELD_PARENT_NAME]
+        points_awarded = call.data.get(FIELD_POINTS_AWARDED)
+
+        # Map kids and chores to internal_ids
+        kid_ids = _resolve_kids(coordinator, call.data, "Approve Pending Chores")
+        chore_ids = _resolve_chores(coordinator, call.data, "Approve Pending Chores")
+        if kid_ids is None:
+            # Every kid with a pending claim
+            kid_ids = list(
+                dict.fromkeys(
+                    approval["kid_id"]
+                    for approval in coordinator.pending_chore_approvals
+                )
             )
 
-        # Apply penalty
-        try:
-            coordinator.apply_penalty(
-                parent_name=parent_name, kid_id=kid_id, penalty_id=penalty_id
+        # Hold every selected kid's lock, so no claim changes mid-approval
+        async with coordinator.kid_locks.async_hold(*kid_ids):
+            # Check if user is authorized for every selected kid
+            if user_id:
+                for kid_id in kid_ids:
+                    if not await is_user_authorized_for_global_action(
+                        hass, user_id, kid_id
+                    ):
+                        LOGGER.warning("Approve Pending Chores: User not authorized")
+                        raise HomeAssistantError(
+                            "You are not authorized to approve chores for these kids."
+                        )
+
+            # Approve all matching claims; persisted and notified once
+            results = coordinator.approve_pending_chores(
+                parent_name=parent_name,
+                kid_ids=kid_ids,
+                chore_ids=chore_ids,
+                points_awarded=points_awarded,
             )
-            LOGGER.info(
-                "Penalty '%s' applied for kid '%s' by parent '%s'",
-                penalty_name,
-                kid_name,
-                parent_name,
+
+        approved = sum(1 for result in results if result["approved"])
+        return {
+            "approved": approved,
+            "failed": len(results) - approved,
+            "results": results,
+        }
+
+    async def handle_adjust_family_points(call: ServiceCall) -> ServiceResponse:
+        """Handle applying a penalty or points delta to several kids at once."""
+        entry_id = _get_first_kidschores_entry(hass)
+        if not entry_id:
+            LOGGER.warning("Adjust Family Points: %s", MSG_NO_ENTRY_FOUND)
+            return {"results": []}
+
+        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
+            "coordinator"
+        ]
+        user_id = call.context.user_id
+        parent_name = call.data[FIELD_PARENT_NAME]
+        points_delta = call.data.get(FIELD_POINTS_DELTA, 0.0)
+
+        # Map kids to internal_ids; default to all kids of the parent
+        kid_ids = _resolve_kids(coordinator, call.data, "Adjust Family Points")
+        if kid_ids is None:
+            parent_id = _get_parent_id_by_name(coordinator, parent_name)
+            if not parent_id:
+                LOGGER.warning(
+                    "Adjust Family Points: Parent '%s' not found", parent_name
+                )
+                raise HomeAssistantError(f"Parent '{parent_name}' not found")
+            kid_ids = list(
+                coordinator.parents_data[parent_id].get("associated_kids", [])
             )
-            await coordinator.async_request_refresh()
-        except HomeAssistantError as e:
-            LOGGER.error("Apply Penalty: %s", e)
-            raise
-        except Exception as e:
-            LOGGER.error(
-                "Apply Penalty: Failed to apply penalty '%s' for kid '%s': %s",
-                penalty_name,
-                kid_name,
-                e,
+            if not kid_ids:
+                raise HomeAssistantError(
+                    f"Parent '{parent_name}' has no associated kids"
+                )
+
+        penalty_id = None
+        if FIELD_PENALTY_NAME in call.data or FIELD_PENALTY_ID in call.data:
+            penalty_id, _ = _resolve_penalty(
+                coordinator, call.data, "Adjust Family Points"
             )
-            raise HomeAssistantError(
-                f"Failed to apply penalty '{penalty_name}' for kid '{kid_name}'."
+
+        # Hold every selected kid's lock from authorization to commit
+        async with coordinator.kid_locks.async_hold(*kid_ids):
+            # Check if user is authorized for every selected kid
+            if user_id:
+                for kid_id in kid_ids:
+                    if not await is_user_authorized_for_global_action(
+                        hass, user_id, kid_id
+                    ):
+                        LOGGER.warning("Adjust Family Points: User not authorized")
+                        raise HomeAssistantError(
+                            "You are not authorized to adjust points for these kids."
+                        )
+
+            # Adjust all kids in one transaction; persisted and notified once
+            results = coordinator.adjust_family_points(
+                parent_name=parent_name,
+                kid_ids=kid_ids,
+                points_delta=points_delta,
+                penalty_id=penalty_id,
             )
 
+        return {"results": results}
+
+    async def handle_query(call: ServiceCall) -> ServiceResponse:
+        """Handle querying kids, chores, rewards and pending approvals."""
+        entry_id = _get_first_kidschores_entry(hass)
+        if not entry_id:
+            LOGGER.warning("Query: %s", MSG_NO_ENTRY_FOUND)
+            return {"kids": []}
+
+        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
+            "coordinator"
+        ]
+
+        kid_ids = None
+        if FIELD_KID_NAME in call.data or FIELD_KID_ID in call.data:
+            kid_id, _ = _resolve_kid(coordinator, call.data, "Query")
+            kid_ids = [kid_id]
+
+        due_before = None
+        if FIELD_DUE_WITHIN in call.data:
+            due_before = dt_util.utcnow() + call.data[FIELD_DUE_WITHIN]
+
+        return build_query_response(
+            coordinator,
+            kid_ids=kid_ids,
+            chore_states=call.data.get(FIELD_CHORE_STATES),
+            due_before=due_before,
+            affordable_only=call.data[FIELD_AFFORDABLE_ONLY],
+        )
+
     async def handle_reset_all_data(call: ServiceCall):
         """Handle manually resetting ALL data in KidsChores."""
         entry_id = _get_first_kidschores_entry(hass)
@@ -539,7 +744,7 @@ def async_setup_services(hass: HomeAssistant):
         # Re-init the coordinator with reload config entry
         hass.config_entries.async_reload(entry_id)
 
-        coordinator.async_set_updated_data(coordinator._data)
+        coordinator.async_set_updated_data(coordinator.snapshot())
         LOGGER.info("Manually reset all KidsChores data. Integration is now cleared")
 
     async def handle_reset_all_chores(call: ServiceCall):
@@ -556,21 +761,7 @@ def async_setup_services(hass: HomeAssistant):
 
         coordinator: KidsChoresDataCoordinator = data["coordinator"]
 
-        # Loop over all chores, reset them to pending
-        for chore_id, chore_info in coordinator.chores_data.items():
-            chore_info["state"] = CHORE_STATE_PENDING
-
-        # Remove all chore approvals/claims for each kid
-        for kid_id, kid_info in coordinator.kids_data.items():
-            kid_info["claimed_chores"] = []
-            kid_info["approved_chores"] = []
-
-        # Clear the pending approvals queue
-        coordinator._data[DATA_PENDING_CHORE_APPROVALS] = []
-
-        # Persist & notify
-        coordinator._persist()
-        coordinator.async_set_updated_data(coordinator._data)
+        coordinator.reset_all_chores()
         LOGGER.info("Manually reset all chores to pending, removed claims/approvals")
 
     # --- Register Services ---
@@ -604,6 +795,27 @@ def async_setup_services(hass: HomeAssistant):
     hass.services.async_register(
         DOMAIN, SERVICE_APPLY_PENALTY, handle_apply_penalty, schema=APPLY_PENALTY_SCHEMA
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPROVE_PENDING_CHORES,
+        handle_approve_pending_chores,
+        schema=APPROVE_PENDING_CHORES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ADJUST_FAMILY_POINTS,
+        handle_adjust_family_points,
+        schema=ADJUST_FAMILY_POINTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY,
+        handle_query,
+        schema=QUERY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
     hass.services.async_register(
         DOMAIN,
         SERVICE_RESET_ALL_DATA,
@@ -631,6 +843,9 @@ async def async_unload_services(hass: HomeAssistant):
         SERVICE_DISAPPROVE_REWARD,
         SERVICE_APPLY_PENALTY,
         SERVICE_APPROVE_REWARD,
+        SERVICE_APPROVE_PENDING_CHORES,
+        SERVICE_ADJUST_FAMILY_POINTS,
+        SERVICE_QUERY,
         SERVICE_RESET_ALL_DATA,
         SERVICE_RESET_ALL_CHORES,
     ]
@@ -650,41 +865,141 @@ def _get_first_kidschores_entry(hass: HomeAssistant) -> Optional[str]:
     return next(iter(domain_entries.keys()), None)
 
 
-def _get_kid_id_by_name(
-    coordinator: KidsChoresDataCoordinator, kid_name: str
-) -> Optional[str]:
-    """Help function to get kid_id by kid_name."""
-    for kid_id, kid_info in coordinator.kids_data.items():
-        if kid_info.get("name") == kid_name:
-            return kid_id
-    return None
+_ITEM_LABELS = {
+    DATA_KIDS: "Kid",
+    DATA_CHORES: "Chore",
+    DATA_REWARDS: "Reward",
+    DATA_PENALTIES: "Penalty",
+}
+
+
+def _resolve_item(
+    coordinator: KidsChoresDataCoordinator,
+    data: dict,
+    collection: str,
+    id_field: str,
+    name_field: str,
+    service: str,
+) -> tuple[str, str]:
+    """Return the internal_id and name of the item a service call refers to.
+
+    An internal_id given in the call is used directly; a name is resolved
+    through the coordinator's name index.
+
+    Args:
+        coordinator: The KidsChores coordinator.
+        data (dict): Validated service call data.
+        collection (str): Data collection of the item (e.g. DATA_KIDS).
+        id_field (str): Service field holding the internal_id.
+        name_field (str): Service field holding the name.
+        service (str): Service name used in log messages.
+
+    Returns:
+        tuple: The item's internal_id and name.
+
+    Raises:
+        HomeAssistantError: If no item has the given internal_id or name.
+
+    """
+    label = _ITEM_LABELS[collection]
+    if id_field in data:
+        item_id = data[id_field]
+        item_name = coordinator.get_name_by_id(collection, item_id)
+        if item_name is None:
+            LOGGER.warning("%s: %s with ID '%s' not found", service, label, item_id)
+            raise HomeAssistantError(f"{label} with ID '{item_id}' not found")
+        return item_id, item_name
+
+    item_name = data[name_field]
+    item_id = coordinator.get_id_by_name(collection, item_name)
+    if not item_id:
+        LOGGER.warning("%s: %s '%s' not found", service, label, item_name)
+        raise HomeAssistantError(f"{label} '{item_name}' not found")
+    return item_id, item_name
+
+
+def _resolve_items(
+    coordinator: KidsChoresDataCoordinator,
+    data: dict,
+    collection: str,
+    ids_field: str,
+    names_field: str,
+    service: str,
+) -> Optional[list[str]]:
+    """Return the internal_ids of the items a bulk service call refers to.
+
+    Returns None if the call gives neither internal_ids nor names.
+    """
+    if ids_field in data:
+        field, values = ids_field, data[ids_field]
+    elif names_field in data:
+        field, values = names_field, data[names_field]
+    else:
+        return None
+    return [
+        _resolve_item(
+            coordinator, {field: value}, collection, ids_field, names_field, service
+        )[0]
+        for value in values
+    ]
 
 
-def _get_chore_id_by_name(
-    coordinator: KidsChoresDataCoordinator, chore_name: str
-) -> Optional[str]:
-    """Help function to get chore_id by chore_name."""
-    for chore_id, chore_info in coordinator.chores_data.items():
-        if chore_info.get("name") == chore_name:
-            return chore_id
-    return None
+def _resolve_kid(
+    coordinator: KidsChoresDataCoordinator, data: dict, service: str
+) -> tuple[str, str]:
+    """Help function to get kid_id and kid_name from kid_id or kid_name."""
+    return _resolve_item(
+        coordinator, data, DATA_KIDS, FIELD_KID_ID, FIELD_KID_NAME, service
+    )
 
 
-def _get_reward_id_by_name(
-    coordinator: KidsChoresDataCoordinator, reward_name: str
-) -> Optional[str]:
-    """Help function to get reward_id by reward_name."""
-    for reward_id, reward_info in coordinator.rewards_data.items():
-        if reward_info.get("name") == reward_name:
-            return reward_id
-    return None
+def _resolve_chore(
+    coordinator: KidsChoresDataCoordinator, data: dict, service: str
+) -> tuple[str, str]:
+    """Help function to get chore_id and chore_name from chore_id or chore_name."""
+    return _resolve_item(
+        coordinator, data, DATA_CHORES, FIELD_CHORE_ID, FIELD_CHORE_NAME, service
+    )
+
+
+def _resolve_reward(
+    coordinator: KidsChoresDataCoordinator, data: dict, service: str
+) -> tuple[str, str]:
+    """Help function to get reward_id and reward_name from reward_id or reward_name."""
+    return _resolve_item(
+        coordinator, data, DATA_REWARDS, FIELD_REWARD_ID, FIELD_REWARD_NAME, service
+    )
+
+
+def _resolve_penalty(
+    coordinator: KidsChoresDataCoordinator, data: dict, service: str
+) -> tuple[str, str]:
+    """Help function to get penalty_id and penalty_name from either field."""
+    return _resolve_item(
+        coordinator, data, DATA_PENALTIES, FIELD_PENALTY_ID, FIELD_PENALTY_NAME, service
+    )
+
+
+def _resolve_kids(
+    coordinator: KidsChoresDataCoordinator, data: dict, service: str
+) -> Optional[list[str]]:
+    """Help function to get kid_ids from kid_ids or kid_names, if given."""
+    return _resolve_items(
+        coordinator, data, DATA_KIDS, FIELD_KID_IDS, FIELD_KID_NAMES, service
+    )
+
+
+def _resolve_chores(
+    coordinator: KidsChoresDataCoordinator, data: dict, service: str
+) -> Optional[list[str]]:
+    """Help function to get chore_ids from chore_ids or chore_names, if given."""
+    return _resolve_items(
+        coordinator, data, DATA_CHORES, FIELD_CHORE_IDS, FIELD_CHORE_NAMES, service
+    )
 
 
-def _get_penalty_id_by_name(
-    coordinator: KidsChoresDataCoordinator, penalty_name: str
+def _get_parent_id_by_name(
+    coordinator: KidsChoresDataCoordinator, parent_name: str
 ) -> Optional[str]:
-    """Help function to get penalty_id by penalty_name."""
-    for penalty_id, penalty_info in coordinator.penalties_data.items():
-        if penalty_info.get("name") == penalty_name:
-            return penalty_id
-    return None
+    """Help function to get parent_id by parent_name."""
+    return coordinator.get_id_by_name(DATA_PARENTS, parent_name)
@@ -0,0 +1,49 @@
+# File: snapshot.py
+"""Read-only data snapshots for the KidsChores integration.
+
+Listeners see the coordinator data through a snapshot: a new, read-only view
+of the live data with a version number, published on every commit. Creating
+one costs the same regardless of how much data there is, whereas a deep copy
+duplicated every kid, chore and history record. Entities tell which records
+changed from the coordinator's generation counters, not from the snapshot.
+"""
+
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import Any
+
+
+class DataSnapshot(Mapping):
+    """Read-only view of the coordinator data at a version.
+
+    The records are shared with the coordinator, not copied; the view only
+    prevents listeners from modifying collections through it.
+    """
+
+    __slots__ = ("_data", "version")
+
+    def __init__(self, data: dict, version: int):
+        """Initialize the snapshot.
+
+        Args:
+            data (dict): The coordinator's live data, keyed by collection.
+            version (int): Version of the whole data set.
+
+        """
+        self._data = data
+        self.version = version
+
+    def __getitem__(self, collection: str) -> Any:
+        """Return a collection; dict collections are wrapped read-only."""
+        value = self._data[collection]
+        if isinstance(value, dict):
+            return MappingProxyType(value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over collection names."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of collections."""
+        return len(self._data)
@@ -4,20 +4,53 @@
 Uses Home Assistant's Storage helper to save and load chore-related data, ensuring
 the state is preserved across restarts. This includes data for kids, chores,
 badges, rewards, penalties, and their statuses.
+
+Data is split into shards, one Store file per collection, each with its own
+version. Only shards marked dirty are rewritten, so a points change rewrites
+the kids shard instead of the whole chore and badge catalog.
+
+Writes are coalesced: mutations mark shards dirty and a single save is
+scheduled after a short delay, so a burst of changes results in one write.
+
+In journal mode, coordinator operations append small records to a journal file
+next to the shards. The shards are only rewritten when the journal grows past
+a size or age threshold, and the journal tail is replayed on startup.
 """
 
-from homeassistant.helpers.storage import Store
+import json
+import os
+
+from datetime import timedelta
+from homeassistant.core import callback
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util import dt as dt_util
+from typing import Iterable, Optional
+
+from .approval_queue import approvals_as_list
 from .const import (
     LOGGER,
+    STORAGE_JOURNAL_ENABLED,
+    STORAGE_JOURNAL_MAX_AGE,
+    STORAGE_JOURNAL_MAX_BYTES,
+    STORAGE_JOURNAL_SEQ,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_SHARD_ITEMS,
+    STORAGE_SHARD_MISC,
+    STORAGE_SHARDS,
     STORAGE_VERSION,
     DATA_KIDS,
     DATA_CHORES,
     DATA_BADGES,
+    DATA_LINKED_USERS,
     DATA_REWARDS,
     DATA_PENALTIES,
     DATA_PARENTS,
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_PENDING_REWARD_APPROVALS,
 )
+from .serialization import collection_to_storage, data_from_storage
 
 
 class KidsChoresStorageManager:
@@ -26,28 +59,82 @@ class KidsChoresStorageManager:
     Utilizes internal_id as the primary key for all entities.
     """
 
-    def __init__(self, hass, storage_key=STORAGE_KEY):
+    def __init__(
+        self,
+        hass,
+        storage_key=STORAGE_KEY,
+        save_delay=STORAGE_SAVE_DELAY,
+        journal=STORAGE_JOURNAL_ENABLED,
+    ):
         """Initialize the storage manager.
 
         Args:
             hass: Home Assistant core object.
             storage_key: Key to identify storage location (default: STORAGE_KEY).
+            save_delay: Seconds to wait before writing scheduled changes
+                (default: STORAGE_SAVE_DELAY).
+            journal: Append operation records to a journal instead of rewriting
+                the shards for every change (default: STORAGE_JOURNAL_ENABLED).
 
         """
         self.hass = hass
         self._storage_key = storage_key
-        self._store = Store(hass, STORAGE_VERSION, storage_key)
+        # Single-file store used before sharding; only read for migration.
+        self._legacy_store = Store(hass, STORAGE_VERSION, storage_key)
+        self._stores = {
+            shard: Store(hass, version, f"{storage_key}.{shard}")
+            for shard, version in STORAGE_SHARDS.items()
+        }
         self._data = {}  # In-memory data cache for quick access.
+        self._save_delay = save_delay
+        self._dirty_shards: set[str] = set()  # Shards with unwritten changes.
+        self._shard_seqs = dict.fromkeys(STORAGE_SHARDS, 0)  # Journal seq per shard.
+        self._save_requests = 0  # Number of save requests received.
+        self._writes = 0  # Number of shard writes actually performed.
+        self._coalesced_writes = 0  # Requests absorbed by an already pending save.
+
+        # Journal state
+        self._journal_enabled = journal
+        self._journal_path = hass.config.path(STORAGE_DIR, f"{storage_key}.journal")
+        self._journal_seq = 0  # Sequence number of the last journal record.
+        self._journal_buffer: list[str] = []  # Serialized records not yet written.
+        self._journal_shards: set[str] = set()  # Shards changed by the journal.
+        self._journal_task = None  # Task draining the buffer to disk.
+        self._journal_bytes = 0  # Size of the journal file on disk.
+        self._journal_records = 0  # Records in the journal file on disk.
+        self._journal_started = None  # Timestamp of the oldest journal record.
+        self._compactions = 0  # Number of snapshot compactions.
 
     async def async_initialize(self):
         """Load data from storage during startup.
 
-        If no data exists, initializes with an empty structure.
+        Loads every shard; if none exist yet, migrates the single-file storage
+        used by earlier versions. If no data exists, initializes with an empty
+        structure.
         """
         LOGGER.debug("KidsChoresStorageManager: Loading data from storage")
-        existing_data = await self._store.async_load()
-
-        if existing_data is None:
+        self._data = {}
+        found = False
+
+        for shard, store in self._stores.items():
+            payload = await store.async_load()
+            if payload is None:
+                continue
+            found = True
+            self._shard_seqs[shard] = payload.get(STORAGE_JOURNAL_SEQ, 0)
+            items = payload.get(STORAGE_SHARD_ITEMS)
+            if shard == STORAGE_SHARD_MISC:
+                self._data.update(items or {})
+            elif items is not None:
+                self._data[shard] = items
+
+        if not found:
+            legacy_data = await self._legacy_store.async_load()
+            if legacy_data is not None:
+                await self._async_migrate_legacy(legacy_data)
+                found = True
+
+        if not found:
             # No existing data, create a new default structure.
             LOGGER.info("No existing storage found; initializing new data")
             self._data = {
@@ -59,10 +146,59 @@ class KidsChoresStorageManager:
                 DATA_PARENTS: {},  # Dictionary of parents keyed by internal_id.
             }
         else:
-            # Load existing data into memory.
-            self._data = existing_data
             LOGGER.info("Storage data loaded successfully")
 
+        self._journal_seq = max(self._shard_seqs.values())
+        if self._journal_enabled:
+            await self._async_replay_journal()
+
+        # Dates are held as datetimes in memory and as strings on disk.
+        data_from_storage(self._data)
+
+    async def _async_migrate_legacy(self, legacy_data: dict):
+        """Split the single-file storage into shards and remove the old file."""
+        LOGGER.info("Migrating KidsChores storage to per-collection shards")
+        legacy_seq = legacy_data.pop(STORAGE_JOURNAL_SEQ, 0)
+        self._data = legacy_data
+        self._shard_seqs = dict.fromkeys(STORAGE_SHARDS, legacy_seq)
+        self._journal_seq = legacy_seq
+
+        self._dirty_shards = set(STORAGE_SHARDS)
+        await self.async_save()
+        await self._legacy_store.async_remove()
+
+    async def _async_replay_journal(self):
+        """Apply journal records newer than the loaded shards.
+
+        A record section is skipped if the shard holding that collection was
+        written at or after the record's sequence number.
+        """
+        records, size = await self.hass.async_add_executor_job(
+            _read_journal, self._journal_path
+        )
+        self._journal_bytes = size
+        self._journal_records = len(records)
+
+        replayed = 0
+        for record in records:
+            seq = record.get("seq", 0)
+            applied = _apply_journal_record(self._data, record, self._shard_seqs)
+            if not applied:
+                continue
+            self._journal_shards.update(applied)
+            self._journal_seq = max(self._journal_seq, seq)
+            if self._journal_started is None:
+                self._journal_started = (
+                    dt_util.parse_datetime(record.get("ts", "")) or dt_util.utcnow()
+                )
+            replayed += 1
+
+        if replayed:
+            LOGGER.info(
+                "Replayed %d KidsChores journal record(s) on top of the snapshot",
+                replayed,
+            )
+
     @property
     def data(self):
         """Retrieve the in-memory data cache.
@@ -148,33 +284,247 @@ class KidsChoresStorageManager:
     async def link_user_to_kid(self, user_id, kid_id):
         """Link a Home Assistant user ID to a specific kid by internal_id."""
 
-        if "linked_users" not in self._data:
-            self._data["linked_users"] = {}
-        self._data["linked_users"][user_id] = kid_id
-        await self._save()
+        if DATA_LINKED_USERS not in self._data:
+            self._data[DATA_LINKED_USERS] = {}
+        self._data[DATA_LINKED_USERS][user_id] = kid_id
+        self.async_delay_save([DATA_LINKED_USERS])
 
     async def unlink_user(self, user_id):
         """Unlink a Home Assistant user ID from any kid."""
 
-        if "linked_users" in self._data and user_id in self._data["linked_users"]:
-            del self._data["linked_users"][user_id]
-            await self._save()
+        if DATA_LINKED_USERS in self._data and user_id in self._data[DATA_LINKED_USERS]:
+            del self._data[DATA_LINKED_USERS][user_id]
+            self.async_delay_save([DATA_LINKED_USERS])
 
     async def get_linked_kids(self):
         """Get all linked users and their associated kids."""
 
-        return self._data.get("linked_users", {})
+        return self._data.get(DATA_LINKED_USERS, {})
 
-    async def async_save(self):
-        """Save the current data structure to storage asynchronously.
+    @property
+    def journal_enabled(self) -> bool:
+        """Return True if changes are appended to the journal."""
+        return self._journal_enabled
+
+    @property
+    def is_dirty(self) -> bool:
+        """Return True if there are changes that have not been written yet."""
+        return bool(self._dirty_shards)
+
+    @property
+    def save_stats(self) -> dict:
+        """Return counters describing how saves were coalesced.
+
+        Returns:
+            dict: Save requests received, shard writes performed, requests that
+            were absorbed by an already pending write, and journal state.
+
+        """
+        return {
+            "save_requests": self._save_requests,
+            "writes": self._writes,
+            "coalesced_writes": self._coalesced_writes,
+            "dirty_shards": sorted(self._dirty_shards),
+            "journal_enabled": self._journal_enabled,
+            "journal_seq": self._journal_seq,
+            "journal_records": self._journal_records,
+            "journal_bytes": self._journal_bytes,
+            "compactions": self._compactions,
+        }
+
+    @callback
+    def async_delay_save(self, collections: Optional[Iterable[str]] = None):
+        """Mark shards dirty and schedule a coalesced save.
+
+        Repeated calls before the delay expires are merged into the pending
+        write of each shard. The Store also flushes pending writes when Home
+        Assistant shuts down.
+
+        Args:
+            collections: Data keys that changed. If omitted, every shard is
+                marked dirty.
+
+        """
+        self._save_requests += 1
+        shards = (
+            set(STORAGE_SHARDS)
+            if collections is None
+            else {_shard_for(collection) for collection in collections}
+        )
+        for shard in shards:
+            if shard in self._dirty_shards:
+                self._coalesced_writes += 1
+                continue
+            self._dirty_shards.add(shard)
+            self._stores[shard].async_delay_save(
+                self._shard_data_func(shard), self._save_delay
+            )
+
+    def _shard_data_func(self, shard: str):
+        """Return the callback a shard Store calls when it writes."""
+
+        @callback
+        def _data_to_save():
+            """Return the shard payload and clear its dirty flag."""
+            self._dirty_shards.discard(shard)
+            self._writes += 1
+            LOGGER.debug(
+                "Writing KidsChores storage shard '%s' (%d requests, %d coalesced)",
+                shard,
+                self._save_requests,
+                self._coalesced_writes,
+            )
+            return self._shard_payload(shard)
+
+        return _data_to_save
+
+    @callback
+    def _shard_payload(self, shard: str) -> dict:
+        """Return the data to write for one shard.
+
+        The payload records the last journal sequence number it contains, so
+        older journal records are skipped on replay.
+        """
+        if shard == STORAGE_SHARD_MISC:
+            items = {
+                key: collection_to_storage(key, value)
+                for key, value in self._data.items()
+                if _shard_for(key) == STORAGE_SHARD_MISC
+            }
+        else:
+            items = self._data.get(shard)
+            if shard in (DATA_PENDING_CHORE_APPROVALS, DATA_PENDING_REWARD_APPROVALS):
+                items = approvals_as_list(items)
+            items = collection_to_storage(shard, items)
+        self._shard_seqs[shard] = self._journal_seq
+        return {STORAGE_JOURNAL_SEQ: self._journal_seq, STORAGE_SHARD_ITEMS: items}
+
+    @callback
+    def async_append_journal(self, operation: str, changes: dict):
+        """Append a record describing one operation to the journal.
+
+        Args:
+            operation (str): Name of the coordinator operation (e.g. approve_chore).
+            changes (dict): Record body with optional 'set', 'delete' and 'replace'
+                sections, each keyed by data collection.
 
-        Logs errors if the operation fails.
         """
+        self._journal_seq += 1
+        changes = {
+            section: {
+                collection: collection_to_storage(collection, value)
+                for collection, value in collections.items()
+            }
+            for section, collections in changes.items()
+        }
+        record = {
+            "seq": self._journal_seq,
+            "ts": dt_util.utcnow().isoformat(),
+            "op": operation,
+            **changes,
+        }
+        for section in changes.values():
+            self._journal_shards.update(_shard_for(key) for key in section)
+
+        # Serialize now so later in-memory mutations do not leak into the record.
+        self._journal_buffer.append(
+            json.dumps(record, cls=JSONEncoder, separators=(",", ":")) + "\n"
+        )
+        if self._journal_started is None:
+            self._journal_started = dt_util.utcnow()
+
+        if self._journal_task is None or self._journal_task.done():
+            self._journal_task = self.hass.async_create_task(
+                self._async_drain_journal()
+            )
+
+    async def _async_drain_journal(self):
+        """Write buffered journal records and compact when thresholds are hit."""
+        while self._journal_buffer:
+            lines, self._journal_buffer = self._journal_buffer, []
+            payload = "".join(lines)
+            try:
+                written = await self.hass.async_add_executor_job(
+                    _append_journal, self._journal_path, payload
+                )
+            except OSError as e:
+                LOGGER.error("Failed to append to journal, saving snapshot: %s", e)
+                self._dirty_shards.update(self._journal_shards)
+                await self.async_save()
+                continue
+
+            self._journal_bytes += written
+            self._journal_records += len(lines)
+
+            if self._journal_needs_compaction():
+                await self.async_compact()
+
+    def _journal_needs_compaction(self) -> bool:
+        """Return True if the journal passed its size or age threshold."""
+        if self._journal_bytes >= STORAGE_JOURNAL_MAX_BYTES:
+            return True
+        return self._journal_started is not None and (
+            dt_util.utcnow() - self._journal_started
+            >= timedelta(seconds=STORAGE_JOURNAL_MAX_AGE)
+        )
+
+    async def async_compact(self):
+        """Rewrite the shards changed by the journal and truncate it.
+
+        Records still waiting in the buffer have sequence numbers covered by the
+        rewritten shards, so they are skipped on replay if written afterwards.
+        """
+        LOGGER.debug(
+            "Compacting KidsChores journal (%d records, %d bytes, shards: %s)",
+            self._journal_records,
+            self._journal_bytes,
+            sorted(self._journal_shards),
+        )
+        self._dirty_shards.update(self._journal_shards)
+        self._journal_shards = set()
+        await self.async_save()
         try:
-            await self._store.async_save(self._data)
+            await self.hass.async_add_executor_job(
+                _remove_journal, self._journal_path
+            )
+        except OSError as e:
+            LOGGER.error("Failed to truncate journal: %s", e)
+            return
+        self._journal_bytes = 0
+        self._journal_records = 0
+        self._journal_started = None
+        self._compactions += 1
+
+    async def async_flush(self):
+        """Write any pending changes immediately.
+
+        Used on unload so a reload reads the latest data from disk.
+        """
+        if self._journal_task is not None and not self._journal_task.done():
+            await self._journal_task
+        if not self._dirty_shards:
+            return
+        LOGGER.debug("Flushing pending KidsChores storage changes")
+        await self.async_save()
+
+    async def async_save(self):
+        """Write all dirty shards to storage asynchronously.
+
+        Cancels any pending delayed save of those shards. Logs errors if the
+        operation fails.
+        """
+        shards, self._dirty_shards = self._dirty_shards, set()
+        failed = 0
+        for shard in shards:
+            try:
+                await self._stores[shard].async_save(self._shard_payload(shard))
+            except Exception as e:
+                failed += 1
+                LOGGER.error("Failed to save shard '%s' to storage: %s", shard, e)
+            else:
+                self._writes += 1
+        if not failed:
             LOGGER.info("Data saved successfully to storage")
-        except Exception as e:
-            LOGGER.error("Failed to save data to storage: %s", e)
 
     async def async_clear_data(self):
         """Clear all stored data and reset to default structure.
@@ -190,7 +540,16 @@ class KidsChoresStorageManager:
             DATA_PARENTS: {},
             DATA_PENALTIES: {},
         }
+        self._dirty_shards = set(STORAGE_SHARDS)
         await self.async_save()
+        if self._journal_enabled:
+            await self.async_compact()
+
+    async def async_delete(self):
+        """Remove the shard and journal files from disk."""
+        for store in self._stores.values():
+            await store.async_remove()
+        await self.hass.async_add_executor_job(_remove_journal, self._journal_path)
 
     async def async_update_data(self, key, value):
         """Update a specific section of the data structure.
@@ -203,6 +562,91 @@ class KidsChoresStorageManager:
         if key in self._data:
             LOGGER.debug("Updating data for key: %s", key)
             self._data[key] = value
+            self._dirty_shards.add(_shard_for(key))
             await self.async_save()
         else:
             LOGGER.warning("Attempted to update unknown data key: %s", key)
+
+
+def _shard_for(collection: str) -> str:
+    """Return the shard holding a top-level data key."""
+    return collection if collection in STORAGE_SHARDS else STORAGE_SHARD_MISC
+
+
+def _read_journal(path: str) -> tuple[list[dict], int]:
+    """Read journal records from disk.
+
+    A torn last line from an interrupted write is skipped.
+
+    Returns:
+        tuple: The parsed records and the journal size in bytes.
+
+    """
+    if not os.path.exists(path):
+        return [], 0
+
+    records = []
+    with open(path, encoding="utf-8") as journal:
+        for line in journal:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                LOGGER.warning("Skipping unreadable journal record in %s", path)
+    return records, os.path.getsize(path)
+
+
+def _append_journal(path: str, payload: str) -> int:
+    """Append serialized records to the journal and return the bytes written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = payload.encode("utf-8")
+    with open(path, "ab") as journal:
+        journal.write(data)
+        journal.flush()
+        os.fsync(journal.fileno())
+    return len(data)
+
+
+def _remove_journal(path: str):
+    """Delete the journal file if present."""
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _apply_journal_record(data: dict, record: dict, shard_seqs: dict) -> set[str]:
+    """Apply one journal record to the in-memory data.
+
+    - 'set': {collection: {item_id: item}} upserts items.
+    - 'delete': {collection: [item_id, ...]} removes items.
+    - 'replace': {collection: value} replaces a whole collection.
+
+    Collections whose shard already contains the record are skipped.
+
+    Returns:
+        set: The shards the record was applied to.
+
+    """
+    seq = record.get("seq", 0)
+    applied = set()
+
+    def _is_new(collection: str) -> bool:
+        shard = _shard_for(collection)
+        if seq <= shard_seqs.get(shard, 0):
+            return False
+        applied.add(shard)
+        return True
+
+    for collection, items in record.get("set", {}).items():
+        if _is_new(collection):
+            data.setdefault(collection, {}).update(items)
+    for collection, item_ids in record.get("delete", {}).items():
+        if _is_new(collection):
+            section = data.get(collection, {})
+            for item_id in item_ids:
+                section.pop(item_id, None)
+    for collection, value in record.get("replace", {}).items():
+        if _is_new(collection):
+            data[collection] = value
+    return applied
@@ -0,0 +1,72 @@
+# File: timers.py
+"""Timer registry for the KidsChores integration.
+
+Every scheduled callback the integration registers with Home Assistant is
+owned by the registry under a fixed name. Registering a name again replaces
+the previous timer instead of adding a second one, and all timers are
+cancelled together when the config entry unloads, so reloads never leave
+listeners behind.
+"""
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.util import dt as dt_util
+from typing import Any
+
+from .const import LOGGER
+
+
+class TimerRegistry:
+    """Named unsubscribe callbacks of the integration's scheduled timers."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._details: dict[str, dict[str, Any]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if a timer is registered under the name."""
+        return name in self._unsubs
+
+    def __len__(self) -> int:
+        """Return the number of registered timers."""
+        return len(self._unsubs)
+
+    @callback
+    def async_track(self, name: str, unsub: CALLBACK_TYPE, **details: Any):
+        """Take ownership of a timer, replacing any timer with the same name.
+
+        Args:
+            name (str): Timer name.
+            unsub (CALLBACK_TYPE): Callback cancelling the timer.
+            **details: Description of the schedule, shown in diagnostics.
+
+        """
+        self.async_cancel(name)
+        self._unsubs[name] = unsub
+        self._details[name] = {**details, "registered": dt_util.utcnow()}
+
+    @callback
+    def async_cancel(self, name: str):
+        """Cancel the timer registered under the name, if any."""
+        unsub = self._unsubs.pop(name, None)
+        self._details.pop(name, None)
+        if unsub is not None:
+            unsub()
+
+    @callback
+    def async_forget(self, name: str):
+        """Drop a timer that fired and will not fire again."""
+        self._unsubs.pop(name, None)
+        self._details.pop(name, None)
+
+    @callback
+    def async_cancel_all(self):
+        """Cancel every timer, e.g. when the config entry unloads."""
+        if self._unsubs:
+            LOGGER.debug("Cancelling timers: %s", ", ".join(self._unsubs))
+        for name in list(self._unsubs):
+            self.async_cancel(name)
+
+    def as_diagnostics(self) -> dict[str, dict[str, Any]]:
+        """Return the registered timers and their schedules."""
+        return {name: dict(details) for name, details in self._details.items()}